@@ -0,0 +1,102 @@
+"""
+Concurrent /analyze load test
+
+Replaces the upstream OpenAI call with a fixed-latency async fake and fires
+N concurrent /analyze requests. With a non-blocking client the wall time
+stays close to a single call's latency instead of N times it. With
+--identical every request is the same, so single-flight coalescing should
+collapse them into one upstream analysis.
+
+Usage:
+    python -m benchmarks.concurrent_analyze --requests 16 --latency 0.5
+    python -m benchmarks.concurrent_analyze --requests 50 --identical
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from types import SimpleNamespace
+
+# Force real mode before the app (and the OpenAI client) is imported
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-" + "x" * 32)
+# Digests persisted by earlier runs would otherwise skip the upstream calls
+os.environ.setdefault("CATALOG_PATH", "")
+
+import httpx  # noqa: E402
+
+import main  # noqa: E402
+from services import gpt_service  # noqa: E402
+from services.coalesce_service import get_coalescing_stats  # noqa: E402
+
+
+FAKE_RESPONSE = {
+    "contestInfo": {"title": "벤치마크 공모전", "category": "AI/ML", "deadline": "2026-12-31"},
+    "strategicVerdict": {"summary": "벤치마크", "fitType": "opportunity", "confidence": 0.8},
+    "scores": {},
+    "recommendation": "벤치마크 응답",
+    "scenario": {"totalHours": 40, "weeksNeeded": 4, "feasible": True, "conclusion": "가능"},
+}
+
+
+class FakeCompletions:
+    """Async stand-in for client.chat.completions with fixed latency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        message = SimpleNamespace(content=json.dumps(FAKE_RESPONSE, ensure_ascii=False))
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+async def run(num_requests: int, latency: float, identical: bool = False) -> dict:
+    completions = FakeCompletions(latency)
+    gpt_service._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int) -> float:
+            started = time.perf_counter()
+            response = await client.post("/analyze", data={
+                "user_profile": json.dumps({"major": "컴퓨터공학", "hoursPerWeek": 10}),
+                "contest_text": "AI 공모전" if identical else f"AI 공모전 #{i}",
+            })
+            assert response.json()["success"], response.text
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*(one(i) for i in range(num_requests)))
+        wall = time.perf_counter() - started
+
+    waves = -(-num_requests // gpt_service.OPENAI_MAX_CONCURRENCY)
+    return {
+        "requests": num_requests,
+        "upstreamLatency": latency,
+        "maxConcurrency": gpt_service.OPENAI_MAX_CONCURRENCY,
+        "wallTime": round(wall, 3),
+        "serialTime": round(num_requests * latency, 3),
+        "expectedOverlappedTime": round(waves * latency, 3),
+        "maxRequestLatency": round(max(latencies), 3),
+        "identical": identical,
+        "upstreamCalls": completions.calls,
+        "coalescing": get_coalescing_stats(),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.5, help="fake upstream latency in seconds")
+    parser.add_argument("--identical", action="store_true", help="send the same request every time")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.requests, args.latency, args.identical)), indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
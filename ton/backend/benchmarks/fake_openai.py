@@ -0,0 +1,408 @@
+"""
+Fake OpenAI-compatible server for offline load testing
+
+Serves POST /v1/chat/completions like the real API: JSON or SSE streaming
+responses with usage (including simulated prompt-cache hits), x-ratelimit-*
+headers and 429s, after a sampled latency. Response bodies are replayed from
+recordings per request kind (digest, narrative, score, analyze, batch,
+extract), so the backend's real path (call_gpt_api, rate limiter, retries,
+hedging, parse_gpt_response, result building) runs end-to-end.
+
+Recordings are a JSON file of {"kind": [response, ...]}; built-in samples
+are used for kinds it does not cover. --record-from proxies to a real
+OpenAI-compatible API and appends its responses to the recordings file.
+
+Usage:
+    python -m benchmarks.fake_openai --port 8100 --latency lognormal:0.8,0.4
+    python -m benchmarks.fake_openai --latency fixed:0.5 --tail 0.02:8 --rpm 300 --error-rate 0.01
+    python -m benchmarks.fake_openai --recordings recordings.json --record-from https://api.openai.com/v1
+
+    # then, in another shell
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 OPENAI_API_KEY=sk-fake-xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx uvicorn main:app
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from services.cache_service import make_cache_key
+from services.rate_limit_service import estimate_prompt_tokens, estimate_text_tokens
+
+IMAGE_TOKENS = 765
+CACHE_MIN_TOKENS = 1024
+CACHE_BLOCK_TOKENS = 128
+STREAM_CHUNK_CHARS = 24
+
+_VERDICT = {"summary": "역량과 일정 모두 무리 없는 도전", "fitType": "opportunity", "confidence": 0.82}
+_SCENARIO = {"totalHours": 60, "weeksNeeded": 5, "feasible": True, "conclusion": "주 12시간이면 참가 가능"}
+_NARRATIVE = {
+    "strategicVerdict": _VERDICT,
+    "recommendation": "머신러닝 경험을 살릴 수 있는 공모전입니다. 데이터 전처리와 모델 검증 일정을 먼저 확보하세요.",
+    "opportunities": ["AI 포트폴리오 확보", "현업 심사위원 피드백", "팀 협업 경험"],
+    "warnings": ["마감 전 2주가 시험 기간과 겹침", "결과 발표 자료 준비 시간 필요"],
+    "dealBreakers": [],
+    "checklist": [
+        {"text": "참가 자격 확인", "priority": "high"},
+        {"text": "팀원 역할 분담", "priority": "medium"},
+        {"text": "데이터셋 다운로드 및 탐색", "priority": "high"},
+    ],
+    "scenario": _SCENARIO,
+}
+_CONTEST_INFO = {
+    "title": "2026 AI 혁신 아이디어 공모전",
+    "organizer": "한국인공지능협회",
+    "category": "AI/ML",
+    "deadline": "2026-12-31",
+    "teamSize": "1-4명",
+    "requirements": ["대학생 또는 대학원생", "AI 기반 서비스 기획서 제출"],
+    "prizes": ["대상 500만원", "최우수상 300만원"],
+    "description": "AI 기술로 사회 문제를 해결하는 서비스 아이디어를 모집합니다.",
+}
+_HIDDEN = [
+    {"insight": "동작하는 프로토타입이 있으면 가산점", "source": "inferred", "importance": "high"},
+    {"insight": "사회적 가치 설명이 평가에 중요", "source": "explicit", "importance": "medium"},
+]
+_SCORES = {
+    name: {"score": score, "label": "좋음", "reason": "프로필과 요구 역량 비교 결과"}
+    for name, score in (
+        ("skillMatch", 78), ("difficulty", 62), ("schedulePressure", 55),
+        ("teamFit", 70), ("portfolioValue", 85), ("readiness", 68),
+    )
+}
+_ANALYZE = {"contestInfo": _CONTEST_INFO, "scores": _SCORES, "hiddenExpectations": _HIDDEN, **_NARRATIVE}
+
+DEFAULT_RECORDINGS: Dict[str, list] = {
+    "digest": [{
+        "contestInfo": _CONTEST_INFO,
+        "hiddenExpectations": _HIDDEN,
+        "requiredSkills": ["Python", "머신러닝", "기획"],
+        "difficulty": 3,
+        "estimatedHours": 60,
+    }],
+    "narrative": [_NARRATIVE],
+    "score": [{**_NARRATIVE, "scores": _SCORES}],
+    "analyze": [_ANALYZE],
+    "batch": [_ANALYZE],  # one item; repeated per packed contest
+    "extract": [{
+        "title": _CONTEST_INFO["title"],
+        "organizer": _CONTEST_INFO["organizer"],
+        "deadline": _CONTEST_INFO["deadline"],
+        "category": "AI/ML",
+        "requirements": "대학생 또는 대학원생",
+        "description": _CONTEST_INFO["description"],
+        "rawText": "2026 AI 혁신 아이디어 공모전 접수 마감 12월 31일",
+        "confidence": {"title": "high", "deadline": "high", "requirements": "medium"},
+    }],
+}
+
+
+class LatencyModel:
+    """
+    Latency spec: fixed:S, uniform:LO,HI or lognormal:MEDIAN,SIGMA (seconds),
+    plus an optional tail "P:S" sending a share P of calls to S seconds.
+    """
+
+    def __init__(self, spec: str, tail: Optional[str] = None, per_token_ms: float = 0.0, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+        kind, _, params = spec.partition(":")
+        self.kind = kind
+        self.params = [float(p) for p in params.split(",")] if params else []
+        if kind not in ("fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        self.tail_rate, self.tail_latency = (float(v) for v in tail.split(":")) if tail else (0.0, 0.0)
+        self.per_token = per_token_ms / 1000
+
+    def sample(self, completion_tokens: int = 0) -> float:
+        if self.tail_rate and self.rng.random() < self.tail_rate:
+            return self.tail_latency
+        if self.kind == "fixed":
+            base = self.params[0]
+        elif self.kind == "uniform":
+            base = self.rng.uniform(self.params[0], self.params[1])
+        else:
+            base = self.rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        return base + completion_tokens * self.per_token
+
+
+class FixedWindowLimit:
+    """Per-minute request/token budget reported like OpenAI's x-ratelimit-* headers"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.window_start = time.monotonic()
+        self.requests = 0
+        self.tokens = 0
+
+    def reset_in(self) -> float:
+        """Seconds until the current window resets (starting a new one if due)"""
+        now = time.monotonic()
+        if now - self.window_start >= 60:
+            self.window_start, self.requests, self.tokens = now, 0, 0
+        return 60 - (now - self.window_start)
+
+    def admit(self, tokens: int) -> bool:
+        self.reset_in()
+        if (self.rpm and self.requests >= self.rpm) or (self.tpm and self.tokens + tokens > self.tpm):
+            return False
+        self.requests += 1
+        self.tokens += tokens
+        return True
+
+    def headers(self) -> Dict[str, str]:
+        reset = f"{self.reset_in():.3f}s"
+        headers = {}
+        if self.rpm:
+            headers.update({
+                "x-ratelimit-limit-requests": str(self.rpm),
+                "x-ratelimit-remaining-requests": str(max(0, self.rpm - self.requests)),
+                "x-ratelimit-reset-requests": reset,
+            })
+        if self.tpm:
+            headers.update({
+                "x-ratelimit-limit-tokens": str(self.tpm),
+                "x-ratelimit-remaining-tokens": str(max(0, self.tpm - self.tokens)),
+                "x-ratelimit-reset-tokens": reset,
+            })
+        return headers
+
+
+class PrefixCache:
+    """Simulates provider prompt caching: a repeated prefix of 1024+ tokens is cached in 128-token blocks"""
+
+    def __init__(self, max_entries: int = 10000):
+        self._seen: OrderedDict = OrderedDict()
+        self.max_entries = max_entries
+
+    def cached_tokens(self, body: dict) -> int:
+        messages = body.get("messages", [])
+        prefix_tokens = estimate_prompt_tokens(messages[:-1], IMAGE_TOKENS)
+        if prefix_tokens < CACHE_MIN_TOKENS:
+            return 0
+        key = make_cache_key(messages[:-1], body.get("response_format"))
+        hit = key in self._seen
+        self._seen[key] = True
+        self._seen.move_to_end(key)
+        if len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return prefix_tokens // CACHE_BLOCK_TOKENS * CACHE_BLOCK_TOKENS if hit else 0
+
+
+def request_kind(body: dict) -> str:
+    """Request kind from the structured-output schema name or the prompt_cache_key prefix"""
+    schema = (body.get("response_format") or {}).get("json_schema") or {}
+    name = schema.get("name", "")
+    if name.endswith("_output"):
+        return name[: -len("_output")]
+    cache_key = body.get("prompt_cache_key") or ""
+    if "-" in cache_key:
+        return cache_key.split("-", 1)[0]
+    return "analyze"
+
+
+def _last_user_text(messages: List[dict]) -> str:
+    content = messages[-1].get("content") if messages else ""
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content or [])
+
+
+class FakeOpenAI:
+    def __init__(
+        self,
+        latency: LatencyModel,
+        recordings_path: Optional[str] = None,
+        record_from: Optional[str] = None,
+        rpm: int = 0,
+        tpm: int = 0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.recordings_path = recordings_path
+        self.recorded: Dict[str, list] = {}
+        if recordings_path and os.path.exists(recordings_path):
+            with open(recordings_path, encoding="utf-8") as f:
+                self.recorded = json.load(f)
+        self.recordings = {**DEFAULT_RECORDINGS, **self.recorded}
+        self.record_from = record_from.rstrip("/") if record_from else None
+        self.limit = FixedWindowLimit(rpm, tpm)
+        self.error_rate = error_rate
+        self.prefix_cache = PrefixCache()
+        self.stats = {"requests": 0, "streamed": 0, "rateLimited": 0, "byKind": {}}
+
+    def _content(self, kind: str, body: dict) -> str:
+        item = self.rng.choice(self.recordings.get(kind) or self.recordings["analyze"])
+        if kind == "batch" and isinstance(item, dict) and "results" not in item:
+            count = max(1, _last_user_text(body.get("messages", [])).count("### 공모전 "))
+            item = {"results": [item] * count}
+        return item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
+
+    async def _record(self, kind: str, body: dict, authorization: str) -> str:
+        upstream = {**body, "stream": False}
+        upstream.pop("stream_options", None)
+        async with httpx.AsyncClient(timeout=120) as client:
+            response = await client.post(
+                f"{self.record_from}/chat/completions",
+                json=upstream,
+                headers={"Authorization": authorization},
+            )
+        response.raise_for_status()
+        content = response.json()["choices"][0]["message"]["content"]
+        self.recorded.setdefault(kind, []).append(content)
+        self.recordings[kind] = self.recorded[kind]
+        if self.recordings_path:
+            with open(self.recordings_path, "w", encoding="utf-8") as f:
+                json.dump(self.recorded, f, ensure_ascii=False, indent=1)
+        return content
+
+    def _rate_limited(self, headers: Dict[str, str], retry_after: float) -> JSONResponse:
+        self.stats["rateLimited"] += 1
+        return JSONResponse(
+            status_code=429,
+            headers={**headers, "retry-after-ms": str(int(retry_after * 1000))},
+            content={"error": {
+                "message": "Rate limit reached (fake server)",
+                "type": "requests",
+                "param": None,
+                "code": "rate_limit_exceeded",
+            }},
+        )
+
+    async def chat_completions(self, request: Request):
+        body = await request.json()
+        kind = request_kind(body)
+        self.stats["requests"] += 1
+        self.stats["byKind"][kind] = self.stats["byKind"].get(kind, 0) + 1
+
+        prompt_tokens = estimate_prompt_tokens(body.get("messages", []), IMAGE_TOKENS)
+        max_tokens = body.get("max_completion_tokens") or body.get("max_tokens") or 0
+        admitted = self.limit.admit(prompt_tokens + max_tokens)
+        headers = self.limit.headers()
+        if not admitted:
+            return self._rate_limited(headers, self.limit.reset_in())
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return self._rate_limited(headers, 0.5)
+
+        if self.record_from:
+            content = await self._record(kind, body, request.headers.get("authorization", ""))
+        else:
+            content = self._content(kind, body)
+        completion_tokens = estimate_text_tokens(content)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "prompt_tokens_details": {"cached_tokens": self.prefix_cache.cached_tokens(body)},
+        }
+        completion_id = f"chatcmpl-fake-{uuid.uuid4().hex[:24]}"
+        model = body.get("model", "gpt-4o")
+        delay = 0.0 if self.record_from else self.latency.sample(completion_tokens)
+
+        if body.get("stream"):
+            self.stats["streamed"] += 1
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                self._stream(completion_id, model, content, usage if include_usage else None, delay),
+                media_type="text/event-stream",
+                headers=headers,
+            )
+
+        await asyncio.sleep(delay)
+        return JSONResponse(headers=headers, content={
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content, "refusal": None},
+                "logprobs": None,
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        })
+
+    async def _stream(self, completion_id: str, model: str, content: str, usage: Optional[dict], delay: float):
+        """Time to first token is 30% of the sampled latency; the rest is spread over the chunks"""
+        created = int(time.time())
+
+        def chunk(delta: dict, finish_reason=None, chunk_usage=None) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [] if chunk_usage else [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+            }
+            if chunk_usage:
+                payload["usage"] = chunk_usage
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        pieces = [content[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(content), STREAM_CHUNK_CHARS)]
+        await asyncio.sleep(delay * 0.3)
+        yield chunk({"role": "assistant", "content": ""})
+        gap = delay * 0.7 / max(1, len(pieces))
+        for piece in pieces:
+            await asyncio.sleep(gap)
+            yield chunk({"content": piece})
+        yield chunk({}, finish_reason="stop")
+        if usage:
+            yield chunk({}, chunk_usage=usage)
+        yield "data: [DONE]\n\n"
+
+
+def create_app(fake: FakeOpenAI) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    app.post("/v1/chat/completions")(fake.chat_completions)
+
+    @app.get("/stats")
+    async def stats():
+        return fake.stats
+
+    return app
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency", default="lognormal:0.8,0.4", help="fixed:S | uniform:LO,HI | lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--tail", default=None, help="P:S, e.g. 0.02:8 sends 2%% of calls to 8 seconds")
+    parser.add_argument("--per-token-ms", type=float, default=0.0, help="extra latency per completion token")
+    parser.add_argument("--rpm", type=int, default=0, help="requests per minute before 429 (0: unlimited)")
+    parser.add_argument("--tpm", type=int, default=0, help="tokens per minute before 429 (0: unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of calls answered with a random 429")
+    parser.add_argument("--recordings", default=None, help="JSON file of recorded responses per kind")
+    parser.add_argument("--record-from", default=None, help="proxy to this OpenAI-compatible base URL and record")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    fake = FakeOpenAI(
+        LatencyModel(args.latency, args.tail, args.per_token_ms, args.seed),
+        recordings_path=args.recordings,
+        record_from=args.record_from,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(fake), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main_cli()
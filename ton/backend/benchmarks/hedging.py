@@ -0,0 +1,98 @@
+"""
+Hedged-request tail latency benchmark
+
+Drives call_gpt_api against an in-process fake upstream whose latency is
+mostly fast with a heavy tail (a small share of calls stall). Runs the same
+seeded workload with hedging off and on and reports p50/p95/p99 and the
+extra upstream calls hedging cost.
+
+Usage:
+    python -m benchmarks.hedging --calls 400 --slow-rate 0.05 --slow-latency 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from types import SimpleNamespace
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-" + "x" * 32)
+os.environ.setdefault("CATALOG_PATH", "")
+
+from services import gpt_service  # noqa: E402
+from services.hedge_service import HedgePolicy  # noqa: E402
+
+
+class TailLatencyCompletions:
+    """Fake client.chat.completions with fast typical calls and occasional stalls"""
+
+    def __init__(self, rng: random.Random, slow_rate: float, slow_latency: float):
+        self.rng = rng
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.rng.random() < self.slow_rate:
+            latency = self.slow_latency
+        else:
+            latency = self.rng.uniform(0.05, 0.12)
+        await asyncio.sleep(latency)
+        message = SimpleNamespace(content='{"ok": true}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+async def run(calls: int, concurrency: int, slow_rate: float, slow_latency: float, hedge: bool) -> dict:
+    completions = TailLatencyCompletions(random.Random(42), slow_rate, slow_latency)
+    gpt_service._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    gpt_service._hedge_policy = HedgePolicy(
+        enabled=hedge, percentile=95, min_delay=0.05, initial_delay=0.3, min_samples=20
+    )
+    messages = [{"role": "user", "content": "benchmark"}]
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await gpt_service.call_gpt_api(messages)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return {
+        "hedging": hedge,
+        "p50": round(percentile(latencies, 50), 3),
+        "p95": round(percentile(latencies, 95), 3),
+        "p99": round(percentile(latencies, 99), 3),
+        "max": round(max(latencies), 3),
+        "upstreamCalls": completions.calls,
+        "extraCallRate": round(completions.calls / calls - 1, 3),
+        "policy": gpt_service._hedge_policy.stats(),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=4, help="client-side concurrent calls")
+    parser.add_argument("--slow-rate", type=float, default=0.05, help="share of stalled upstream calls")
+    parser.add_argument("--slow-latency", type=float, default=2.0, help="latency of a stalled call in seconds")
+    args = parser.parse_args()
+
+    results = [
+        asyncio.run(run(args.calls, args.concurrency, args.slow_rate, args.slow_latency, hedge))
+        for hedge in (False, True)
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
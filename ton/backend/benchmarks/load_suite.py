@@ -0,0 +1,368 @@
+"""
+Endpoint load-test suite
+
+Starts the fake OpenAI-compatible server (benchmarks.fake_openai) as a
+subprocess, points the app at it through OPENAI_BASE_URL and drives the app
+in-process over ASGI, so the real-mode path runs end-to-end without network
+access or API cost. Each scenario runs at every concurrency level and
+reports throughput, p50/p95/p99 latency, errors, upstream calls and peak
+RSS of this process (app plus load generator; the fake server is separate).
+
+Result caches are given a zero TTL so every request does the full work;
+concurrent requests with the same poster can still be coalesced, which is
+why each image size uses a small pool of distinct images.
+
+Results are written as JSON; pass an earlier file to --compare to print
+throughput and p95 ratios against it.
+
+Usage:
+    python -m benchmarks.load_suite
+    python -m benchmarks.load_suite --concurrency 1,8,32 --requests 64 --image-sizes 100k,2m,max
+    python -m benchmarks.load_suite --scenarios analyze_text,extract_2.0m --compare benchmarks/results/load-abc1234.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+FAKE_PORT = _free_port()
+
+# Real mode against the fake server; set before the app is imported
+os.environ["OPENAI_API_KEY"] = "sk-loadtest-" + "x" * 32
+os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{FAKE_PORT}/v1"
+os.environ.setdefault("CATALOG_PATH", "")
+for ttl in ("ANALYSIS_CACHE_TTL", "DIGEST_CACHE_TTL", "EXTRACTION_CACHE_TTL"):
+    os.environ.setdefault(ttl, "0")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+import main  # noqa: E402
+from config import MAX_IMAGE_SIZE  # noqa: E402
+
+PROFILE = {
+    "major": "컴퓨터공학",
+    "skills": [{"name": "Python", "level": 4}, {"name": "React", "level": 3}],
+    "goal": "포트폴리오",
+    "hoursPerWeek": 12,
+    "preferredTeamSize": "팀",
+}
+CONTEST_TEXT = (
+    "2026 AI 혁신 아이디어 공모전 #{i}\n주최: 한국인공지능협회\n"
+    "참가 자격: 대학생 또는 대학원생 (1-4명 팀)\n접수 마감: 2026-12-31\n"
+    "제출물: AI 기반 서비스 기획서와 프로토타입 시연 영상\n시상: 대상 500만원, 최우수상 300만원"
+)
+IMAGE_VARIANTS = 4
+
+
+# ============================================
+# INPUTS
+# ============================================
+
+def parse_size(value: str) -> int:
+    """100k, 2m, 500000 or max (just under MAX_IMAGE_SIZE)"""
+    value = value.strip().lower()
+    if value == "max":
+        return int(MAX_IMAGE_SIZE * 0.98)
+    units = {"k": 1024, "m": 1024 * 1024}
+    if value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def make_poster(target_bytes: int, seed: int) -> bytes:
+    """
+    PNG of smooth noise close to target_bytes (and never above the upload
+    limit). Noise does not compress, so the pixel count sets the size.
+    """
+    rng = np.random.default_rng(seed)
+    side = max(16, int((target_bytes / 3) ** 0.5))
+    while True:
+        pixels = rng.integers(0, 256, size=(side, side, 3), dtype=np.uint8)
+        # A coarse gradient keeps each variant's perceptual hash distinct
+        pixels[:, :, seed % 3] = np.linspace(0, 255, side, dtype=np.uint8)[None, :] if seed % 2 else \
+            np.linspace(255, 0, side, dtype=np.uint8)[:, None]
+        buffer = io.BytesIO()
+        Image.fromarray(pixels).save(buffer, format="PNG", compress_level=1)
+        data = buffer.getvalue()
+        if len(data) <= min(target_bytes * 1.05, MAX_IMAGE_SIZE):
+            return data
+        side = int(side * 0.97)
+
+
+# ============================================
+# SCENARIOS
+# ============================================
+
+def _analyze_form(i: int, text: bool) -> dict:
+    return {
+        "user_profile": json.dumps(PROFILE, ensure_ascii=False),
+        "contest_text": CONTEST_TEXT.format(i=i) if text else "",
+    }
+
+
+def build_scenarios(image_sizes: List[int]) -> Dict[str, Callable]:
+    """name -> (client, i) coroutine returning the response"""
+    scenarios: Dict[str, Callable] = {
+        "health": lambda client, i: client.get("/health"),
+        "readiness": lambda client, i: client.post("/readiness", json={
+            "userProfile": PROFILE,
+            "contest": {"title": f"공모전 {i}", "category": "AI/ML", "deadline": "2026-12-31"},
+            "currentProgress": {"completedTasks": i % 5},
+        }),
+        "assistant": lambda client, i: client.post("/assistant/suggest", json={
+            "currentPage": "analysis", "recentAction": "analyzed", "type": "proactive",
+        }),
+        "analyze_text": lambda client, i: client.post("/analyze", data=_analyze_form(i, text=True)),
+    }
+
+    for size in image_sizes:
+        posters = [make_poster(size, seed) for seed in range(IMAGE_VARIANTS)]
+        label = f"{size / 1024 / 1024:.1f}m" if size >= 1024 * 1024 else f"{size // 1024}k"
+
+        def files(i, posters=posters):
+            return {"contest_image": ("poster.png", posters[i % len(posters)], "image/png")}
+
+        scenarios[f"analyze_image_{label}"] = lambda client, i, files=files: client.post(
+            "/analyze", data=_analyze_form(i, text=False), files=files(i)
+        )
+        scenarios[f"analyze_both_{label}"] = lambda client, i, files=files: client.post(
+            "/analyze", data=_analyze_form(i, text=True), files=files(i)
+        )
+        scenarios[f"extract_{label}"] = lambda client, i, posters=posters: client.post(
+            "/extract", files={"image": ("poster.png", posters[i % len(posters)], "image/png")}
+        )
+    return scenarios
+
+
+# ============================================
+# MEASUREMENT
+# ============================================
+
+def current_rss() -> Optional[int]:
+    """Resident set size in bytes (Linux), else None"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def max_rss() -> int:
+    """Process-lifetime peak RSS in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def is_success(response: httpx.Response) -> bool:
+    if response.status_code != 200:
+        return False
+    body = response.json()
+    return body.get("success", True) is not False
+
+
+async def fake_calls(fake: httpx.AsyncClient) -> int:
+    return (await fake.get("/stats")).json()["requests"]
+
+
+async def run_level(client, fake, name: str, request: Callable, concurrency: int, total: int) -> dict:
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+    peak = current_rss() or 0
+    sampling = True
+
+    async def sample_rss():
+        nonlocal peak
+        while sampling:
+            peak = max(peak, current_rss() or 0)
+            await asyncio.sleep(0.05)
+
+    async def worker():
+        nonlocal next_index, errors
+        while next_index < total:
+            i = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                ok = is_success(await request(client, i))
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            errors += not ok
+
+    calls_before = await fake_calls(fake)
+    sampler = asyncio.create_task(sample_rss())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    sampling = False
+    await sampler
+
+    return {
+        "scenario": name,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "wallSeconds": round(wall, 3),
+        "throughputRps": round(total / wall, 2),
+        "latencyMs": {
+            "p50": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99": round(percentile(latencies, 0.99) * 1000, 2),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 2),
+            "max": round(max(latencies) * 1000, 2),
+        },
+        "upstreamCalls": await fake_calls(fake) - calls_before,
+        "peakRssMb": round((peak or max_rss()) / 1024 / 1024, 1),
+    }
+
+
+# ============================================
+# FAKE SERVER
+# ============================================
+
+def start_fake_server(latency: str, tail: Optional[str], seed: int) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "benchmarks.fake_openai",
+        "--port", str(FAKE_PORT), "--latency", latency, "--seed", str(seed),
+    ]
+    if tail:
+        command += ["--tail", tail]
+    process = subprocess.Popen(command, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{FAKE_PORT}/stats", timeout=0.5)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Fake OpenAI server did not start")
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[dict], baseline_path: str) -> List[dict]:
+    """Throughput and p95 ratios (current / baseline) per scenario and level"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["scenario"], r["concurrency"]): r for r in json.load(f)["results"]}
+    rows = []
+    for result in results:
+        base = baseline.get((result["scenario"], result["concurrency"]))
+        if not base:
+            continue
+        rows.append({
+            "scenario": result["scenario"],
+            "concurrency": result["concurrency"],
+            "throughputRatio": round(result["throughputRps"] / base["throughputRps"], 3),
+            "p95Ratio": round(result["latencyMs"]["p95"] / base["latencyMs"]["p95"], 3),
+            "peakRssDeltaMb": round(result["peakRssMb"] - base["peakRssMb"], 1),
+        })
+    return rows
+
+
+async def run_suite(names: List[str], scenarios: Dict[str, Callable], levels: List[int], total: int) -> List[dict]:
+    results = []
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=300) as client, \
+            httpx.AsyncClient(base_url=f"http://127.0.0.1:{FAKE_PORT}") as fake:
+        for name in names:
+            for concurrency in levels:
+                result = await run_level(client, fake, name, scenarios[name], concurrency, total)
+                print(
+                    f"{name:<24} c={concurrency:<3} {result['throughputRps']:>8.1f} rps  "
+                    f"p50 {result['latencyMs']['p50']:>8.1f}  p95 {result['latencyMs']['p95']:>8.1f}  "
+                    f"p99 {result['latencyMs']['p99']:>8.1f} ms  errors {result['errors']}  "
+                    f"rss {result['peakRssMb']} MB",
+                    file=sys.stderr,
+                )
+                results.append(result)
+    return results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", default="1,8,32", help="comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=64, help="requests per scenario and level")
+    parser.add_argument("--image-sizes", default="100k,2m,max", help="poster sizes (k/m suffix or max)")
+    parser.add_argument("--scenarios", default=None, help="comma-separated subset of scenario names")
+    parser.add_argument("--latency", default="lognormal:0.3,0.3", help="fake upstream latency distribution")
+    parser.add_argument("--tail", default=None, help="fake upstream slow tail P:S")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", default=None, help="result JSON path (default benchmarks/results/load-<commit>.json)")
+    parser.add_argument("--compare", default=None, help="earlier result JSON to compare against")
+    args = parser.parse_args()
+
+    levels = [int(v) for v in args.concurrency.split(",")]
+    image_sizes = [parse_size(v) for v in args.image_sizes.split(",") if v]
+    scenarios = build_scenarios(image_sizes)
+    names = args.scenarios.split(",") if args.scenarios else list(scenarios)
+    unknown = [name for name in names if name not in scenarios]
+    if unknown:
+        parser.error(f"Unknown scenarios {unknown}; available: {', '.join(scenarios)}")
+
+    fake = start_fake_server(args.latency, args.tail, args.seed)
+    try:
+        results = asyncio.run(run_suite(names, scenarios, levels, args.requests))
+    finally:
+        fake.terminate()
+        fake.wait()
+
+    commit = git_commit()
+    report = {
+        "meta": {
+            "commit": commit,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "upstreamLatency": args.latency,
+            "upstreamTail": args.tail,
+            "requestsPerLevel": args.requests,
+            "imageSizes": image_sizes,
+            "processPeakRssMb": round(max_rss() / 1024 / 1024, 1),
+        },
+        "results": results,
+    }
+    if args.compare:
+        report["comparison"] = {"baseline": args.compare, "rows": compare(results, args.compare)}
+
+    output = args.output or os.path.join("benchmarks", "results", f"load-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(json.dumps(report.get("comparison", {"output": output}), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,83 @@
+"""
+Portfolio optimization benchmark
+
+Selects from N random candidate contests under one weekly budget with the
+exact DP and the greedy heuristic, timing both and reporting how much value
+the heuristic leaves on the table. Every selection is checked against the
+deadline constraint (in deadline order, each prefix of hours fits in the
+time before that deadline). The exact solver is skipped above its table limit.
+
+Usage:
+    python -m benchmarks.portfolio --contests 30,300,3000,10000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import timedelta
+
+from benchmarks.schedule import START
+from constants import PORTFOLIO_EXACT_MAX_CELLS
+from schemas import PortfolioContestInput
+from services.portfolio_service import PortfolioProblem, solve_exact, solve_heuristic
+from services.ranking_service import CATEGORIES
+
+
+def random_candidates(rng: random.Random, count: int) -> list:
+    return [
+        PortfolioContestInput(
+            id=f"c{i}",
+            title=f"공모전 {i}",
+            deadline=(START + timedelta(days=rng.randint(3, 330))).isoformat() if rng.random() < 0.9 else None,
+            category=rng.choice(CATEGORIES),
+            totalHours=rng.randint(10, 120),
+            schedulePressure=rng.randint(20, 90),
+            portfolioValue=rng.randint(30, 100),
+            readiness=rng.randint(20, 100),
+        )
+        for i in range(count)
+    ]
+
+
+def solve_ms(solver, problem: PortfolioProblem):
+    started = time.perf_counter()
+    chosen = solver(problem)
+    elapsed = (time.perf_counter() - started) * 1000
+    return {
+        "ms": round(elapsed, 2),
+        "selected": int(chosen.sum()),
+        "value": round(float(problem.value[chosen].sum()), 2),
+        "feasible": problem.is_feasible(chosen),
+    }
+
+
+def run(count: int, budget: int) -> dict:
+    rng = random.Random(count)
+    started = time.perf_counter()
+    problem = PortfolioProblem(random_candidates(rng, count), budget, START)
+    result = {
+        "contests": count,
+        "weeklyBudget": budget,
+        "prepareMs": round((time.perf_counter() - started) * 1000, 2),
+        "heuristic": solve_ms(solve_heuristic, problem),
+    }
+
+    if problem.size * (problem.horizon + 1) <= PORTFOLIO_EXACT_MAX_CELLS:
+        exact = solve_ms(solve_exact, problem)
+        result["exact"] = exact
+        result["heuristicValueRatio"] = round(result["heuristic"]["value"] / exact["value"], 4) if exact["value"] else 1.0
+    return result
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contests", default="30,300,3000,10000")
+    parser.add_argument("--budget", type=int, default=40, help="hours per week")
+    args = parser.parse_args()
+
+    print(json.dumps([run(int(n), args.budget) for n in args.contests.split(",")], ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
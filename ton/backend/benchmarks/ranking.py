@@ -0,0 +1,119 @@
+"""
+Bulk ranking benchmark
+
+Scores 10k contests x 1 profile and 1 contest x 10k profiles with the
+vectorized ranking engine, compares against the scalar scoring path and
+checks both produce identical scores.
+
+Usage:
+    python -m benchmarks.ranking --size 10000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from schemas import UserProfileInput, SkillInput, ContestInfo
+from services.ranking_service import (
+    CATEGORIES, SCORE_KEYS, ContestMatrix, ProfileMatrix, score_matrix, top_k
+)
+from services.scoring_service import compute_score_values
+
+SKILLS = ["Python", "React", "Figma", "SQL", "PyTorch", "마케팅", "Java", "pandas", "Swift", "기획"]
+# Substrings of keywords or common words that must not count as matches
+DECOY_SKILLS = ["Go", "C", "Docker", "Tailwind", "R"]
+TEAM_SIZES = ["1-3명", "개인", "최대 4명", "팀", None, "3명", "2~5명"]
+
+
+def random_contest(rng: random.Random, i: int) -> ContestInfo:
+    return ContestInfo(
+        title=f"{rng.choice(['AI', '웹', '데이터', '디자인', '창업', 'Google'])} 공모전 {i}",
+        category=rng.choice(CATEGORIES),
+        deadline=(date.today() + timedelta(days=rng.randint(-5, 120))).isoformat() if rng.random() < 0.9 else None,
+        teamSize=rng.choice(TEAM_SIZES),
+        requirements=[f"{rng.choice(SKILLS)} 활용" for _ in range(rng.randint(0, 6))],
+        prizes=["상금"] * rng.randint(0, 4),
+    )
+
+
+def random_profile(rng: random.Random) -> UserProfileInput:
+    return UserProfileInput(
+        skills=[SkillInput(name=s, level=rng.randint(1, 5)) for s in rng.sample(SKILLS + DECOY_SKILLS, rng.randint(0, 6))],
+        hoursPerWeek=rng.choice([None, 5, 10, 20]),
+        preferredTeamSize=rng.choice([None, "any", "solo", "small", "large"]),
+        goal=rng.choice([None, "취업 포트폴리오", "경험"]),
+    )
+
+
+def timed(fn, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def run(size: int, k: int) -> dict:
+    rng = random.Random(42)
+    contests = [random_contest(rng, i) for i in range(size)]
+    profiles = [random_profile(rng) for _ in range(size)]
+    profile, contest = profiles[0], contests[0]
+
+    catalog, build_time = timed(lambda: ContestMatrix(contests))
+
+    def rank_one_profile():
+        scores = score_matrix(ProfileMatrix([profile]), catalog)
+        return top_k(scores["readiness"][0], k, scores["portfolioValue"][0])
+
+    _, rank_time = timed(rank_one_profile)
+
+    profile_matrix, profile_build_time = timed(lambda: ProfileMatrix(profiles))
+    single = ContestMatrix([contest])
+    many_profiles, many_time = timed(lambda: score_matrix(profile_matrix, single))
+
+    _, scalar_time = timed(lambda: [compute_score_values(profile, c) for c in contests], repeat=1)
+
+    row = score_matrix(ProfileMatrix([profile]), catalog)
+    mismatches = sum(
+        compute_score_values(profile, c)[key] != row[key][0, i]
+        for i, c in enumerate(contests) for key in SCORE_KEYS
+    ) + sum(
+        compute_score_values(p, contest)[key] != many_profiles[key][j, 0]
+        for j, p in enumerate(profiles) for key in SCORE_KEYS
+    )
+
+    return {
+        "size": size,
+        "topK": k,
+        "contestMatrixBuildMs": round(build_time * 1000, 2),
+        "contestsX1Profile": {
+            "rankMs": round(rank_time * 1000, 2),
+            "pairsPerSecond": int(size / rank_time),
+        },
+        "profilesX1Contest": {
+            "profileMatrixBuildMs": round(profile_build_time * 1000, 2),
+            "scoreMs": round(many_time * 1000, 2),
+            "pairsPerSecond": int(size / many_time),
+        },
+        "scalarPath": {
+            "ms": round(scalar_time * 1000, 2),
+            "pairsPerSecond": int(size / scalar_time),
+        },
+        "mismatchesVsScalar": int(mismatches),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=10000)
+    parser.add_argument("--top-k", type=int, default=10)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.size, args.top_k), indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,105 @@
+"""
+Batch readiness benchmark
+
+Computes readiness for N random contest/progress pairs of one profile, once
+with calculate_readiness per item (what N /readiness calls do) and once with
+calculate_readiness_batch, and checks every result is identical, including
+edge-case progress values (floats, missing keys, zero/negative totals,
+non-numeric and huge values).
+
+Usage:
+    python -m benchmarks.readiness_batch --items 1000,10000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from schemas import ReadinessBatchItem, SkillInput, UserProfileInput
+from services.gpt_service import calculate_readiness
+from services.readiness_service import calculate_readiness_batch
+
+EDGE_PROGRESS = [
+    None,
+    {},
+    {"checklistDone": 3},
+    {"checklistTotal": 0},
+    {"checklistDone": 7, "checklistTotal": 0},
+    {"checklistDone": 1, "checklistTotal": 3},
+    {"checklistDone": 2.5, "checklistTotal": 7.25},
+    {"checklistDone": -4, "checklistTotal": 9},
+    {"checklistDone": True, "checklistTotal": 3},
+    {"checklistDone": 10 ** 20, "checklistTotal": 3},
+    {"checklistDone": 1, "checklistTotal": float("inf")},
+    {"checklistDone": float("nan"), "checklistTotal": 3},
+    {"checklistDone": "3", "checklistTotal": 5},
+    {"checklistDone": None, "checklistTotal": 5},
+    {"other": 1},
+]
+
+
+def random_progress(rng: random.Random, count: int) -> list:
+    progresses = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            progresses.append(None)
+            continue
+        total = rng.randint(0, 40)
+        progresses.append({"checklistDone": rng.randint(0, max(total, 1)), "checklistTotal": total})
+    return progresses
+
+
+def scalar_items(profile: UserProfileInput, progresses: list) -> list:
+    async def compute():
+        items = []
+        for i, progress in enumerate(progresses):
+            try:
+                data = await calculate_readiness(profile=profile, contest={}, progress=progress)
+                items.append(ReadinessBatchItem(index=i, success=True, data=data))
+            except Exception as e:
+                items.append(ReadinessBatchItem(index=i, success=False, error=f"Calculation failed: {str(e)}"))
+        return items
+    return asyncio.run(compute())
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def run(count: int, profile: UserProfileInput) -> dict:
+    progresses = random_progress(random.Random(count), count)
+    scalar, scalar_ms = timed(scalar_items, profile, progresses)
+    batch, batch_ms = timed(calculate_readiness_batch, profile, progresses)
+    return {
+        "items": count,
+        "scalarMs": round(scalar_ms, 2),
+        "batchMs": round(batch_ms, 2),
+        "speedup": round(scalar_ms / batch_ms, 1) if batch_ms else None,
+        "identical": [item.model_dump() for item in scalar] == [item.model_dump() for item in batch],
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", default="1000,10000")
+    args = parser.parse_args()
+
+    profiles = [
+        UserProfileInput(),
+        UserProfileInput(skills=[SkillInput(name="python", level=3), SkillInput(name="react", level=2)], hoursPerWeek=15),
+    ]
+    edge_identical = all(
+        [item.model_dump() for item in scalar_items(profile, EDGE_PROGRESS)]
+        == [item.model_dump() for item in calculate_readiness_batch(profile, EDGE_PROGRESS)]
+        for profile in profiles
+    )
+    results = [run(int(n), profiles[1]) for n in args.items.split(",")]
+    print(json.dumps({"edgeCasesIdentical": edge_identical, "runs": results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
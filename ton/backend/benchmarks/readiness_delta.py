@@ -0,0 +1,104 @@
+"""
+Incremental readiness benchmark
+
+Replays N checklist ticks over a user's tracked contests two ways: as full
+/readiness requests (profile + contest + progress, parsed and recomputed each
+time) and as /readiness/delta events applied to tracked state. Reports request
+bytes and server-side time per update, and checks that the tracked state
+matches the full recomputation after every tick.
+
+Usage:
+    python -m benchmarks.readiness_delta --ticks 10000 --contests 20
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from schemas import ReadinessDeltaInput, ReadinessInput, SkillInput, UserProfileInput
+from services.gpt_service import calculate_readiness
+from services.readiness_service import ReadinessTracker
+
+PROFILE = UserProfileInput(
+    major="컴퓨터공학",
+    skills=[SkillInput(name=name, level=3) for name in ("python", "react", "figma")],
+    goal="포트폴리오",
+    hoursPerWeek=12,
+    preferredTeamSize="2-3",
+)
+
+
+def contest_dict(i: int) -> dict:
+    """Roughly what the dashboard sends: the analyzed contest info"""
+    return {
+        "id": f"c{i}",
+        "title": f"공모전 {i}",
+        "organizer": "주최 기관",
+        "deadline": "2026-12-31",
+        "category": "개발",
+        "description": "공모전 설명 " * 40,
+        "requirements": ["요건 1", "요건 2", "요건 3"],
+    }
+
+
+async def run(ticks: int, contests: int) -> dict:
+    rng = random.Random(ticks)
+    totals = [rng.randint(5, 30) for _ in range(contests)]
+    done = [0] * contests
+
+    tracker = ReadinessTracker(1)
+    for i in range(contests):
+        tracker.track("user", f"c{i}", PROFILE, {"checklistDone": 0, "checklistTotal": totals[i]})
+
+    full_bytes = delta_bytes = 0
+    full_seconds = delta_seconds = 0.0
+    mismatches = 0
+    for _ in range(ticks):
+        i = rng.randrange(contests)
+        step = 1 if done[i] < totals[i] and (done[i] == 0 or rng.random() < 0.7) else -1
+        done[i] += step
+
+        full_body = json.dumps({
+            "userProfile": PROFILE.model_dump(),
+            "contest": contest_dict(i),
+            "currentProgress": {"checklistDone": done[i], "checklistTotal": totals[i]},
+        }, ensure_ascii=False).encode()
+        started = time.perf_counter()
+        request = ReadinessInput.model_validate_json(full_body)
+        expected = await calculate_readiness(request.userProfile, request.contest, request.currentProgress)
+        full_seconds += time.perf_counter() - started
+
+        delta_body = json.dumps({"userId": "user", "events": [{"contestId": f"c{i}", "doneDelta": step}]}).encode()
+        started = time.perf_counter()
+        delta = ReadinessDeltaInput.model_validate_json(delta_body)
+        state = tracker.apply(delta.userId, delta.events)[0]
+        delta_seconds += time.perf_counter() - started
+
+        full_bytes += len(full_body)
+        delta_bytes += len(delta_body)
+        mismatches += state.data != expected
+
+    return {
+        "ticks": ticks,
+        "contests": contests,
+        "fullRequestBytes": round(full_bytes / ticks),
+        "deltaRequestBytes": round(delta_bytes / ticks),
+        "fullUs": round(full_seconds / ticks * 1e6, 1),
+        "deltaUs": round(delta_seconds / ticks * 1e6, 1),
+        "mismatches": mismatches,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--contests", type=int, default=20)
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args.ticks, args.contests)), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
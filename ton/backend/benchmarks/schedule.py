@@ -0,0 +1,86 @@
+"""
+Schedule planning benchmark
+
+Plans N contests of one user against a shared weekly budget, then changes a
+single contest (late, middle and early in deadline order) and times the
+incremental replan against planning from scratch. Also checks that the
+incremental result matches a fresh plan and that no week exceeds the budget.
+
+Usage:
+    python -m benchmarks.schedule --contests 100,300,1000
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import date, timedelta
+
+from schemas import ScheduleContestInput
+from services.ranking_service import CATEGORIES
+from services.schedule_service import SchedulePlanner
+
+START = date(2026, 3, 2)
+
+
+def random_contests(rng: random.Random, count: int) -> list:
+    return [
+        ScheduleContestInput(
+            id=f"c{i}",
+            title=f"공모전 {i}",
+            deadline=(START + timedelta(days=rng.randint(3, 330))).isoformat() if rng.random() < 0.9 else None,
+            category=rng.choice(CATEGORIES),
+            totalHours=rng.randint(10, 120),
+            difficulty=rng.randint(20, 90),
+            schedulePressure=rng.randint(20, 90),
+        )
+        for i in range(count)
+    ]
+
+
+def plan_ms(planner: SchedulePlanner, contests: list):
+    started = time.perf_counter()
+    stats = planner.sync(contests)
+    data = planner.data()
+    return data, stats, (time.perf_counter() - started) * 1000
+
+
+def run(count: int, budget: int) -> dict:
+    rng = random.Random(count)
+    contests = random_contests(rng, count)
+
+    planner = SchedulePlanner(budget, START)
+    _, _, full_ms = plan_ms(planner, contests)
+    result = {"contests": count, "weeklyBudget": budget, "fullPlanMs": round(full_ms, 2)}
+
+    order = sorted(contests, key=lambda c: (c.deadline is None, c.deadline or ""))
+    for label, position in (("late", 0.9), ("middle", 0.5), ("early", 0.1)):
+        target = order[int(position * (count - 1))]
+        index = next(i for i, c in enumerate(contests) if c.id == target.id)
+        contests[index] = target.model_copy(update={"totalHours": target.totalHours + 7})
+
+        data, stats, incremental_ms = plan_ms(planner, contests)
+        fresh, _, scratch_ms = plan_ms(SchedulePlanner(budget, START), contests)
+        result[f"change_{label}"] = {
+            "recomputed": stats["recomputed"],
+            "incrementalMs": round(incremental_ms, 2),
+            "fromScratchMs": round(scratch_ms, 2),
+            "matchesFreshPlan": data == fresh,
+        }
+
+    result["maxUtilization"] = max((week.utilization for week in data.weeks), default=0.0)
+    result["infeasibleContests"] = sum(c.shortfallHours > 0 for c in data.contests)
+    return result
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--contests", default="100,300,1000")
+    parser.add_argument("--budget", type=int, default=40, help="hours per week")
+    args = parser.parse_args()
+
+    print(json.dumps([run(int(n), args.budget) for n in args.contests.split(",")], ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,201 @@
+"""
+Response parsing/validation microbenchmark
+
+Compares the previous path (up to three json.loads attempts plus a
+hand-built pydantic tree with repeated dict lookups) against the current
+one (single orjson pass plus one model_validate into the output schema)
+on a multi-KB analysis response in three shapes: bare JSON, JSON inside a
+```json fence, and JSON wrapped in prose.
+
+Usage:
+    python -m benchmarks.structured_output --iterations 2000
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+os.environ.setdefault("CATALOG_PATH", "")
+
+from schemas import (  # noqa: E402
+    UserProfileInput,
+    AnalysisData,
+    AnalysisResult,
+    ContestInfo,
+    StrategicVerdict,
+    HiddenExpectation,
+    DealBreaker,
+    ChecklistItem,
+    ParticipationScenario,
+    ConfidenceInfo,
+)
+from services import gpt_service  # noqa: E402
+
+
+def legacy_parse(response_text: str) -> dict:
+    """parse_gpt_response before the orjson single-pass rewrite"""
+    try:
+        return json.loads(response_text)
+    except json.JSONDecodeError:
+        pass
+    if "```json" in response_text:
+        start = response_text.find("```json") + 7
+        end = response_text.find("```", start)
+        if end > start:
+            try:
+                return json.loads(response_text[start:end].strip())
+            except json.JSONDecodeError:
+                pass
+    start = response_text.find("{")
+    end = response_text.rfind("}") + 1
+    if start >= 0 and end > start:
+        try:
+            return json.loads(response_text[start:end])
+        except json.JSONDecodeError:
+            pass
+    raise ValueError("Could not parse JSON from GPT response")
+
+
+def legacy_build(data: dict, profile: UserProfileInput, contest_text: str, options: dict) -> AnalysisData:
+    """build_analysis_data before model_validate (hand-built models, repeated .get)"""
+    contest_info = ContestInfo(
+        title=data.get("contestInfo", {}).get("title", "분석된 공모전"),
+        organizer=data.get("contestInfo", {}).get("organizer"),
+        category=data.get("contestInfo", {}).get("category", "일반"),
+        deadline=data.get("contestInfo", {}).get("deadline"),
+        teamSize=data.get("contestInfo", {}).get("teamSize"),
+        requirements=data.get("contestInfo", {}).get("requirements", []),
+        prizes=data.get("contestInfo", {}).get("prizes", []),
+        description=data.get("contestInfo", {}).get("description")
+    )
+    scores = gpt_service.score_from_digest(profile, data.get("digest", {}), contest_info)
+    verdict_data = data.get("strategicVerdict", {})
+    strategic_verdict = StrategicVerdict(
+        summary=verdict_data.get("summary", "분석 완료"),
+        fitType=verdict_data.get("fitType", "risky"),
+        confidence=verdict_data.get("confidence", 0.7)
+    )
+    hidden_expectations = [
+        HiddenExpectation(**exp) for exp in data.get("hiddenExpectations", [])[:3]
+    ] if data.get("hiddenExpectations") else None
+    deal_breakers = [
+        DealBreaker(**db) for db in data.get("dealBreakers", [])
+    ] if data.get("dealBreakers") else None
+    checklist = [
+        ChecklistItem(**item) for item in data.get("checklist", [])[:10]
+    ] if options and options.get("generateChecklist") and data.get("checklist") else None
+    scenario_data = data.get("scenario", {})
+    scenario = ParticipationScenario(
+        totalHours=scenario_data.get("totalHours", 80),
+        weeksNeeded=scenario_data.get("weeksNeeded", 4),
+        userWeeklyHours=profile.hoursPerWeek or 10,
+        feasible=scenario_data.get("feasible", True),
+        conclusion=scenario_data.get("conclusion", "참가 가능"),
+        weeks=gpt_service._scenario_weeks(contest_info, scores, scenario_data.get("totalHours", 80), profile)
+    ) if scenario_data else None
+    opportunities_list = data.get("opportunities", []) or ["공모전 참가 기회"]
+    warnings_list = data.get("warnings", []) or ["준비 과정 점검 필요"]
+    return AnalysisData(
+        contestInfo=contest_info,
+        analysis=AnalysisResult(
+            recommendation=data.get("recommendation", "분석 결과를 확인하세요."),
+            scores=scores,
+            strengths=opportunities_list[:3],
+            concerns=warnings_list[:3],
+            checklist=checklist,
+            strategicVerdict=strategic_verdict,
+            hiddenExpectations=hidden_expectations,
+            opportunities=opportunities_list,
+            warnings=warnings_list,
+            dealBreakers=deal_breakers,
+            scenario=scenario
+        ),
+        alternatives=None,
+        confidence=ConfidenceInfo(
+            overall=strategic_verdict.confidence,
+            infoExtraction=0.85 if contest_text else 0.70,
+            scoreAccuracy=0.80
+        )
+    )
+
+
+def sample_response() -> dict:
+    """A full single-stage analysis of realistic size (~4 KB)"""
+    return {
+        "contestInfo": {
+            "title": "2026 공공데이터 활용 AI 아이디어 공모전",
+            "organizer": "행정안전부",
+            "category": "AI/ML",
+            "deadline": "2026-12-31",
+            "teamSize": "1~4인",
+            "requirements": [f"참가 요건 {i}: 대학생 또는 일반인 팀 구성 가능" for i in range(6)],
+            "prizes": ["대상 500만원", "최우수상 300만원", "우수상 100만원"],
+            "description": "공공데이터를 활용해 사회 문제를 해결하는 AI 서비스 아이디어와 프로토타입을 제출합니다. " * 3,
+        },
+        "strategicVerdict": {"summary": "기술 역량은 충분하지만 일정이 빠듯합니다.", "fitType": "opportunity", "confidence": 0.78},
+        "recommendation": "데이터 전처리 경험을 살려 프로토타입 중심으로 준비하세요. " * 2,
+        "opportunities": [f"기회 요소 {i}: 포트폴리오에 활용 가능한 실데이터 프로젝트" for i in range(4)],
+        "warnings": [f"주의사항 {i}: 제출 서류 형식과 분량 제한 확인" for i in range(4)],
+        "hiddenExpectations": [
+            {"insight": f"심사위원은 실제 서비스 가능성을 중시합니다 {i}", "source": "inferred", "importance": "high"}
+            for i in range(4)
+        ],
+        "dealBreakers": [{"reason": "팀원 전원 재학 증명 필요", "severity": "serious"}],
+        "checklist": [{"text": f"준비 항목 {i}: 데이터셋 라이선스 확인", "priority": "medium"} for i in range(10)],
+        "scenario": {"totalHours": 90, "weeksNeeded": 6, "feasible": True, "conclusion": "주 15시간 투자 시 완료 가능"},
+        "digest": {"requiredSkills": ["python", "pandas", "머신러닝"], "difficulty": 70, "estimatedHours": 90},
+    }
+
+
+def bench(fn, iterations: int) -> float:
+    """Microseconds per call (best of 3)"""
+    return min(timeit.repeat(fn, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def run(iterations: int) -> dict:
+    profile = UserProfileInput(major="컴퓨터공학", hoursPerWeek=15)
+    options = {"generateChecklist": True}
+    body = json.dumps(sample_response(), ensure_ascii=False, indent=2)
+    shapes = {
+        "bare": body,
+        "fenced": f"분석 결과입니다.\n```json\n{body}\n```",
+        "prose": f"다음은 분석 결과입니다: {body} 참고하세요.",
+    }
+
+    results = {"responseBytes": len(body.encode("utf-8")), "iterations": iterations, "shapes": {}}
+    for name, text in shapes.items():
+        assert legacy_parse(text) == gpt_service.parse_gpt_response(text)
+        legacy_us = bench(lambda: legacy_parse(text), iterations)
+        current_us = bench(lambda: gpt_service.parse_gpt_response(text), iterations)
+        results["shapes"][name] = {
+            "legacyParseUs": round(legacy_us, 1),
+            "parseUs": round(current_us, 1),
+            "speedup": round(legacy_us / current_us, 2),
+        }
+
+    data = sample_response()
+    assert (
+        legacy_build(data, profile, "t", options).model_dump()
+        == gpt_service.build_analysis_data(data, profile, "t", options).model_dump()
+    )
+    legacy_us = bench(lambda: legacy_build(data, profile, "t", options), iterations)
+    current_us = bench(lambda: gpt_service.build_analysis_data(data, profile, "t", options), iterations)
+    results["build"] = {
+        "legacyBuildUs": round(legacy_us, 1),
+        "buildUs": round(current_us, 1),
+        "speedup": round(legacy_us / current_us, 2),
+    }
+    return results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.iterations), indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
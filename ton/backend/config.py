@@ -9,10 +9,52 @@ from constants import (
     API_DESCRIPTION,
     MAX_IMAGE_SIZE_BYTES,
     ALLOWED_IMAGE_TYPES,
+    DEFAULT_IMAGE_MAX_LONG_SIDE,
+    DEFAULT_IMAGE_MAX_SHORT_SIDE,
+    DEFAULT_IMAGE_TILE_SNAP_RATIO,
+    DEFAULT_IMAGE_OUTPUT_FORMAT,
+    DEFAULT_IMAGE_QUALITY,
     DEFAULT_OPENAI_MODEL,
     DEFAULT_OPENAI_MAX_TOKENS,
     DEFAULT_OPENAI_TEMPERATURE,
     DEFAULT_API_TIMEOUT_SECONDS,
+    DEFAULT_OPENAI_MAX_CONCURRENCY,
+    DEFAULT_OPENAI_RPM_LIMIT,
+    DEFAULT_OPENAI_TPM_LIMIT,
+    DEFAULT_HEDGE_PERCENTILE,
+    DEFAULT_HEDGE_MIN_DELAY_SECONDS,
+    DEFAULT_HEDGE_INITIAL_DELAY_SECONDS,
+    DEFAULT_REQUEST_DEADLINE_SECONDS,
+    DEFAULT_OPENAI_SMALL_MODEL,
+    DEFAULT_ROUTE_SMALL_MAX_CHARS,
+    DEFAULT_CACHE_BACKEND,
+    DEFAULT_CACHE_PATH,
+    DEFAULT_CATALOG_PATH,
+    DEFAULT_ANALYSIS_CACHE_TTL_SECONDS,
+    DEFAULT_ANALYSIS_CACHE_MAX_ENTRIES,
+    DEFAULT_DIGEST_CACHE_TTL_SECONDS,
+    DEFAULT_EXTRACTION_CACHE_TTL_SECONDS,
+    DEFAULT_EXTRACT_DEDUP_MAX_DISTANCE,
+    MAX_BATCH_CONTESTS,
+    MAX_BATCH_PACK_SIZE,
+    DEFAULT_BATCH_MAX_CONCURRENCY,
+    DEFAULT_BATCH_PACK_MAX_CHARS,
+    MAX_RECOMMEND_CONTESTS,
+    MAX_CATALOG_QUERY_LIMIT,
+    DEFAULT_SCHEDULE_MAX_USERS,
+    MAX_SCHEDULE_CONTESTS,
+    MAX_PORTFOLIO_CONTESTS,
+    MAX_READINESS_BATCH_ITEMS,
+    DEFAULT_READINESS_MAX_USERS,
+    MAX_READINESS_DELTA_EVENTS,
+    READINESS_KEEPALIVE_SECONDS,
+    DEFAULT_JOBS_PATH,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_JOB_QUEUE_MAX,
+    DEFAULT_JOB_MAX_ATTEMPTS,
+    DEFAULT_JOB_RETENTION_SECONDS,
+    MAX_JOB_WAIT_SECONDS,
+    DEFAULT_WEBHOOK_ALLOWED_HOSTS,
     MIN_API_KEY_LENGTH,
     API_KEY_PREFIX,
     DEFAULT_CORS_ORIGINS,
@@ -22,10 +64,19 @@ load_dotenv()
 
 # OpenAI Settings
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+# OpenAI 호환 서버 주소 (예: 부하 테스트용 benchmarks.fake_openai), 비우면 기본 OpenAI API
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL") or None
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", DEFAULT_OPENAI_MODEL)
 OPENAI_VISION_MODEL = os.getenv("OPENAI_VISION_MODEL", DEFAULT_OPENAI_MODEL)
 OPENAI_MAX_TOKENS = int(os.getenv("OPENAI_MAX_TOKENS", DEFAULT_OPENAI_MAX_TOKENS))
 OPENAI_TEMPERATURE = float(os.getenv("OPENAI_TEMPERATURE", DEFAULT_OPENAI_TEMPERATURE))
+# 짧은 텍스트 요청용 소형 모델 (빈 값이면 라우팅 없이 OPENAI_MODEL만 사용)
+OPENAI_SMALL_MODEL = os.getenv("OPENAI_SMALL_MODEL", DEFAULT_OPENAI_SMALL_MODEL)
+ROUTE_SMALL_MAX_CHARS = int(os.getenv("ROUTE_SMALL_MAX_CHARS", DEFAULT_ROUTE_SMALL_MAX_CHARS))
+OPENAI_MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", DEFAULT_OPENAI_MAX_CONCURRENCY))
+# 계정의 분당 요청/토큰 한도. 요청 전에 토큰을 예약해 한도 안에서만 호출합니다.
+OPENAI_RPM_LIMIT = int(os.getenv("OPENAI_RPM_LIMIT", DEFAULT_OPENAI_RPM_LIMIT))
+OPENAI_TPM_LIMIT = int(os.getenv("OPENAI_TPM_LIMIT", DEFAULT_OPENAI_TPM_LIMIT))
 
 def is_api_key_valid() -> bool:
     """Check if OpenAI API key is configured and has valid format"""
@@ -58,5 +109,76 @@ if SERVER_IP:
 # File Upload Settings
 MAX_IMAGE_SIZE = MAX_IMAGE_SIZE_BYTES
 
+# Image preprocessing (업로드 이미지를 Vision 모델 해상도로 축소 후 재인코딩)
+IMAGE_MAX_LONG_SIDE = int(os.getenv("IMAGE_MAX_LONG_SIDE", DEFAULT_IMAGE_MAX_LONG_SIDE))
+IMAGE_MAX_SHORT_SIDE = int(os.getenv("IMAGE_MAX_SHORT_SIDE", DEFAULT_IMAGE_MAX_SHORT_SIDE))
+IMAGE_TILE_SNAP_RATIO = float(os.getenv("IMAGE_TILE_SNAP_RATIO", DEFAULT_IMAGE_TILE_SNAP_RATIO))
+IMAGE_OUTPUT_FORMAT = os.getenv("IMAGE_OUTPUT_FORMAT", DEFAULT_IMAGE_OUTPUT_FORMAT).upper()
+IMAGE_QUALITY = int(os.getenv("IMAGE_QUALITY", DEFAULT_IMAGE_QUALITY))
+
 # Timeout settings
 API_TIMEOUT = int(os.getenv("API_TIMEOUT", DEFAULT_API_TIMEOUT_SECONDS))
+# 클라이언트는 X-Request-Timeout 헤더(초)로 더 짧은 마감 시간을 지정할 수 있습니다.
+REQUEST_DEADLINE = float(os.getenv("REQUEST_DEADLINE", DEFAULT_REQUEST_DEADLINE_SECONDS))
+
+# Hedged requests: 느린 호출이 최근 지연시간 백분위를 넘기면 동일 요청을 한 번 더 보내 먼저 끝난 응답 사용
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "true").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE))
+HEDGE_MIN_DELAY = float(os.getenv("HEDGE_MIN_DELAY", DEFAULT_HEDGE_MIN_DELAY_SECONDS))
+HEDGE_INITIAL_DELAY = float(os.getenv("HEDGE_INITIAL_DELAY", DEFAULT_HEDGE_INITIAL_DELAY_SECONDS))
+
+# Cache settings
+# CACHE_BACKEND=sqlite 이면 CACHE_PATH 파일에 저장되어 재시작 후에도 유지됩니다.
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", DEFAULT_CACHE_BACKEND)
+CACHE_PATH = os.getenv("CACHE_PATH", DEFAULT_CACHE_PATH)
+ANALYSIS_CACHE_TTL = int(os.getenv("ANALYSIS_CACHE_TTL", DEFAULT_ANALYSIS_CACHE_TTL_SECONDS))
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", DEFAULT_ANALYSIS_CACHE_MAX_ENTRIES))
+DIGEST_CACHE_TTL = int(os.getenv("DIGEST_CACHE_TTL", DEFAULT_DIGEST_CACHE_TTL_SECONDS))
+EXTRACTION_CACHE_TTL = int(os.getenv("EXTRACTION_CACHE_TTL", DEFAULT_EXTRACTION_CACHE_TTL_SECONDS))
+EXTRACT_DEDUP_MAX_DISTANCE = int(os.getenv("EXTRACT_DEDUP_MAX_DISTANCE", DEFAULT_EXTRACT_DEDUP_MAX_DISTANCE))
+
+# Contest catalog (분석/추출된 공모전을 SQLite에 영구 저장, 빈 값이면 비활성화)
+CATALOG_PATH = os.getenv("CATALOG_PATH", DEFAULT_CATALOG_PATH)
+
+# Schedule planning (POST /schedule)
+# userId별 일정 상태를 보관해 바뀐 공모전부터만 다시 계산
+SCHEDULE_MAX_USERS = int(os.getenv("SCHEDULE_MAX_USERS", DEFAULT_SCHEDULE_MAX_USERS))
+
+# Readiness tracking (POST /readiness/track, /readiness/delta)
+# (userId, contestId)별 준비도 상태를 보관해 진행 변화분만 받아 갱신하고 구독자에게 전송
+READINESS_MAX_USERS = int(os.getenv("READINESS_MAX_USERS", DEFAULT_READINESS_MAX_USERS))
+
+# Background jobs (POST /jobs/analyze)
+# 작업 상태를 JOBS_PATH SQLite 파일에 저장해 재시작 후에도 이어서 처리, 빈 값이면 메모리에만 보관
+JOBS_PATH = os.getenv("JOBS_PATH", DEFAULT_JOBS_PATH)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", DEFAULT_JOB_WORKERS))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", DEFAULT_JOB_QUEUE_MAX))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", DEFAULT_JOB_MAX_ATTEMPTS))
+JOB_RETENTION = int(os.getenv("JOB_RETENTION", DEFAULT_JOB_RETENTION_SECONDS))
+# callback_url로 허용할 호스트 목록, 지정하면 이 호스트로만 전송 (내부망 주소도 허용)
+# 비어 있으면 사설/루프백/링크 로컬 등 공인 IP가 아닌 주소로 해석되는 호스트는 거부
+WEBHOOK_ALLOWED_HOSTS = {
+    host.strip().lower()
+    for host in os.getenv("WEBHOOK_ALLOWED_HOSTS", DEFAULT_WEBHOOK_ALLOWED_HOSTS).split(",")
+    if host.strip()
+}
+
+# Analysis pipeline
+# true: 공모전 요약(캐시) + 사용자별 평가 2단계, false: 기존 단일 프롬프트
+ANALYSIS_TWO_STAGE = os.getenv("ANALYSIS_TWO_STAGE", "true").lower() == "true"
+# local: 점수는 로컬 규칙으로 계산하고 GPT는 설명 문구만 작성, model: GPT가 점수까지 산출
+SCORING_MODE = os.getenv("SCORING_MODE", "local")
+# true: 응답 형식을 JSON 스키마(strict structured output)로 강제, false: 일반 JSON 모드
+STRUCTURED_OUTPUT = os.getenv("STRUCTURED_OUTPUT", "true").lower() == "true"
+
+# Prompt Caching
+# 같은 접두부를 가진 요청을 같은 캐시로 보내도록 prompt_cache_key 전송
+PROMPT_CACHE_KEYS = os.getenv("PROMPT_CACHE_KEYS", "true").lower() == "true"
+
+# Tracing
+# 요청 단계별 소요 시간을 span으로 기록하고 Server-Timing 헤더로 반환
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+
+# Batch analysis
+BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", DEFAULT_BATCH_MAX_CONCURRENCY))
+BATCH_PACK_MAX_CHARS = int(os.getenv("BATCH_PACK_MAX_CHARS", DEFAULT_BATCH_PACK_MAX_CHARS))
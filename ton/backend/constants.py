@@ -11,11 +11,136 @@ API_DESCRIPTION = "AI-powered contest recommendation service"
 MAX_IMAGE_SIZE_BYTES = 20 * 1024 * 1024  # 20MB
 ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/webp", "image/gif"]
 
+# Image Preprocessing Settings
+# GPT Vision(high detail)은 2048x2048 안으로, 짧은 변 768px로 축소 후 512px 타일 단위로 과금
+DEFAULT_IMAGE_MAX_LONG_SIDE = 2048
+DEFAULT_IMAGE_MAX_SHORT_SIDE = 768
+DEFAULT_IMAGE_TILE_SNAP_RATIO = 0.1  # 해상도를 10% 이내로 줄여 타일 한 줄을 아낄 수 있으면 축소
+DEFAULT_IMAGE_OUTPUT_FORMAT = "JPEG"  # "JPEG" | "WEBP"
+DEFAULT_IMAGE_QUALITY = 85
+VISION_TILE_SIZE = 512
+VISION_BASE_TOKENS = 85
+VISION_TOKENS_PER_TILE = 170
+
 # OpenAI Default Settings
 DEFAULT_OPENAI_MODEL = "gpt-4o"
 DEFAULT_OPENAI_MAX_TOKENS = 4096
 DEFAULT_OPENAI_TEMPERATURE = 0.7
 DEFAULT_API_TIMEOUT_SECONDS = 60
+DEFAULT_OPENAI_MAX_CONCURRENCY = 8  # 동시에 진행 가능한 업스트림 호출 수
+DEFAULT_OPENAI_RPM_LIMIT = 0  # 0: 첫 응답의 x-ratelimit-* 헤더에서 학습
+DEFAULT_OPENAI_TPM_LIMIT = 0
+DEFAULT_HEDGE_PERCENTILE = 95  # 최근 지연시간의 p95를 넘기면 두 번째 요청 발사
+DEFAULT_HEDGE_MIN_DELAY_SECONDS = 2.0
+DEFAULT_HEDGE_INITIAL_DELAY_SECONDS = 20.0  # 지연시간 표본이 모이기 전 사용
+DEFAULT_REQUEST_DEADLINE_SECONDS = 90  # /analyze, /extract 전체 재시도 포함 최대 대기 시간
+
+# Model Routing (짧은 텍스트 요청은 소형 모델, 검증 실패 시 대형 모델로 재시도)
+DEFAULT_OPENAI_SMALL_MODEL = "gpt-4o-mini"
+DEFAULT_ROUTE_SMALL_MAX_CHARS = 1500  # 이보다 긴 공모전 텍스트는 처음부터 대형 모델
+# 요청 종류별 출력 토큰 상한 (대형 모델로 승격하면 OPENAI_MAX_TOKENS 사용)
+ROUTE_TOKEN_CAPS = {"digest": 1200, "narrative": 1200, "score": 1800, "analyze": 2400, "batch": 4096, "extract": 1000}
+ROUTE_OPTION_TOKENS = {"generateChecklist": 300, "includeAlternatives": 200}
+# 검증에 필요한 최상위 키
+ROUTE_REQUIRED_KEYS = {
+    "digest": ["contestInfo"],
+    "narrative": ["strategicVerdict", "recommendation"],
+    "score": ["strategicVerdict", "scores"],
+    "analyze": ["contestInfo", "strategicVerdict", "scores"],
+    "batch": ["results"],
+    "extract": ["confidence"],
+}
+# USD per 1M tokens (input, output, cached input)
+MODEL_PRICING_PER_1M = {
+    "gpt-4o": (2.50, 10.00, 1.25),
+    "gpt-4o-mini": (0.15, 0.60, 0.075),
+    "gpt-4.1": (2.00, 8.00, 0.50),
+    "gpt-4.1-mini": (0.40, 1.60, 0.10),
+    "gpt-4.1-nano": (0.10, 0.40, 0.025),
+}
+# 프롬프트 캐싱은 이 토큰 수 이상의 동일한 접두부에만 적용됨
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Analysis Cache Settings
+DEFAULT_CACHE_BACKEND = "memory"  # "memory" | "sqlite"
+DEFAULT_CACHE_PATH = "cache.sqlite3"
+DEFAULT_CATALOG_PATH = "catalog.sqlite3"
+DEFAULT_ANALYSIS_CACHE_TTL_SECONDS = 24 * 60 * 60  # 24시간
+DEFAULT_ANALYSIS_CACHE_MAX_ENTRIES = 1000
+DEFAULT_DIGEST_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 공모전 요약은 사용자와 무관하므로 더 오래 유지
+DEFAULT_EXTRACTION_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_EXTRACT_DEDUP_MAX_DISTANCE = 6  # 64비트 dHash 기준 같은 포스터로 볼 최대 해밍 거리
+
+# Batch Analysis Settings
+MAX_BATCH_CONTESTS = 50
+MAX_BATCH_PACK_SIZE = 5
+DEFAULT_BATCH_MAX_CONCURRENCY = 4
+DEFAULT_BATCH_PACK_MAX_CHARS = 600  # 이보다 짧은 공모전만 한 요청에 묶음
+
+# Schedule Settings (frontend constants/schedule.js와 같은 기준)
+# (id, 라벨, 기본 비율, 우선순위)
+SCHEDULE_PHASES = (
+    ("research", "리서치", 0.15, "must"),
+    ("ideation", "아이디어 구상", 0.15, "must"),
+    ("production", "제작/개발", 0.45, "must"),
+    ("polish", "다듬기", 0.15, "nice"),
+    ("submission", "제출 준비", 0.10, "must"),
+)
+SCHEDULE_SHORT_PHASES = (
+    ("research", "리서치·아이디어", 0.35, "must"),
+    ("production", "제작·다듬기", 0.50, "must"),
+    ("submission", "제출 준비", 0.15, "must"),
+)
+SCHEDULE_SHORT_TIMELINE_DAYS = 14
+SCHEDULE_HIGH_PRESSURE = 70
+SCHEDULE_MEDIUM_PRESSURE = 50
+SCHEDULE_SUBMISSION_PRESSURE = 60
+SCHEDULE_HIGH_DIFFICULTY = 70
+SCHEDULE_BUFFER_DAYS = {"high": 2, "medium": 3, "low": 4}  # 마감 전 여유일 (일정 압박도별)
+SCHEDULE_MAX_WEEKS = 52
+SCHEDULE_SQUEEZE_RATIO = 1.2  # 고르게 나눈 주간 시간보다 이만큼 많으면 위험도 medium
+MAX_SCHEDULE_CONTESTS = 1000
+DEFAULT_SCHEDULE_MAX_USERS = 1000  # 증분 계산용 사용자별 일정 상태 보관 수 (LRU)
+
+# Portfolio Optimization Settings
+MAX_PORTFOLIO_CONTESTS = 10000
+PORTFOLIO_EXACT_MAX_CELLS = 20_000_000  # 정확 모드 DP 표 크기(공모전 수 x 가용 시간) 상한, 넘으면 휴리스틱
+PORTFOLIO_AUTO_EXACT_CELLS = 2_000_000  # auto 모드에서 정확 모드를 쓰는 표 크기
+
+# Background Job Settings
+DEFAULT_JOBS_PATH = "jobs.sqlite3"
+DEFAULT_JOB_WORKERS = 2
+DEFAULT_JOB_QUEUE_MAX = 200
+DEFAULT_JOB_MAX_ATTEMPTS = 2  # 첫 시도 포함, 실행 중 재시작으로 끊긴 작업을 다시 실행하는 한도
+DEFAULT_JOB_RETENTION_SECONDS = 24 * 60 * 60
+MAX_JOB_WAIT_SECONDS = 60  # GET /jobs/{id}?wait= 롱 폴링 최대 대기 시간
+DEFAULT_WEBHOOK_ALLOWED_HOSTS = ""  # 쉼표로 구분, 비어 있으면 공인 IP로 해석되는 호스트만 허용
+
+# Local Scoring Tables (카테고리별 기준값)
+CATEGORY_DIFFICULTY_BASE = {"AI/ML": 75, "개발": 65, "디자인": 55, "창업/비즈니스": 60, "데이터": 70, "일반": 50}
+CATEGORY_PORTFOLIO_BASE = {"AI/ML": 85, "개발": 80, "디자인": 75, "창업/비즈니스": 70, "데이터": 80, "일반": 60}
+CATEGORY_ESTIMATED_HOURS = {"AI/ML": 100, "개발": 90, "디자인": 60, "창업/비즈니스": 70, "데이터": 80, "일반": 50}
+CATEGORY_SKILL_KEYWORDS = {
+    "AI/ML": ["python", "pytorch", "tensorflow", "머신러닝", "딥러닝", "ai", "인공지능", "llm", "nlp", "컴퓨터비전"],
+    "개발": ["javascript", "typescript", "react", "java", "spring", "python", "node", "웹", "앱", "flutter", "kotlin", "swift"],
+    "디자인": ["figma", "photoshop", "illustrator", "ui", "ux", "디자인", "프로토타이핑"],
+    "창업/비즈니스": ["기획", "마케팅", "사업계획", "pm", "경영", "발표", "비즈니스"],
+    "데이터": ["python", "sql", "pandas", "tableau", "데이터", "통계", "시각화", "분석"],
+    "일반": [],
+}
+MAX_RECOMMEND_CONTESTS = 50000
+MAX_CATALOG_QUERY_LIMIT = 500
+DEFAULT_SKILL_LEVEL = 3
+MAX_SKILL_LEVEL = 5
+
+# Readiness Settings
+READINESS_WEIGHTS = (0.35, 0.25, 0.25, 0.15)  # 기술, 시간, 진행도, 자원 순
+READINESS_DEFAULT_PROGRESS = 30  # 진행 상황을 보내지 않았을 때의 진행도
+READINESS_RESOURCE = 80
+MAX_READINESS_BATCH_ITEMS = 10000
+DEFAULT_READINESS_MAX_USERS = 10000  # 증분 계산용 사용자별 준비도 상태 보관 수 (LRU)
+MAX_READINESS_DELTA_EVENTS = 500
+READINESS_KEEPALIVE_SECONDS = 15  # 구독 스트림 keep-alive 주기
 
 # API Key Validation
 MIN_API_KEY_LENGTH = 20
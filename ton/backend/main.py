@@ -4,13 +4,16 @@ Contest Guide API - FastAPI Backend
 AI-powered contest recommendation and analysis service.
 """
 
+import asyncio
 import json
-import base64
 import time
-from typing import Optional
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Optional, Tuple
 
-from fastapi import FastAPI, File, Form, UploadFile
+from fastapi import FastAPI, File, Form, Header, Query, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
 
 from config import (
     API_VERSION, 
@@ -19,36 +22,92 @@ from config import (
     CORS_ORIGINS,
     MAX_IMAGE_SIZE,
     ALLOWED_IMAGE_TYPES,
+    MAX_BATCH_CONTESTS,
+    MAX_BATCH_PACK_SIZE,
+    MAX_RECOMMEND_CONTESTS,
+    MAX_CATALOG_QUERY_LIMIT,
+    MAX_JOB_WAIT_SECONDS,
+    MAX_SCHEDULE_CONTESTS,
+    MAX_PORTFOLIO_CONTESTS,
+    MAX_READINESS_BATCH_ITEMS,
+    MAX_READINESS_DELTA_EVENTS,
+    READINESS_KEEPALIVE_SECONDS,
     OPENAI_MODEL,
+    REQUEST_DEADLINE,
+    TRACING_ENABLED,
     get_api_mode,
     is_api_key_valid
 )
 from schemas import (
     UserProfileInput,
     AnalysisResponse,
+    BatchAnalysisInput,
+    RecommendInput,
+    RecommendResponse,
+    CatalogResponse,
     ExtractionResponse,
     ExtractionData,
     AssistantContext,
     AssistantResponse,
     ReadinessInput,
     ReadinessResponse,
+    ReadinessBatchInput,
+    ReadinessBatchResponse,
+    ReadinessTrackInput,
+    ReadinessDeltaInput,
+    ReadinessStateResponse,
+    JobResponse,
+    ScheduleInput,
+    ScheduleResponse,
+    PortfolioInput,
+    PortfolioResponse,
 )
 from services.gpt_service import (
     analyze_contest,
+    stream_analysis,
     extract_from_image,
     generate_assistant_message,
     calculate_readiness,
+    close_gpt_client,
+    get_rate_limit_stats,
+    get_hedge_stats,
+    get_routing_stats,
+    get_prompt_cache_stats,
 )
+from services.cache_service import get_cache_stats
+from services.coalesce_service import get_coalescing_stats
+from services.deadline_service import request_deadline
+from services.metrics_service import track_request, render_metrics
+from services.tracing_service import ServerTimingMiddleware, span, span_since_request_start
+from services.stream_parser import format_sse
+from services.image_service import PreparedImage, preprocess_image
+from services.batch_service import analyze_batch
+from services.ranking_service import ContestMatrix, rank_contests
+from services.catalog_service import get_catalog
+from services.job_service import QueueFull, check_webhook_url, get_job_queue
+from services.schedule_service import get_planner
+from services.readiness_service import calculate_readiness_batch, get_readiness_tracker
+from services.portfolio_service import MODES as PORTFOLIO_MODES, optimize_portfolio
 
 
 # ============================================
 # APP CONFIGURATION
 # ============================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start background job workers; release shared resources on shutdown"""
+    await get_job_queue().start()
+    yield
+    await get_job_queue().stop()
+    await close_gpt_client()
+
+
 app = FastAPI(
     title=API_TITLE,
     description=API_DESCRIPTION,
     version=API_VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -57,8 +116,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+if TRACING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
+
 
 # ============================================
 # HEALTH CHECK
@@ -72,20 +135,127 @@ async def health_check():
         "version": API_VERSION,
         "service": "contest-guide-api",
         "aiMode": get_api_mode(),
-        "model": OPENAI_MODEL if is_api_key_valid() else "mock"
+        "model": OPENAI_MODEL if is_api_key_valid() else "mock",
+        "cache": get_cache_stats(),
+        "coalescing": get_coalescing_stats(),
+        "rateLimit": get_rate_limit_stats(),
+        "hedging": get_hedge_stats(),
+        "routing": get_routing_stats(),
+        "promptCache": get_prompt_cache_stats(),
+        "catalog": await asyncio.to_thread(get_catalog().stats) if get_catalog() else None,
+        "jobs": await asyncio.to_thread(get_job_queue().stats),
+        "readinessTracking": get_readiness_tracker().stats()
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics: request latency and LLM calls, tokens and cost per endpoint/model"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
 # ============================================
 # CONTEST ANALYSIS
 # ============================================
 
+def _json_response(model) -> Response:
+    """
+    Serialize a response model once, in a traced span, instead of letting
+    FastAPI re-validate it against response_model.
+    """
+    with span("serialize"):
+        body = model.model_dump_json()
+    return Response(body, media_type="application/json")
+
+
+def _deadline_seconds(client_timeout: Optional[float]) -> float:
+    """Server deadline, shortened to what the client says it will wait"""
+    if client_timeout and client_timeout > 0:
+        return min(client_timeout, REQUEST_DEADLINE)
+    return REQUEST_DEADLINE
+
+
+async def _prepare_upload_image(upload: UploadFile) -> Tuple[Optional[PreparedImage], Optional[str]]:
+    """
+    Validate an uploaded image and shrink/re-encode it for GPT Vision.
+    The upload is decoded straight from its spooled file, never read whole into memory.
+    
+    Returns:
+        (image, error) - error is set on invalid input
+    """
+    # Validate file type
+    if upload.content_type not in ALLOWED_IMAGE_TYPES:
+        return None, f"Invalid image type. Allowed: {', '.join(ALLOWED_IMAGE_TYPES)}"
+    
+    upload.file.seek(0, 2)
+    size = upload.file.tell()
+    upload.file.seek(0)
+    if size > MAX_IMAGE_SIZE:
+        return None, f"Image too large. Maximum size: {MAX_IMAGE_SIZE // (1024*1024)}MB"
+    
+    # Decoding/resizing is CPU-bound; keep it off the event loop
+    with span("image_preprocess", size=size):
+        image = await asyncio.to_thread(preprocess_image, upload.file, upload.content_type)
+    return image, None
+
+
+async def _parse_analysis_input(
+    user_profile: str,
+    contest_text: str,
+    contest_image: Optional[UploadFile],
+    options: str
+) -> Tuple[Optional[UserProfileInput], dict, Optional[PreparedImage], Optional[str]]:
+    """
+    Parse and validate /analyze form fields.
+    
+    Returns:
+        (profile, options, image, error) - error is set on invalid input
+    """
+    # Parse user profile
+    try:
+        with span("profile_parse"):
+            profile_data = json.loads(user_profile)
+            # 빈 객체나 None 값 처리
+            if not profile_data:
+                profile_data = {}
+            profile = UserProfileInput(**profile_data)
+    except json.JSONDecodeError as e:
+        return None, {}, None, f"Invalid user profile JSON format: {str(e)}"
+    except Exception as e:
+        import traceback
+        print(f"User profile parsing error: {traceback.format_exc()}")
+        return None, {}, None, f"Invalid user profile format: {str(e)}"
+    
+    # Parse options
+    try:
+        opts = json.loads(options)
+    except:
+        opts = {}
+    
+    # Process image if provided
+    image = None
+    if contest_image:
+        try:
+            image, error = await _prepare_upload_image(contest_image)
+            if error:
+                return None, opts, None, error
+        except Exception as e:
+            return None, opts, None, f"Failed to process image: {str(e)}"
+    
+    # Validate input
+    if not contest_text and not image:
+        return None, opts, None, "Please provide contest text or image"
+    
+    return profile, opts, image, None
+
+
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze(
     user_profile: str = Form(...),
     contest_text: str = Form(""),
     contest_image: Optional[UploadFile] = File(None),
-    options: str = Form("{}")
+    options: str = Form("{}"),
+    x_request_timeout: Optional[float] = Header(None)
 ):
     """
     Analyze a contest and generate personalized recommendations.
@@ -95,98 +265,345 @@ async def analyze(
         contest_text: Contest description text
         contest_image: Optional poster image
         options: JSON string of analysis options
+        x_request_timeout: Seconds the client will wait (X-Request-Timeout header)
     
     Returns:
         AnalysisResponse with recommendations and scores
     """
     start_time = time.time()
+    # Multipart body parsing happens before the handler runs
+    span_since_request_start("request_parse")
     
-    # Parse user profile
-    try:
-        profile_data = json.loads(user_profile)
-        # 빈 객체나 None 값 처리
-        if not profile_data:
-            profile_data = {}
-        profile = UserProfileInput(**profile_data)
-    except json.JSONDecodeError as e:
-        return AnalysisResponse(
-            success=False,
-            error=f"Invalid user profile JSON format: {str(e)}"
-        )
-    except Exception as e:
-        import traceback
-        print(f"User profile parsing error: {traceback.format_exc()}")
-        return AnalysisResponse(
-            success=False,
-            error=f"Invalid user profile format: {str(e)}"
-        )
+    profile, opts, image, error = await _parse_analysis_input(
+        user_profile, contest_text, contest_image, options
+    )
+    if error:
+        return AnalysisResponse(success=False, error=error)
     
-    # Parse options
-    try:
-        opts = json.loads(options)
-    except:
-        opts = {}
-    
-    # Process image if provided
-    image_base64 = None
-    if contest_image:
-        # Validate file type
-        if contest_image.content_type not in ALLOWED_IMAGE_TYPES:
-            return AnalysisResponse(
-                success=False,
-                error=f"Invalid image type. Allowed: {', '.join(ALLOWED_IMAGE_TYPES)}"
-            )
-        
-        # Read and encode image
+    # Perform analysis
+    with track_request("/analyze", get_api_mode()) as usage:
         try:
-            content = await contest_image.read()
-            if len(content) > MAX_IMAGE_SIZE:
-                return AnalysisResponse(
-                    success=False,
-                    error=f"Image too large. Maximum size: {MAX_IMAGE_SIZE // (1024*1024)}MB"
+            with request_deadline(_deadline_seconds(x_request_timeout)), span("analyze"):
+                result = await analyze_contest(
+                    profile=profile,
+                    contest_text=contest_text,
+                    image_base64=image.base64 if image else None,
+                    options=opts,
+                    image_mime=image.mime_type if image else "image/jpeg"
                 )
-            image_base64 = base64.b64encode(content).decode('utf-8')
+            
+            processing_time = int((time.time() - start_time) * 1000)
+            
+            return _json_response(AnalysisResponse(
+                success=True,
+                data=result,
+                meta={
+                    "processingTime": processing_time,
+                    "modelUsed": OPENAI_MODEL if is_api_key_valid() else "mock",
+                    "aiMode": get_api_mode(),
+                    "usage": usage.to_dict()
+                }
+            ))
         except Exception as e:
+            usage.status = "error"
+            import traceback
+            error_details = traceback.format_exc()
+            print(f"Analysis error: {error_details}")  # 서버 콘솔에 상세 오류 출력
             return AnalysisResponse(
                 success=False,
-                error=f"Failed to process image: {str(e)}"
+                error=f"Analysis failed: {str(e)}"
             )
+
+
+@app.post("/analyze/stream")
+async def analyze_stream(
+    user_profile: str = Form(...),
+    contest_text: str = Form(""),
+    contest_image: Optional[UploadFile] = File(None),
+    options: str = Form("{}")
+):
+    """
+    Analyze a contest and stream sections as server-sent events.
     
-    # Validate input
-    if not contest_text and not image_base64:
+    Events:
+        contestInfo, strategicVerdict, scores, checklist, scenario - each
+        sent as soon as the section is complete;
+        result - the full AnalysisResponse; error - AnalysisResponse with error
+    """
+    start_time = time.time()
+    
+    profile, opts, image, error = await _parse_analysis_input(
+        user_profile, contest_text, contest_image, options
+    )
+    if error:
+        return AnalysisResponse(success=False, error=error)
+    
+    async def event_stream():
+        with track_request("/analyze/stream", get_api_mode()) as usage:
+            try:
+                async for section, payload in stream_analysis(
+                    profile=profile,
+                    contest_text=contest_text,
+                    image_base64=image.base64 if image else None,
+                    options=opts,
+                    image_mime=image.mime_type if image else "image/jpeg"
+                ):
+                    if section != "result":
+                        yield format_sse(section, payload)
+                        continue
+                    
+                    response = AnalysisResponse(
+                        success=True,
+                        data=payload,
+                        meta={
+                            "processingTime": int((time.time() - start_time) * 1000),
+                            "modelUsed": OPENAI_MODEL if is_api_key_valid() else "mock",
+                            "aiMode": get_api_mode(),
+                            "usage": usage.to_dict()
+                        }
+                    )
+                    yield format_sse("result", response.model_dump())
+            except Exception as e:
+                usage.status = "error"
+                import traceback
+                print(f"Streaming analysis error: {traceback.format_exc()}")
+                response = AnalysisResponse(success=False, error=f"Analysis failed: {str(e)}")
+                yield format_sse("error", response.model_dump())
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/analyze/batch")
+async def analyze_batch_endpoint(input_data: BatchAnalysisInput):
+    """
+    Analyze many contests against one profile.
+    
+    Args:
+        input_data: Profile, contest texts, options and optional packSize
+    
+    Events:
+        item - BatchAnalysisItem per contest, in completion order;
+        done - summary with success/failure counts and processing time
+    """
+    start_time = time.time()
+    
+    contests = input_data.contests
+    if not contests:
+        return AnalysisResponse(success=False, error="Please provide at least one contest")
+    if len(contests) > MAX_BATCH_CONTESTS:
         return AnalysisResponse(
             success=False,
-            error="Please provide contest text or image"
+            error=f"Too many contests. Maximum: {MAX_BATCH_CONTESTS}"
         )
+    pack_size = max(1, min(input_data.packSize, MAX_BATCH_PACK_SIZE))
+    
+    async def event_stream():
+        with track_request("/analyze/batch", get_api_mode()) as usage:
+            succeeded = 0
+            async for item in analyze_batch(
+                profile=input_data.userProfile,
+                contest_texts=contests,
+                options=input_data.options or {},
+                pack_size=pack_size
+            ):
+                succeeded += item.success
+                yield format_sse("item", item.model_dump())
+            
+            yield format_sse("done", {
+                "success": True,
+                "meta": {
+                    "total": len(contests),
+                    "succeeded": succeeded,
+                    "failed": len(contests) - succeeded,
+                    "processingTime": int((time.time() - start_time) * 1000),
+                    "aiMode": get_api_mode(),
+                    "usage": usage.to_dict()
+                }
+            })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# ============================================
+# BACKGROUND JOBS
+# ============================================
+
+@app.post("/jobs/analyze", response_model=JobResponse)
+async def submit_analysis_job(
+    user_profile: str = Form(...),
+    contest_text: str = Form(""),
+    contest_image: Optional[UploadFile] = File(None),
+    options: str = Form("{}"),
+    callback_url: Optional[str] = Form(None)
+):
+    """
+    Queue an analysis and return its job id right away.
+    
+    Args:
+        user_profile, contest_text, contest_image, options: Same as /analyze
+        callback_url: Optional http(s) URL that receives the finished JobInfo as a POST
+            (a WEBHOOK_ALLOWED_HOSTS host, or one resolving only to public addresses)
+    
+    Returns:
+        JobResponse with the queued job; poll GET /jobs/{id} for the result
+    """
+    profile, opts, image, error = await _parse_analysis_input(
+        user_profile, contest_text, contest_image, options
+    )
+    if not error and callback_url:
+        error = await check_webhook_url(callback_url)
+    if error:
+        return JobResponse(success=False, error=error)
     
-    # Perform analysis
     try:
-        result = await analyze_contest(
+        job = await get_job_queue().submit_analysis(
             profile=profile,
             contest_text=contest_text,
-            image_base64=image_base64,
-            options=opts
+            options=opts,
+            image_base64=image.base64 if image else None,
+            image_mime=image.mime_type if image else "image/jpeg",
+            callback_url=callback_url or None
         )
+    except QueueFull as e:
+        return JobResponse(success=False, error=str(e))
+    return JobResponse(success=True, data=job)
+
+
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="Seconds to long-poll for completion")
+):
+    """
+    Job status and, once finished, its analysis result or error.
+    
+    Args:
+        job_id: Id returned by POST /jobs/analyze
+        wait: Hold the request up to this many seconds (max MAX_JOB_WAIT_SECONDS) until the job finishes
+    """
+    queue = get_job_queue()
+    if wait > 0:
+        job = await queue.wait(job_id, min(wait, MAX_JOB_WAIT_SECONDS))
+    else:
+        job = await queue.get(job_id)
+    if job is None:
+        return JobResponse(success=False, error="Job not found")
+    return JobResponse(success=True, data=job)
+
+
+# ============================================
+# RECOMMENDATIONS
+# ============================================
+
+@app.post("/recommend", response_model=RecommendResponse)
+async def recommend(input_data: RecommendInput):
+    """
+    Rank a catalog of contests for one profile using local scoring only.
+    
+    Args:
+        input_data: Profile, contest catalog and topK
+    
+    Returns:
+        RecommendResponse with the top-k contests and their scores
+    """
+    start_time = time.perf_counter()
+    
+    if input_data.contests is not None and len(input_data.contests) > MAX_RECOMMEND_CONTESTS:
+        return RecommendResponse(
+            success=False,
+            error=f"Too many contests. Maximum: {MAX_RECOMMEND_CONTESTS}"
+        )
+    
+    try:
+        if input_data.contests is None:
+            catalog = get_catalog()
+            if catalog is None:
+                return RecommendResponse(success=False, error="Contest catalog is disabled")
+            # Catalog matrix is cached and only rebuilt after new contests are recorded
+            matrix = await asyncio.to_thread(catalog.ranking_matrix)
+            source = "catalog"
+        else:
+            matrix = ContestMatrix(input_data.contests)
+            source = "request"
         
-        processing_time = int((time.time() - start_time) * 1000)
-        
-        return AnalysisResponse(
+        ranked = rank_contests(input_data.userProfile, matrix, max(0, input_data.topK))
+        return RecommendResponse(
             success=True,
-            data=result,
+            data=ranked,
             meta={
-                "processingTime": processing_time,
-                "modelUsed": OPENAI_MODEL if is_api_key_valid() else "mock",
-                "aiMode": get_api_mode()
+                "processingTime": round((time.perf_counter() - start_time) * 1000, 2),
+                "candidates": len(matrix.contests),
+                "source": source
             }
         )
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Analysis error: {error_details}")  # 서버 콘솔에 상세 오류 출력
-        return AnalysisResponse(
+        return RecommendResponse(
             success=False,
-            error=f"Analysis failed: {str(e)}"
+            error=f"Recommendation failed: {str(e)}"
+        )
+
+
+# ============================================
+# CONTEST CATALOG
+# ============================================
+
+@app.get("/contests", response_model=CatalogResponse)
+async def list_contests(
+    category: Optional[str] = None,
+    deadlineFrom: Optional[str] = None,
+    deadlineTo: Optional[str] = None,
+    title: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_CATALOG_QUERY_LIMIT)
+):
+    """
+    Query previously analyzed/extracted contests.
+    
+    Args:
+        category: Exact category filter
+        deadlineFrom / deadlineTo: Deadline range (YYYY-MM-DD, inclusive)
+        title: Title match ignoring case, spacing and punctuation
+        limit: Maximum number of contests
+    
+    Returns:
+        CatalogResponse with matching contests
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return CatalogResponse(success=False, error="Contest catalog is disabled")
+    
+    try:
+        contests = await asyncio.to_thread(
+            catalog.search, category, deadlineFrom, deadlineTo, title, limit
         )
+        return CatalogResponse(success=True, data=contests, meta={"count": len(contests)})
+    except Exception as e:
+        return CatalogResponse(success=False, error=f"Catalog query failed: {str(e)}")
+
+
+@app.get("/contests/upcoming", response_model=CatalogResponse)
+async def upcoming_contests(
+    days: int = Query(14, ge=0, le=365),
+    category: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_CATALOG_QUERY_LIMIT)
+):
+    """Contests whose deadline is within the next `days` days, soonest first"""
+    catalog = get_catalog()
+    if catalog is None:
+        return CatalogResponse(success=False, error="Contest catalog is disabled")
+    
+    try:
+        contests = await asyncio.to_thread(catalog.upcoming, days, category, limit)
+        return CatalogResponse(success=True, data=contests, meta={"count": len(contests)})
+    except Exception as e:
+        return CatalogResponse(success=False, error=f"Catalog query failed: {str(e)}")
 
 
 # ============================================
@@ -195,50 +612,49 @@ async def analyze(
 
 @app.post("/extract", response_model=ExtractionResponse)
 async def extract(
-    image: UploadFile = File(...)
+    image: UploadFile = File(...),
+    x_request_timeout: Optional[float] = Header(None)
 ):
     """
     Extract contest information from an image.
     
     Args:
         image: Contest poster image
+        x_request_timeout: Seconds the client will wait (X-Request-Timeout header)
     
     Returns:
         ExtractionResponse with extracted data
     """
     
-    # Validate file type
-    if image.content_type not in ALLOWED_IMAGE_TYPES:
-        return ExtractionResponse(
-            success=False,
-            error=f"Invalid image type. Allowed: {', '.join(ALLOWED_IMAGE_TYPES)}"
-        )
+    span_since_request_start("request_parse")
     
-    try:
-        content = await image.read()
-        if len(content) > MAX_IMAGE_SIZE:
+    with track_request("/extract", get_api_mode()) as usage:
+        try:
+            prepared, error = await _prepare_upload_image(image)
+            if error:
+                usage.status = "error"
+                return ExtractionResponse(success=False, error=error)
+            
+            with request_deadline(_deadline_seconds(x_request_timeout)), span("extract"):
+                extracted, confidence, raw_text = await extract_from_image(
+                    prepared.base64, prepared.mime_type, prepared.dhash
+                )
+            
             return ExtractionResponse(
-                success=False,
-                error=f"Image too large. Maximum size: {MAX_IMAGE_SIZE // (1024*1024)}MB"
+                success=True,
+                data=ExtractionData(
+                    extracted=extracted,
+                    confidence=confidence,
+                    rawText=raw_text
+                ),
+                meta={"usage": usage.to_dict()}
             )
-        
-        image_base64 = base64.b64encode(content).decode('utf-8')
-        
-        extracted, confidence, raw_text = await extract_from_image(image_base64)
-        
-        return ExtractionResponse(
-            success=True,
-            data=ExtractionData(
-                extracted=extracted,
-                confidence=confidence,
-                rawText=raw_text
+        except Exception as e:
+            usage.status = "error"
+            return ExtractionResponse(
+                success=False,
+                error=f"Extraction failed: {str(e)}"
             )
-        )
-    except Exception as e:
-        return ExtractionResponse(
-            success=False,
-            error=f"Extraction failed: {str(e)}"
-        )
 
 
 # ============================================
@@ -271,6 +687,94 @@ async def assistant_suggest(context: AssistantContext):
         )
 
 
+# ============================================
+# SCHEDULE
+# ============================================
+
+@app.post("/schedule", response_model=ScheduleResponse)
+async def schedule(input_data: ScheduleInput):
+    """
+    Weekly plans for a user's contests sharing one hoursPerWeek budget.
+    
+    Args:
+        input_data: Profile, contests (deadline, totalHours, difficulty,
+            schedulePressure from their analyses) and optional userId/startDate
+    
+    Returns:
+        ScheduleResponse with total load per week and a scenario per contest.
+        With userId, contests unchanged since the previous call (and not
+        affected by an earlier-deadline change) are not recomputed.
+    """
+    start_time = time.time()
+    
+    contests = input_data.contests
+    if len(contests) > MAX_SCHEDULE_CONTESTS:
+        return ScheduleResponse(success=False, error=f"Too many contests. Maximum: {MAX_SCHEDULE_CONTESTS}")
+    if len({contest.id for contest in contests}) != len(contests):
+        return ScheduleResponse(success=False, error="Contest ids must be unique")
+    try:
+        start = date.fromisoformat(input_data.startDate) if input_data.startDate else date.today()
+    except ValueError:
+        return ScheduleResponse(success=False, error="startDate must be YYYY-MM-DD")
+    
+    planner = get_planner(input_data.userId, input_data.userProfile.hoursPerWeek or 10, start)
+    stats = planner.sync(contests)
+    
+    return _json_response(ScheduleResponse(
+        success=True,
+        data=planner.data(),
+        meta={**stats, "processingTime": int((time.time() - start_time) * 1000)}
+    ))
+
+
+# ============================================
+# PORTFOLIO
+# ============================================
+
+@app.post("/portfolio/optimize", response_model=PortfolioResponse)
+async def portfolio_optimize(input_data: PortfolioInput):
+    """
+    Choose the contests worth pursuing within the weekly hoursPerWeek budget.
+    
+    Args:
+        input_data: Profile, candidate contests (deadline, totalHours and the
+            portfolioValue/readiness scores from their analyses) and a mode:
+            "exact" (optimal), "heuristic" (greedy, for large inputs) or "auto"
+    
+    Returns:
+        PortfolioResponse with every contest marked selected or not (with a
+        reason), the total value and hours, and a weekly plan of the selection
+    """
+    start_time = time.time()
+    
+    contests = input_data.contests
+    if len(contests) > MAX_PORTFOLIO_CONTESTS:
+        return PortfolioResponse(success=False, error=f"Too many contests. Maximum: {MAX_PORTFOLIO_CONTESTS}")
+    if len({contest.id for contest in contests}) != len(contests):
+        return PortfolioResponse(success=False, error="Contest ids must be unique")
+    if input_data.mode not in PORTFOLIO_MODES:
+        return PortfolioResponse(success=False, error=f"mode must be one of: {', '.join(PORTFOLIO_MODES)}")
+    try:
+        start = date.fromisoformat(input_data.startDate) if input_data.startDate else date.today()
+    except ValueError:
+        return PortfolioResponse(success=False, error="startDate must be YYYY-MM-DD")
+    
+    solve_started = time.perf_counter()
+    data, meta = await asyncio.to_thread(
+        optimize_portfolio, contests, input_data.userProfile.hoursPerWeek or 10, input_data.mode, start
+    )
+    
+    return _json_response(PortfolioResponse(
+        success=True,
+        data=data,
+        meta={
+            **meta,
+            "solveMs": round((time.perf_counter() - solve_started) * 1000, 2),
+            "processingTime": int((time.time() - start_time) * 1000),
+        }
+    ))
+
+
 # ============================================
 # READINESS
 # ============================================
@@ -305,6 +809,116 @@ async def readiness(input_data: ReadinessInput):
         )
 
 
+@app.post("/readiness/batch", response_model=ReadinessBatchResponse)
+async def readiness_batch(input_data: ReadinessBatchInput):
+    """
+    Readiness for many contest/progress pairs of one profile in one call.
+    
+    Args:
+        input_data: Profile and items of contest + currentProgress
+    
+    Returns:
+        ReadinessBatchResponse with one item per input, in order, each equal
+        to what /readiness returns for that contest and progress
+    """
+    start_time = time.time()
+    
+    items = input_data.items
+    if len(items) > MAX_READINESS_BATCH_ITEMS:
+        return ReadinessBatchResponse(success=False, error=f"Too many items. Maximum: {MAX_READINESS_BATCH_ITEMS}")
+    
+    results = calculate_readiness_batch(input_data.userProfile, [item.currentProgress for item in items])
+    
+    return _json_response(ReadinessBatchResponse(
+        success=True,
+        data=results,
+        meta={
+            "items": len(results),
+            "failed": sum(not item.success for item in results),
+            "processingTime": int((time.time() - start_time) * 1000),
+        }
+    ))
+
+
+@app.post("/readiness/track", response_model=ReadinessStateResponse)
+async def readiness_track(input_data: ReadinessTrackInput):
+    """
+    Start (or reset) server-side readiness tracking of one contest for a user.
+    
+    Args:
+        input_data: userId, contestId, currentProgress, and userProfile
+            (required the first time; sending it again updates every
+            tracked contest of the user)
+    
+    Returns:
+        ReadinessStateResponse with the changed states, this contest first.
+        Subscribers of GET /readiness/{userId}/events receive the same states.
+    """
+    try:
+        states = get_readiness_tracker().track(
+            input_data.userId, input_data.contestId, input_data.userProfile, input_data.currentProgress
+        )
+    except ValueError as e:
+        return ReadinessStateResponse(success=False, error=str(e))
+    
+    return ReadinessStateResponse(success=True, data=states)
+
+
+@app.post("/readiness/delta", response_model=ReadinessStateResponse)
+async def readiness_delta(input_data: ReadinessDeltaInput):
+    """
+    Apply checklist changes (doneDelta/totalDelta per contest) to tracked
+    contests instead of re-sending the whole /readiness input.
+    
+    Args:
+        input_data: userId and delta events, applied in order
+    
+    Returns:
+        ReadinessStateResponse with the new state of each changed contest
+    """
+    if len(input_data.events) > MAX_READINESS_DELTA_EVENTS:
+        return ReadinessStateResponse(success=False, error=f"Too many events. Maximum: {MAX_READINESS_DELTA_EVENTS}")
+    
+    try:
+        states = get_readiness_tracker().apply(input_data.userId, input_data.events)
+    except ValueError as e:
+        return ReadinessStateResponse(success=False, error=str(e))
+    
+    return ReadinessStateResponse(success=True, data=states, meta={"events": len(input_data.events)})
+
+
+@app.get("/readiness/{user_id}/events")
+async def readiness_events(user_id: str):
+    """
+    Stream a user's readiness changes as server-sent events.
+    
+    Events:
+        snapshot - list of the user's current ReadinessState;
+        update - a changed ReadinessState (if several changes arrive before
+        the client reads, only the latest per contest is sent)
+    """
+    tracker = get_readiness_tracker()
+    subscription, snapshot = tracker.subscribe(user_id)
+    
+    async def event_stream():
+        try:
+            yield format_sse("snapshot", [state.model_dump() for state in snapshot])
+            while True:
+                states = await subscription.next(READINESS_KEEPALIVE_SECONDS)
+                if not states:
+                    yield ": keepalive\n\n"
+                for state in states:
+                    yield format_sse("update", state.model_dump())
+        finally:
+            tracker.unsubscribe(user_id, subscription)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 # ============================================
 # RUN SERVER
 # ============================================
@@ -1,8 +1,8 @@
 """
 Pydantic schemas for request/response validation
 """
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
 
 
 # ============================================
@@ -34,12 +34,85 @@ class AssistantContext(BaseModel):
     type: str = "proactive"
 
 
+class BatchAnalysisInput(BaseModel):
+    userProfile: UserProfileInput
+    contests: List[str]
+    options: Optional[dict] = None
+    packSize: int = 1  # >1: pack up to N short contests into one model request
+
+
+class RecommendInput(BaseModel):
+    userProfile: UserProfileInput
+    contests: Optional[List["ContestInfo"]] = None  # None이면 서버 카탈로그 전체에서 추천
+    topK: int = 10
+
+
+class ScheduleContestInput(BaseModel):
+    id: str
+    title: Optional[str] = None
+    deadline: Optional[str] = None  # YYYY-MM-DD
+    category: Optional[str] = None
+    # 분석 결과의 scenario.totalHours, scores.difficulty.score, scores.schedulePressure.score
+    totalHours: Optional[int] = None
+    difficulty: Optional[int] = None
+    schedulePressure: Optional[int] = None
+    priority: int = 0  # 마감이 같은 주이면 높은 쪽이 먼저 시간 배정
+
+
+class ScheduleInput(BaseModel):
+    userId: Optional[str] = None  # 지정하면 이전 요청과 비교해 바뀐 공모전부터만 다시 계산
+    userProfile: UserProfileInput
+    contests: List[ScheduleContestInput]
+    startDate: Optional[str] = None  # YYYY-MM-DD, 기본값 오늘
+
+
+class PortfolioContestInput(ScheduleContestInput):
+    # 분석 결과의 scores.portfolioValue.score, scores.readiness.score
+    portfolioValue: Optional[int] = None
+    readiness: Optional[int] = None
+
+
+class PortfolioInput(BaseModel):
+    userProfile: UserProfileInput
+    contests: List[PortfolioContestInput]
+    mode: str = "auto"  # "heuristic" | "exact" | "auto"
+    startDate: Optional[str] = None  # YYYY-MM-DD, 기본값 오늘
+
+
 class ReadinessInput(BaseModel):
     userProfile: UserProfileInput
     contest: dict
     currentProgress: Optional[dict] = None
 
 
+class ReadinessProgressInput(BaseModel):
+    contest: dict = {}
+    currentProgress: Optional[dict] = None
+
+
+class ReadinessBatchInput(BaseModel):
+    userProfile: UserProfileInput
+    items: List[ReadinessProgressInput]  # 공모전별 진행 상황 (같은 공모전의 여러 시점도 가능)
+
+
+class ReadinessTrackInput(BaseModel):
+    userId: str
+    contestId: str
+    userProfile: Optional[UserProfileInput] = None  # 보내면 이 사용자의 모든 공모전에 반영
+    currentProgress: Optional[dict] = None
+
+
+class ReadinessDeltaEvent(BaseModel):
+    contestId: str
+    doneDelta: int = 0  # 완료한 체크리스트 항목 수 변화
+    totalDelta: int = 0  # 전체 체크리스트 항목 수 변화
+
+
+class ReadinessDeltaInput(BaseModel):
+    userId: str
+    events: List[ReadinessDeltaEvent]
+
+
 # ============================================
 # Response Schemas
 # ============================================
@@ -120,6 +193,67 @@ class ParticipationScenario(BaseModel):
     weeks: List[ScenarioWeek]
 
 
+class SchedulePhase(BaseModel):
+    id: str
+    label: str
+    hours: int
+    priority: str  # "must" | "nice"
+    startWeek: Optional[int] = None  # 1-based, None if no time was allocated
+    endWeek: Optional[int] = None
+
+
+class ContestSchedule(BaseModel):
+    id: str
+    title: Optional[str] = None
+    scenario: ParticipationScenario
+    phases: List[SchedulePhase]
+    shortfallHours: int = 0
+
+
+class ScheduleWeekLoad(BaseModel):
+    week: int  # 1-based
+    startDate: str
+    hours: float
+    utilization: float
+
+
+class ScheduleData(BaseModel):
+    weeklyBudget: int
+    weeks: List[ScheduleWeekLoad]
+    contests: List[ContestSchedule]
+
+
+class ScheduleResponse(BaseModel):
+    success: bool
+    data: Optional[ScheduleData] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
+class PortfolioItem(BaseModel):
+    id: str
+    title: Optional[str] = None
+    selected: bool
+    value: float  # portfolioValue x readiness / 100
+    hours: int
+    deadline: Optional[str] = None
+    reason: Optional[str] = None
+
+
+class PortfolioData(BaseModel):
+    items: List[PortfolioItem]
+    totalValue: float
+    totalHours: int
+    schedule: ScheduleData  # 선택한 공모전의 주차별 계획
+
+
+class PortfolioResponse(BaseModel):
+    success: bool
+    data: Optional[PortfolioData] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
 class AnalysisResult(BaseModel):
     recommendation: str
     scores: AnalysisScores
@@ -155,6 +289,60 @@ class AnalysisResponse(BaseModel):
     meta: Optional[dict] = None
 
 
+class BatchAnalysisItem(BaseModel):
+    index: int
+    success: bool
+    data: Optional[AnalysisData] = None
+    error: Optional[str] = None
+
+
+class JobInfo(BaseModel):
+    id: str
+    status: str  # queued | running | succeeded | failed
+    attempts: int = 0
+    createdAt: float
+    startedAt: Optional[float] = None
+    finishedAt: Optional[float] = None
+    result: Optional[AnalysisData] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
+class JobResponse(BaseModel):
+    success: bool
+    data: Optional[JobInfo] = None
+    error: Optional[str] = None
+
+
+class RecommendedContest(BaseModel):
+    index: int
+    contest: ContestInfo
+    score: int
+    scores: Dict[str, int]
+
+
+class RecommendResponse(BaseModel):
+    success: bool
+    data: Optional[List[RecommendedContest]] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
+class CatalogContest(BaseModel):
+    id: int
+    contest: ContestInfo
+    hasAnalysis: bool = False
+    hasExtraction: bool = False
+    updatedAt: float
+
+
+class CatalogResponse(BaseModel):
+    success: bool
+    data: Optional[List[CatalogContest]] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
 class ExtractedInfo(BaseModel):
     title: Optional[str] = None
     organizer: Optional[str] = None
@@ -180,6 +368,7 @@ class ExtractionResponse(BaseModel):
     success: bool
     data: Optional[ExtractionData] = None
     error: Optional[str] = None
+    meta: Optional[dict] = None
 
 
 class AssistantAction(BaseModel):
@@ -223,3 +412,109 @@ class ReadinessResponse(BaseModel):
     success: bool
     data: Optional[ReadinessData] = None
     error: Optional[str] = None
+
+
+class ReadinessState(BaseModel):
+    contestId: str
+    version: int  # 상태가 바뀔 때마다 1씩 증가
+    checklistDone: int
+    checklistTotal: int
+    data: ReadinessData
+    updatedAt: float
+
+
+class ReadinessStateResponse(BaseModel):
+    success: bool
+    data: Optional[List[ReadinessState]] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
+class ReadinessBatchItem(BaseModel):
+    index: int
+    success: bool
+    data: Optional[ReadinessData] = None
+    error: Optional[str] = None
+
+
+class ReadinessBatchResponse(BaseModel):
+    success: bool
+    data: Optional[List[ReadinessBatchItem]] = None
+    error: Optional[str] = None
+    meta: Optional[dict] = None
+
+
+# ============================================
+# Model Output Schemas
+# ============================================
+# GPT 응답(JSON) 형식. 구조화 출력용 JSON 스키마 생성과 응답 검증에 함께 사용되며,
+# 기본값은 모델이 항목을 빠뜨렸을 때의 대체값입니다.
+
+class ModelContestInfo(ContestInfo):
+    title: Optional[str] = "분석된 공모전"
+    category: Optional[str] = "일반"
+    requirements: Optional[List[str]] = Field(default_factory=list)
+    prizes: Optional[List[str]] = Field(default_factory=list)
+
+
+class ModelStrategicVerdict(StrategicVerdict):
+    summary: str = "분석 완료"
+    fitType: str = "risky"
+    confidence: float = 0.7
+
+
+class ModelScenario(BaseModel):
+    totalHours: int = 80
+    weeksNeeded: int = 4
+    feasible: bool = True
+    conclusion: str = "참가 가능"
+
+
+class DigestOutput(BaseModel):
+    contestInfo: Optional[ModelContestInfo] = None
+    hiddenExpectations: Optional[List[HiddenExpectation]] = None
+    requiredSkills: Optional[List[str]] = None
+    difficulty: Optional[float] = None
+    estimatedHours: Optional[float] = None
+
+
+class NarrativeOutput(BaseModel):
+    strategicVerdict: Optional[ModelStrategicVerdict] = None
+    recommendation: Optional[str] = None
+    opportunities: Optional[List[str]] = None
+    warnings: Optional[List[str]] = None
+    dealBreakers: Optional[List[DealBreaker]] = None
+    checklist: Optional[List[ChecklistItem]] = None
+    scenario: Optional[ModelScenario] = None
+
+
+class ScoreOutput(NarrativeOutput):
+    scores: Optional[AnalysisScores] = None
+
+
+class AnalyzeOutput(BaseModel):
+    # 스트리밍 시 섹션이 이 순서로 도착하므로 프롬프트와 같은 순서를 유지합니다.
+    contestInfo: Optional[ModelContestInfo] = None
+    strategicVerdict: Optional[ModelStrategicVerdict] = None
+    scores: Optional[AnalysisScores] = None
+    recommendation: Optional[str] = None
+    opportunities: Optional[List[str]] = None
+    warnings: Optional[List[str]] = None
+    hiddenExpectations: Optional[List[HiddenExpectation]] = None
+    dealBreakers: Optional[List[DealBreaker]] = None
+    checklist: Optional[List[ChecklistItem]] = None
+    scenario: Optional[ModelScenario] = None
+
+
+class BatchOutput(BaseModel):
+    results: List[AnalyzeOutput]
+
+
+class ModelExtractionConfidence(ExtractionConfidence):
+    title: str = "medium"
+
+
+class ExtractOutput(ExtractedInfo):
+    category: Optional[str] = "일반"
+    rawText: Optional[str] = ""
+    confidence: Optional[ModelExtractionConfidence] = None
@@ -0,0 +1,109 @@
+"""
+Batch Service - Many contests against one profile
+
+This module provides:
+- Bounded-concurrency analysis of a list of contests
+- Optional packing of short contests into one model request
+- Per-item results yielded as soon as each finishes
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, List
+
+from config import BATCH_MAX_CONCURRENCY, BATCH_PACK_MAX_CHARS, get_api_mode
+from schemas import UserProfileInput, BatchAnalysisItem
+from services.gpt_service import analyze_contest, analyze_packed_with_gpt
+from services.rate_limit_service import PRIORITY_BACKGROUND, request_priority
+
+logger = logging.getLogger(__name__)
+
+
+def plan_batch(contest_texts: List[str], pack_size: int) -> List[List[int]]:
+    """
+    Group contest indexes into work units.
+    Short contests are packed pack_size at a time; long ones run alone.
+    """
+    if pack_size <= 1:
+        return [[i] for i in range(len(contest_texts))]
+    
+    units = []
+    pack = []
+    for i, text in enumerate(contest_texts):
+        if len(text) > BATCH_PACK_MAX_CHARS:
+            units.append([i])
+            continue
+        pack.append(i)
+        if len(pack) == pack_size:
+            units.append(pack)
+            pack = []
+    if pack:
+        units.append(pack)
+    return units
+
+
+async def _analyze_one(
+    index: int,
+    profile: UserProfileInput,
+    contest_text: str,
+    options: dict
+) -> BatchAnalysisItem:
+    try:
+        result = await analyze_contest(profile=profile, contest_text=contest_text, options=options)
+        return BatchAnalysisItem(index=index, success=True, data=result)
+    except Exception as e:
+        logger.error(f"Batch item {index} failed: {e}")
+        return BatchAnalysisItem(index=index, success=False, error=f"Analysis failed: {str(e)}")
+
+
+async def _run_unit(
+    unit: List[int],
+    profile: UserProfileInput,
+    contest_texts: List[str],
+    options: dict
+) -> List[BatchAnalysisItem]:
+    if len(unit) > 1:
+        try:
+            results = await analyze_packed_with_gpt(
+                profile, [contest_texts[i] for i in unit], options
+            )
+            return [
+                BatchAnalysisItem(index=i, success=True, data=result)
+                for i, result in zip(unit, results)
+            ]
+        except Exception as e:
+            # Fall back to one request per contest
+            logger.warning(f"Packed analysis of {len(unit)} contests failed, retrying individually: {e}")
+    
+    return list(await asyncio.gather(*(
+        _analyze_one(i, profile, contest_texts[i], options) for i in unit
+    )))
+
+
+async def analyze_batch(
+    profile: UserProfileInput,
+    contest_texts: List[str],
+    options: dict = None,
+    pack_size: int = 1
+) -> AsyncIterator[BatchAnalysisItem]:
+    """Analyze contests with bounded concurrency, yielding items as they finish"""
+    # Packing only helps real model calls; mock analysis is already local
+    if get_api_mode() != "real":
+        pack_size = 1
+    
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+    
+    async def run(unit: List[int]) -> List[BatchAnalysisItem]:
+        # Batch work yields the rate budget to interactive /analyze requests
+        with request_priority(PRIORITY_BACKGROUND):
+            async with semaphore:
+                return await _run_unit(unit, profile, contest_texts, options)
+    
+    tasks = [asyncio.create_task(run(unit)) for unit in plan_batch(contest_texts, pack_size)]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            for item in await finished:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,262 @@
+"""
+Cache Service - Content-addressed result caches
+
+This module provides:
+- Stable cache keys from normalized request parts
+- In-process LRU cache with TTL
+- Optional on-disk SQLite cache with the same interface, run in a worker
+  thread for async callers
+- Hit/miss counters for the health endpoint
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# A cache hit refreshes the on-disk last_access at most this often; LRU order only needs to be coarse
+ACCESS_GRANULARITY_SECONDS = 60
+
+
+# ============================================
+# KEY HELPERS
+# ============================================
+
+def normalize_text(text: Optional[str]) -> str:
+    """Collapse whitespace so formatting-only differences share a key"""
+    return " ".join((text or "").split())
+
+
+def make_cache_key(*parts) -> str:
+    """Build a sha256 key from text, dict, list or None parts"""
+    hasher = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (dict, list)):
+            part = json.dumps(part, sort_keys=True, ensure_ascii=False)
+        elif part is None:
+            part = ""
+        hasher.update(str(part).encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+def digest_bytes(data: Optional[str]) -> Optional[str]:
+    """Short digest of a (base64) payload such as an uploaded image"""
+    if not data:
+        return None
+    return hashlib.sha256(data.encode("utf-8") if isinstance(data, str) else data).hexdigest()
+
+
+# ============================================
+# CACHE BACKENDS
+# ============================================
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache with per-entry TTL"""
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: int):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, count: bool = True) -> Optional[str]:
+        """Value for key, or None; count=False leaves the hit/miss counters to the caller"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += count
+                return None
+            self._entries.move_to_end(key)
+            self.hits += count
+            return entry[1]
+
+    async def aget(self, key: str, count: bool = True) -> Optional[str]:
+        """get() for async callers; the in-process cache never blocks"""
+        return self.get(key, count)
+
+    async def aset(self, key: str, value: str) -> None:
+        self.set(key, value)
+
+    def record_hit(self) -> None:
+        """Count a hit resolved outside get() (e.g. by a secondary index)"""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a miss resolved outside get() (e.g. by a secondary index)"""
+        with self._lock:
+            self.misses += 1
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "backend": "memory",
+            "size": self.size(),
+            "maxEntries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+class SQLiteCache(MemoryCache):
+    """On-disk LRU cache with TTL, shared across restarts and workers"""
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: int, path: str):
+        super().__init__(name, max_entries, ttl_seconds)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS cache_{name} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_cache_{name}_access ON cache_{name}(last_access)"
+        )
+        self._conn.commit()
+        # Rows as of this process's last write; other workers sharing the file
+        # are caught up with at the next eviction
+        self._count = self._conn.execute(f"SELECT COUNT(*) FROM cache_{name}").fetchone()[0]
+
+    async def aget(self, key: str, count: bool = True) -> Optional[str]:
+        return await asyncio.to_thread(self.get, key, count)
+
+    async def aset(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    def get(self, key: str, count: bool = True) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT value, expires_at, last_access FROM cache_{self.name} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] < now:
+                if row is not None:
+                    self._count -= self._conn.execute(
+                        f"DELETE FROM cache_{self.name} WHERE key = ?", (key,)
+                    ).rowcount
+                    self._conn.commit()
+                self.misses += count
+                return None
+            if now - row[2] >= ACCESS_GRANULARITY_SECONDS:
+                self._conn.execute(
+                    f"UPDATE cache_{self.name} SET last_access = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+            self.hits += count
+            return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute(
+                f"SELECT 1 FROM cache_{self.name} WHERE key = ?", (key,)
+            ).fetchone() is not None
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO cache_{self.name} (key, value, expires_at, last_access) "
+                f"VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now),
+            )
+            self._count += not exists
+            if self._count > self.max_entries:
+                # Keeps exactly the newest max_entries, whatever other workers wrote meanwhile
+                evicted = self._conn.execute(
+                    f"DELETE FROM cache_{self.name} WHERE key NOT IN ("
+                    f"SELECT key FROM cache_{self.name} ORDER BY last_access DESC LIMIT ?)",
+                    (self.max_entries,),
+                ).rowcount
+                self.evictions += evicted
+                self._count = self.max_entries if evicted else \
+                    self._conn.execute(f"SELECT COUNT(*) FROM cache_{self.name}").fetchone()[0]
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute(f"DELETE FROM cache_{self.name}")
+            self._conn.commit()
+            self._count = 0
+
+    def keys(self) -> list:
+        with self._lock:
+            rows = self._conn.execute(f"SELECT key FROM cache_{self.name}").fetchall()
+        return [row[0] for row in rows]
+
+    def size(self) -> int:
+        with self._lock:
+            return self._count
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["backend"] = "sqlite"
+        return stats
+
+
+# ============================================
+# REGISTRY
+# ============================================
+
+_caches = {}
+
+
+def create_cache(
+    name: str,
+    backend: str,
+    max_entries: int,
+    ttl_seconds: int,
+    path: Optional[str] = None
+) -> MemoryCache:
+    """Create and register a named cache ("memory" or "sqlite" backend)"""
+    if backend == "sqlite" and path:
+        try:
+            cache = SQLiteCache(name, max_entries, ttl_seconds, path)
+        except sqlite3.Error as e:
+            logger.error(f"SQLite cache unavailable, using memory cache: {e}")
+            cache = MemoryCache(name, max_entries, ttl_seconds)
+    else:
+        cache = MemoryCache(name, max_entries, ttl_seconds)
+    _caches[name] = cache
+    return cache
+
+
+def get_cache_stats() -> dict:
+    """Stats for every registered cache, keyed by name"""
+    return {name: cache.stats() for name, cache in _caches.items()}
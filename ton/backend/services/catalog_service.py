@@ -0,0 +1,269 @@
+"""
+Catalog Service - Persistent server-side contest catalog
+
+This module provides:
+- SQLite storage of analyzed contests with digest, extraction and analysis results
+- Indexed lookups by category, deadline, normalized title and content key
+- A cached ranking matrix of the whole catalog for recommendations
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from typing import Collection, List, Optional
+
+from config import CATALOG_PATH
+from schemas import ContestInfo, CatalogContest
+from services.cache_service import make_cache_key, normalize_text, digest_bytes
+
+logger = logging.getLogger(__name__)
+
+_TITLE_NOISE = re.compile(r"[\W_]+")
+
+
+def title_hash(title: Optional[str]) -> Optional[str]:
+    """Hash of a title with case, spacing and punctuation removed"""
+    if not title:
+        return None
+    normalized = _TITLE_NOISE.sub("", title.lower())
+    if not normalized:
+        return None
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+class ContestCatalog:
+    """SQLite-backed contest catalog, safe to share across requests"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._version = 0
+        self._matrix = None
+        self._matrix_version = -1
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS contests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title_hash TEXT,
+                content_key TEXT,
+                title TEXT,
+                category TEXT,
+                deadline TEXT,
+                contest_json TEXT NOT NULL,
+                digest_json TEXT,
+                digest_version TEXT,
+                extraction_json TEXT,
+                analysis_json TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_contests_category ON contests(category);
+            CREATE INDEX IF NOT EXISTS idx_contests_deadline ON contests(deadline);
+            CREATE INDEX IF NOT EXISTS idx_contests_content_key ON contests(content_key);
+            CREATE INDEX IF NOT EXISTS idx_contests_title_hash ON contests(title_hash);
+        """)
+        self._conn.commit()
+
+    # ----- writes -----
+
+    def upsert(
+        self,
+        contest: ContestInfo,
+        content_key: Optional[str] = None,
+        digest: Optional[dict] = None,
+        extraction: Optional[dict] = None,
+        analysis: Optional[dict] = None,
+        digest_version: Optional[str] = None
+    ) -> int:
+        """
+        Insert or update a contest, matched by content key. Without a content
+        key match, a row with the same normalized title is reused only if it
+        has no content key of its own (e.g. stored from a poster extraction),
+        so different contests with the same generic title stay separate.
+        Result columns that are None keep their stored value. digest_version
+        identifies the prompt and model that produced the digest.
+        """
+        now = time.time()
+        key = title_hash(contest.title)
+        values = {
+            "content_key": content_key,
+            "title": contest.title,
+            "category": contest.category,
+            "deadline": contest.deadline,
+            "contest_json": contest.model_dump_json(),
+            "digest_json": json.dumps(digest, ensure_ascii=False) if digest is not None else None,
+            "digest_version": digest_version if digest is not None else None,
+            "extraction_json": json.dumps(extraction, ensure_ascii=False) if extraction is not None else None,
+            "analysis_json": json.dumps(analysis, ensure_ascii=False) if analysis is not None else None,
+        }
+        with self._lock:
+            row = None
+            if content_key:
+                row = self._conn.execute(
+                    "SELECT id FROM contests WHERE content_key = ? ORDER BY updated_at DESC LIMIT 1",
+                    (content_key,),
+                ).fetchone()
+            if row is None and key:
+                row = self._conn.execute(
+                    "SELECT id FROM contests WHERE title_hash = ? AND content_key IS NULL "
+                    "ORDER BY updated_at DESC LIMIT 1",
+                    (key,),
+                ).fetchone()
+
+            if row is None:
+                cursor = self._conn.execute(
+                    "INSERT INTO contests (title_hash, content_key, title, category, deadline, contest_json, "
+                    "digest_json, digest_version, extraction_json, analysis_json, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, *values.values(), now, now),
+                )
+                contest_id = cursor.lastrowid
+            else:
+                contest_id = row["id"]
+                assignments = ", ".join(f"{column} = COALESCE(?, {column})" for column in values)
+                self._conn.execute(
+                    f"UPDATE contests SET {assignments}, updated_at = ? WHERE id = ?",
+                    (*values.values(), now, contest_id),
+                )
+            self._conn.commit()
+            self._version += 1
+        return contest_id
+
+    # ----- reads -----
+
+    def _rows_to_contests(self, rows) -> List[CatalogContest]:
+        return [
+            CatalogContest(
+                id=row["id"],
+                contest=ContestInfo.model_validate_json(row["contest_json"]),
+                hasAnalysis=row["analysis_json"] is not None,
+                hasExtraction=row["extraction_json"] is not None,
+                updatedAt=row["updated_at"],
+            )
+            for row in rows
+        ]
+
+    def get(self, contest_id: int) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM contests WHERE id = ?", (contest_id,)).fetchone()
+
+    def find_digest(self, content_key: str, versions: Collection[str]) -> Optional[dict]:
+        """Stored digest for the same contest text/image made by one of `versions`, if any"""
+        versions = list(versions)
+        if not versions:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest_json FROM contests WHERE content_key = ? AND digest_json IS NOT NULL "
+                f"AND digest_version IN ({', '.join('?' * len(versions))}) "
+                "ORDER BY updated_at DESC LIMIT 1",
+                (content_key, *versions),
+            ).fetchone()
+        return json.loads(row["digest_json"]) if row else None
+
+    def search(
+        self,
+        category: Optional[str] = None,
+        deadline_from: Optional[str] = None,
+        deadline_to: Optional[str] = None,
+        title: Optional[str] = None,
+        limit: int = 100
+    ) -> List[CatalogContest]:
+        """Filter by category, deadline range (YYYY-MM-DD) and/or exact normalized title"""
+        clauses, params = [], []
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if deadline_from:
+            clauses.append("deadline >= ?")
+            params.append(deadline_from)
+        if deadline_to:
+            clauses.append("deadline <= ?")
+            params.append(deadline_to)
+        if title:
+            clauses.append("title_hash = ?")
+            params.append(title_hash(title))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "deadline" if deadline_from or deadline_to else "updated_at DESC"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM contests {where} ORDER BY {order} LIMIT ?", (*params, limit)
+            ).fetchall()
+        return self._rows_to_contests(rows)
+
+    def upcoming(self, days: int, category: Optional[str] = None, limit: int = 100) -> List[CatalogContest]:
+        """Contests whose deadline falls within the next `days` days"""
+        today = date.today()
+        return self.search(
+            category=category,
+            deadline_from=today.isoformat(),
+            deadline_to=(today + timedelta(days=days)).isoformat(),
+            limit=limit,
+        )
+
+    def contest_infos(self) -> List[ContestInfo]:
+        with self._lock:
+            rows = self._conn.execute("SELECT contest_json FROM contests ORDER BY id").fetchall()
+        return [ContestInfo.model_validate_json(row["contest_json"]) for row in rows]
+
+    def ranking_matrix(self):
+        """ContestMatrix of the whole catalog, rebuilt only after writes"""
+        from services.ranking_service import ContestMatrix
+
+        if self._matrix_version != self._version or self._matrix is None:
+            version = self._version
+            self._matrix = ContestMatrix(self.contest_infos())
+            self._matrix_version = version
+        return self._matrix
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM contests").fetchone()[0]
+
+    def stats(self) -> dict:
+        return {"contests": self.count(), "path": self.path}
+
+
+_catalog: Optional[ContestCatalog] = None
+_catalog_opened = False
+
+
+def get_catalog() -> Optional[ContestCatalog]:
+    """Shared catalog opened on first use; None when CATALOG_PATH is empty or unusable"""
+    global _catalog, _catalog_opened
+    if not _catalog_opened:
+        _catalog_opened = True
+        if CATALOG_PATH:
+            try:
+                _catalog = ContestCatalog(CATALOG_PATH)
+            except sqlite3.Error as e:
+                logger.error(f"Contest catalog unavailable: {e}")
+    return _catalog
+
+
+def contest_key(contest_text: str, image_base64: Optional[str] = None) -> str:
+    """Model-independent key for the same contest text and poster"""
+    return make_cache_key("contest", normalize_text(contest_text), digest_bytes(image_base64))
+
+
+def record_contest(
+    contest: Optional[ContestInfo],
+    content_key: Optional[str] = None,
+    **results
+) -> Optional[int]:
+    """Best-effort catalog write; failures are logged and never break a request"""
+    catalog = get_catalog()
+    if catalog is None or contest is None or not (contest.title or content_key):
+        return None
+    try:
+        return catalog.upsert(contest, content_key, **results)
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to record contest in catalog: {e}")
+        return None
@@ -0,0 +1,73 @@
+"""
+Coalesce Service - Single-flight deduplication of identical in-flight work
+
+This module provides:
+- SingleFlight groups that run one upstream call per key at a time
+- Sharing of that call's result (or error) with every concurrent caller
+- Leader/coalesced counters for the health endpoint
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key await the first caller's task instead
+    of starting their own. The task is shielded, so a disconnecting client
+    does not cancel the work other callers are waiting on.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            self.coalesced += 1
+            logger.info(f"Coalesced identical in-flight {self.name} request")
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the error as retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        total = self.leaders + self.coalesced
+        return {
+            "inflight": len(self._inflight),
+            "upstreamCalls": self.leaders,
+            "coalesced": self.coalesced,
+            "coalescedRate": round(self.coalesced / total, 4) if total else 0.0,
+        }
+
+
+_groups: Dict[str, SingleFlight] = {}
+
+
+def create_single_flight(name: str) -> SingleFlight:
+    """Create and register a named single-flight group"""
+    group = SingleFlight(name)
+    _groups[name] = group
+    return group
+
+
+def get_coalescing_stats() -> dict:
+    """Stats for every registered group, keyed by name"""
+    return {name: group.stats() for name, group in _groups.items()}
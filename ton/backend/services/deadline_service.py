@@ -0,0 +1,51 @@
+"""
+Deadline Service - Per-request time budget
+
+This module provides:
+- A request deadline carried in a contextvar (inherited by spawned tasks)
+- Remaining-time lookups for upstream calls and retries
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """The request's time budget ran out before the upstream call finished"""
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]):
+    """Bound everything inside to `seconds` from now (None: no deadline)"""
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(deadline if current is None else min(current, deadline))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one"""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def bounded(timeout: float) -> float:
+    """`timeout` shortened to the remaining deadline; raises once it has passed"""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded("Request deadline exceeded")
+    return min(timeout, left)
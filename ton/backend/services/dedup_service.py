@@ -0,0 +1,99 @@
+"""
+Dedup Service - Near-duplicate lookup for perceptual image hashes
+
+This module provides:
+- 64-bit difference hash (dHash) of a decoded image
+- Multi-index hash table for Hamming-distance nearest-neighbour lookup
+"""
+
+import base64
+import io
+from typing import Optional, Tuple
+
+from PIL import Image
+
+HASH_BITS = 64
+
+
+def compute_dhash(image: Image.Image) -> int:
+    """64-bit difference hash: brightness gradient of a 9x8 grayscale thumbnail"""
+    small = image.convert("L").resize((9, 8), Image.LANCZOS)
+    pixels = small.tobytes()
+    value = 0
+    for row in range(8):
+        offset = row * 9
+        for col in range(8):
+            value = (value << 1) | (pixels[offset + col] < pixels[offset + col + 1])
+    return value
+
+
+def dhash_from_base64(image_base64: str) -> Optional[int]:
+    """dHash of a base64-encoded image, or None if it cannot be decoded"""
+    try:
+        return compute_dhash(Image.open(io.BytesIO(base64.b64decode(image_base64))))
+    except Exception:
+        return None
+
+
+class PerceptualIndex:
+    """
+    Multi-index hashing over Hamming space.
+    
+    The hash is split into max_distance + 1 bands; by the pigeonhole principle
+    any hash within max_distance matches at least one band exactly, so only
+    hashes sharing a band are compared instead of the whole index.
+    """
+
+    def __init__(self, max_distance: int):
+        self.max_distance = max_distance
+        num_bands = min(max_distance + 1, HASH_BITS)
+        bounds = [round(i * HASH_BITS / num_bands) for i in range(num_bands + 1)]
+        self._bands = [(start, end - start) for start, end in zip(bounds, bounds[1:])]
+        self._tables = [{} for _ in self._bands]
+        self._hashes = set()
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def _band_values(self, value: int):
+        for start, width in self._bands:
+            yield (value >> start) & ((1 << width) - 1)
+
+    def add(self, value: int) -> None:
+        if value in self._hashes:
+            return
+        self._hashes.add(value)
+        for table, band in zip(self._tables, self._band_values(value)):
+            table.setdefault(band, set()).add(value)
+
+    def remove(self, value: int) -> None:
+        if value not in self._hashes:
+            return
+        self._hashes.discard(value)
+        for table, band in zip(self._tables, self._band_values(value)):
+            bucket = table.get(band)
+            if bucket is not None:
+                bucket.discard(value)
+                if not bucket:
+                    del table[band]
+
+    def clear(self) -> None:
+        self._hashes.clear()
+        for table in self._tables:
+            table.clear()
+
+    def nearest(self, value: int) -> Optional[Tuple[int, int]]:
+        """Closest stored hash within max_distance as (hash, distance), or None"""
+        if value in self._hashes:
+            return value, 0
+        best = None
+        seen = set()
+        for table, band in zip(self._tables, self._band_values(value)):
+            for candidate in table.get(band, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = bin(candidate ^ value).count("1")
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (candidate, distance)
+        return best
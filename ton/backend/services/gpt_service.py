@@ -8,24 +8,51 @@ This module provides:
 - Error handling and retry logic
 """
 
+import asyncio
 import json
 import logging
-from typing import Optional, List, Tuple
+import time
+from typing import Optional, List, Tuple, AsyncIterator, Callable
 from datetime import datetime, timedelta
 import random
 
-from openai import OpenAI, APIError, APITimeoutError, RateLimitError
+import orjson
+from openai import AsyncOpenAI, APIError, APITimeoutError, RateLimitError
 
 from config import (
     OPENAI_API_KEY,
+    OPENAI_BASE_URL,
     OPENAI_MODEL,
     OPENAI_VISION_MODEL,
+    OPENAI_SMALL_MODEL,
+    ROUTE_SMALL_MAX_CHARS,
     OPENAI_MAX_TOKENS,
     OPENAI_TEMPERATURE,
     API_TIMEOUT,
+    HEDGE_ENABLED,
+    HEDGE_PERCENTILE,
+    HEDGE_MIN_DELAY,
+    HEDGE_INITIAL_DELAY,
+    OPENAI_MAX_CONCURRENCY,
+    OPENAI_RPM_LIMIT,
+    OPENAI_TPM_LIMIT,
+    IMAGE_MAX_LONG_SIDE,
+    IMAGE_MAX_SHORT_SIDE,
+    CACHE_BACKEND,
+    CACHE_PATH,
+    ANALYSIS_CACHE_TTL,
+    ANALYSIS_CACHE_MAX_ENTRIES,
+    DIGEST_CACHE_TTL,
+    ANALYSIS_TWO_STAGE,
+    EXTRACTION_CACHE_TTL,
+    EXTRACT_DEDUP_MAX_DISTANCE,
+    SCORING_MODE,
+    STRUCTURED_OUTPUT,
+    PROMPT_CACHE_KEYS,
     is_api_key_valid,
     get_api_mode
 )
+from constants import PROMPT_CACHE_MIN_TOKENS
 from schemas import (
     UserProfileInput,
     AnalysisData,
@@ -38,35 +65,169 @@ from schemas import (
     ConfidenceInfo,
     ExtractedInfo,
     ExtractionConfidence,
+    ExtractionData,
     AssistantMessage,
     AssistantAction,
     ReadinessData,
-    ReadinessBreakdown,
-    ReadinessImprovement,
     StrategicVerdict,
     HiddenExpectation,
     DealBreaker,
     ParticipationScenario,
     ScenarioWeek,
+    AnalyzeOutput,
+    ExtractOutput,
+    ModelContestInfo,
+    ModelStrategicVerdict,
+    ModelExtractionConfidence,
 )
+from services.cache_service import create_cache, make_cache_key, normalize_text, digest_bytes
+from services.stream_parser import JsonSectionParser
+from services.dedup_service import PerceptualIndex, dhash_from_base64
+from services.scoring_service import compute_scores, get_label_from_score
+from services.schedule_service import scenario_weeks
+from services.readiness_service import (
+    skill_readiness,
+    time_readiness,
+    progress_readiness,
+    overall_readiness,
+    readiness_data,
+)
+from services.catalog_service import get_catalog, contest_key, record_contest
+from services.coalesce_service import create_single_flight
+from services.rate_limit_service import RateLimiter, estimate_prompt_tokens, estimate_text_tokens
+from services.image_service import estimate_vision_tokens
+from services.hedge_service import HedgePolicy
+from services.routing_service import ModelRouter, Route, TIER_LARGE
+from services.output_schema_service import response_format_for
+from services.deadline_service import DeadlineExceeded, bounded, remaining
+from services.metrics_service import record_llm_call
+from services.tracing_service import span
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize OpenAI client (only if API key is valid)
+# 하나의 AsyncOpenAI 클라이언트를 모든 요청이 공유하여 HTTP 커넥션 풀을 재사용합니다.
 _client = None
 if is_api_key_valid():
-    _client = OpenAI(api_key=OPENAI_API_KEY, timeout=API_TIMEOUT)
-    logger.info(f"OpenAI client initialized with model: {OPENAI_MODEL}")
+    # SDK-level retries are disabled; call_gpt_api retries through the rate limiter instead
+    _client = AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL, timeout=API_TIMEOUT, max_retries=0)
+    logger.info(f"OpenAI client initialized with model: {OPENAI_MODEL}" + (f" at {OPENAI_BASE_URL}" if OPENAI_BASE_URL else ""))
 else:
     logger.warning("OpenAI API key not configured - using mock responses")
 
+# Limit concurrent upstream calls so bursts queue here instead of at OpenAI
+_gpt_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+# Stay under the account's RPM/TPM budget; background work waits behind interactive calls
+_rate_limiter = RateLimiter(OPENAI_RPM_LIMIT, OPENAI_TPM_LIMIT)
+# Slow calls get a second attempt once they pass the recent latency percentile
+_hedge_policy = HedgePolicy(HEDGE_ENABLED, HEDGE_PERCENTILE, HEDGE_MIN_DELAY, HEDGE_INITIAL_DELAY)
+# Short text requests start on the small model and escalate when its output is invalid
+_router = ModelRouter(OPENAI_SMALL_MODEL, OPENAI_MODEL, OPENAI_VISION_MODEL, ROUTE_SMALL_MAX_CHARS, OPENAI_MAX_TOKENS)
+# Uploaded images are preprocessed to at most this size, so this bounds their token cost
+_IMAGE_TOKEN_ESTIMATE = estimate_vision_tokens(IMAGE_MAX_LONG_SIDE, IMAGE_MAX_SHORT_SIDE)
+
+# Analysis results keyed by prompt, model, message, image digest and options
+_analysis_cache = create_cache(
+    "analysis", CACHE_BACKEND, ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_TTL, CACHE_PATH
+)
+# Profile-independent contest digests (stage 1 of the two-stage pipeline)
+_digest_cache = create_cache(
+    "digest", CACHE_BACKEND, ANALYSIS_CACHE_MAX_ENTRIES, DIGEST_CACHE_TTL, CACHE_PATH
+)
+# Poster extractions keyed by perceptual hash; near-duplicate screenshots share an entry
+_extraction_cache = create_cache(
+    "extraction", CACHE_BACKEND, ANALYSIS_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL, CACHE_PATH
+)
+_extraction_index = PerceptualIndex(EXTRACT_DEDUP_MAX_DISTANCE)
+for _key in _extraction_cache.keys():
+    _extraction_index.add(int(_key, 16))
+
+# Identical requests arriving together share one upstream call (keyed like the caches)
+_analysis_flight = create_single_flight("analysis")
+_digest_flight = create_single_flight("digest")
+_extraction_flight = create_single_flight("extraction")
+
+
+async def close_gpt_client() -> None:
+    """Close the shared OpenAI client and its connection pool"""
+    if _client:
+        await _client.close()
+
 
 # ============================================
 # PROMPT TEMPLATES
 # ============================================
 
+# Guidance shared by several prompts. Besides keeping answers consistent across
+# kinds, it puts each kind's static prefix (system prompt plus response schema)
+# above PROMPT_CACHE_MIN_TOKENS, so the provider can cache it.
+
+CATEGORY_GUIDE = """## 분류 기준 (category)
+- AI/ML: 머신러닝·딥러닝 모델 개발, 생성형 AI 활용, 예측/추천 모델이 핵심 산출물인 경우
+- 개발: 웹·앱·게임·임베디드 등 실제로 동작하는 소프트웨어 구현이 핵심인 해커톤, 앱 개발 공모전
+- 디자인: UI/UX, 시각·제품·영상 디자인, 브랜딩, 포스터·캐릭터 등 시각 결과물 중심
+- 창업/비즈니스: 사업계획서, 창업 아이디어, 마케팅·기획안, 사회적 가치를 담은 비즈니스 모델
+- 데이터: 공공/기업 데이터 분석, 시각화, 데이터 기반 정책 제안 (모델 개발보다 분석과 인사이트 중심)
+- 일반: 위 분류에 해당하지 않는 논문, 수기, 영상 UCC, 정책·아이디어 제안 등
+여러 분야에 걸치면 심사 기준에서 가장 큰 비중을 차지하는 결과물을 기준으로 하나만 고르세요."""
+
+DEADLINE_RULES = """## 날짜 규칙 (deadline)
+- 최종 제출(접수) 마감일을 YYYY-MM-DD 형식으로 적습니다. 예선과 본선이 나뉘면 첫 제출 마감일을 씁니다.
+- "접수 기간 A ~ B", "B까지", "B 마감"은 B를 마감일로 봅니다.
+- 연도가 없으면 공고 시점 이후 가장 가까운 해의 날짜로 추론합니다.
+- 마감 시각(예: 18:00)은 버리고 날짜만 남깁니다.
+- "상시 모집", "예산 소진 시 마감"처럼 날짜가 없거나 읽을 수 없으면 null입니다.
+- 표기 예시: "2026. 3. 15.(일)" → 2026-03-15, "3/15(금) 18시까지" → 연도를 추론한 3월 15일, "26.04.01 ~ 26.04.30" → 2026-04-30"""
+
+CONTEST_RUBRIC = """## 난이도와 작업량 기준
+- difficulty 0-30: 아이디어 제안서, 수기 등 짧은 문서만 제출
+- difficulty 31-60: 기획서와 간단한 시안/프로토타입 등 1-2개 산출물
+- difficulty 61-80: 동작하는 결과물(앱, 모델, 분석 보고서)과 발표 자료, 예선·본선 구조
+- difficulty 81-100: 고난도 기술 구현, 전문가 심사, 실데이터·실서비스 수준 요구
+- estimatedHours는 한 사람 기준 총 준비 시간입니다. 기획서 위주 20-40시간, 시안·프로토타입 40-80시간, 개발·모델 구현 80-150시간을 기준으로 조정하세요.
+- requiredSkills에는 "Python", "Figma", "React"처럼 구체적인 기술·도구 이름만 적고, "열정"이나 "창의력" 같은 일반 역량은 넣지 마세요.
+
+## 숨겨진 기대사항 (hiddenExpectations)
+- 공고에 명시된 조건은 source "explicit", 주최 기관 성격·심사 기준·과거 수상작에서 추론한 내용은 "inferred"로 표시합니다.
+- importance는 심사 결과에 미치는 영향으로 정합니다: 탈락 사유가 될 수 있으면 high, 가점 요소면 medium, 참고 사항이면 low입니다.
+- "성실히 준비하세요" 같은 일반적인 조언이 아니라 이 공모전에만 해당하는 내용을 최대 3개 적습니다."""
+
+ADVICE_GUIDE = """## 점수 해석
+- 점수 70 이상은 높음, 40-69는 보통, 39 이하는 낮음입니다. difficulty와 schedulePressure는 높을수록 부담이 큽니다.
+- readiness는 기술 적합도, 주간 가용 시간, 현재 준비 상태를 함께 반영한 값입니다.
+
+## 조언 작성 기준
+- fitType: 점수가 대체로 높고 치명적인 제약이 없으면 opportunity, 일정이나 역량 중 하나가 부족하지만 보완할 수 있으면 risky, 참가 자격이나 필수 역량이 맞지 않으면 mismatch입니다.
+- confidence: 공모전 정보가 충분하고 점수 근거가 분명하면 0.8 이상, 정보가 부족하거나 추론이 많으면 0.6 이하로 적습니다.
+- recommendation은 사용자의 기술과 목표를 직접 언급하고, 바로 실행할 수 있는 다음 행동을 제시합니다.
+- opportunities와 warnings는 각각 2-4개, 한 문장씩, 서로 겹치지 않게 씁니다.
+- dealBreakers에는 참가 자격 미달(재학·연령·지역 제한), 필수 제출물 준비 불가, 마감 경과처럼 참가 자체를 막는 사유만 넣습니다. 확실하면 critical, 확인이 필요하면 serious이고, 없으면 빈 배열입니다.
+- checklist는 먼저 해야 할 일부터 적고, 참가 자격 확인과 제출 형식 확인은 high로 둡니다.
+- scenario.totalHours는 사용자 숙련도를 반영한 총 준비 시간, weeksNeeded는 이를 주간 가용 시간으로 나눈 주 수입니다. 마감 전에 끝낼 수 없으면 feasible은 false로 하고 conclusion에 줄여야 할 범위를 적습니다.
+
+## 작성 원칙
+- 모든 문장은 한국어 존댓말로, 과장 없이 구체적으로 씁니다.
+- 주어진 정보에 없는 상금, 일정, 심사위원 등을 지어내지 마세요."""
+
+EXTRACT_RULES = """## 항목별 추출 규칙
+- title: 포스터에서 가장 크게 강조된 공모전 이름을 그대로 적고, 회차·연도 표기("제5회", "2026")도 포함합니다.
+- organizer: "주최"를 우선하고, 없으면 "주관"을 적습니다. 후원·협찬 기관은 넣지 않습니다.
+- requirements: 참가 대상, 팀 구성, 자격 제한을 원문 표현 그대로 한 문단으로 이어 적습니다.
+- description: 공모 주제와 제출물을 1-3문장으로 요약합니다. 포스터에 없는 내용은 덧붙이지 않습니다.
+- rawText: 읽은 순서대로 줄바꿈을 유지하며, 확신이 없는 글자는 추측하지 말고 생략합니다.
+
+## 신뢰도 기준 (confidence)
+- high: 글자가 선명하고 "접수 마감", "참가 대상"처럼 해당 항목이라는 표시가 분명한 경우
+- medium: 글자는 읽히지만 어떤 항목인지는 문맥으로 추론한 경우
+- low: 글자가 흐리거나 잘렸거나, 여러 후보 중 하나를 고른 경우
+
+## 포스터 처리
+- 한 포스터에 여러 부문이 있으면 부문별 내용을 나누지 말고 공통 조건과 대표 주제를 적습니다.
+- QR 코드, 로고, 장식 문구("많은 참여 바랍니다")는 rawText에만 남기고 다른 항목에는 쓰지 않습니다.
+- 포스터가 공모전이 아니거나 글자를 거의 읽을 수 없으면 rawText를 제외한 항목을 null로 두고 confidence를 low로 표시합니다."""
+
 SYSTEM_PROMPT_ANALYZE = """당신은 공모전 추천 전문가 AI입니다.
 사용자 프로필과 공모전 정보를 분석하여 적합도를 평가하고 전략적 조언을 제공합니다.
 
@@ -129,8 +290,90 @@ SYSTEM_PROMPT_ANALYZE = """당신은 공모전 추천 전문가 AI입니다.
 
 불확실한 정보는 최선의 추론을 하되, 추론임을 명시하세요."""
 
+SYSTEM_PROMPT_DIGEST = """당신은 공모전 정보 분석 전문가 AI입니다.
+공모전 텍스트/포스터에서 사용자와 무관한 공모전 자체의 정보만 정리합니다.
+
+""" + CATEGORY_GUIDE + "\n\n" + DEADLINE_RULES + "\n\n" + CONTEST_RUBRIC + """
+
+반드시 아래 JSON 형식으로만 응답하세요. 다른 텍스트를 추가하지 마세요.
+
+```json
+{
+  "contestInfo": {
+    "title": "공모전 제목",
+    "organizer": "주최 기관",
+    "category": "AI/ML|개발|디자인|창업/비즈니스|데이터|일반 중 하나",
+    "deadline": "YYYY-MM-DD 형식 또는 null",
+    "teamSize": "참가 인원 정보",
+    "requirements": ["요구사항1", "요구사항2"],
+    "prizes": ["시상 내역1", "시상 내역2"],
+    "description": "공모전 설명 요약"
+  },
+  "hiddenExpectations": [
+    {"insight": "숨겨진 기대사항", "source": "explicit|inferred", "importance": "high|medium|low"}
+  ],
+  "requiredSkills": ["필요 기술1", "필요 기술2"],
+  "difficulty": 0-100 사이 숫자,
+  "estimatedHours": 예상 작업 시간(숫자)
+}
+```
+
+불확실한 정보는 최선의 추론을 하되, 추론임을 명시하세요."""
+
+SYSTEM_PROMPT_SCORE = """당신은 공모전 추천 전문가 AI입니다.
+이미 정리된 공모전 요약과 사용자 프로필을 비교하여 적합도를 평가하고 전략적 조언을 제공합니다.
+점수 기준: skillMatch, difficulty(높을수록 어려움), schedulePressure(높을수록 촉박), teamFit, portfolioValue, readiness (모두 0-100)
+
+""" + CONTEST_RUBRIC + "\n\n" + ADVICE_GUIDE + """
+
+반드시 아래 JSON 형식으로만 응답하세요.
+
+```json
+{
+  "strategicVerdict": {"summary": "1-2문장 전략 요약", "fitType": "opportunity|risky|mismatch", "confidence": 0.0-1.0},
+  "scores": {
+    "skillMatch": {"score": 0-100, "label": "높음|보통|낮음", "reason": "이유"},
+    "difficulty": {...}, "schedulePressure": {...}, "teamFit": {...}, "portfolioValue": {...}, "readiness": {...}
+  },
+  "recommendation": "맞춤 추천 메시지 (2-3문장)",
+  "opportunities": ["기회 요소"],
+  "warnings": ["주의사항"],
+  "dealBreakers": [{"reason": "참가 불가 사유", "severity": "critical|serious"}],
+  "checklist": [{"text": "준비 항목", "priority": "high|medium|low"}],
+  "scenario": {"totalHours": 숫자, "weeksNeeded": 숫자, "feasible": true|false, "conclusion": "결론"}
+}
+```"""
+
+SYSTEM_PROMPT_NARRATIVE = """당신은 공모전 추천 전문가 AI입니다.
+이미 정리된 공모전 요약, 사용자 프로필, 미리 계산된 적합도 점수가 주어집니다.
+점수는 다시 계산하지 말고, 점수를 근거로 전략적 조언만 작성하세요.
+
+""" + CONTEST_RUBRIC + "\n\n" + ADVICE_GUIDE + """
+
+반드시 아래 JSON 형식으로만 응답하세요.
+
+```json
+{
+  "strategicVerdict": {"summary": "1-2문장 전략 요약", "fitType": "opportunity|risky|mismatch", "confidence": 0.0-1.0},
+  "recommendation": "맞춤 추천 메시지 (2-3문장)",
+  "opportunities": ["기회 요소"],
+  "warnings": ["주의사항"],
+  "dealBreakers": [{"reason": "참가 불가 사유", "severity": "critical|serious"}],
+  "checklist": [{"text": "준비 항목", "priority": "high|medium|low"}],
+  "scenario": {"totalHours": 숫자, "weeksNeeded": 숫자, "feasible": true|false, "conclusion": "결론"}
+}
+```"""
+
+SYSTEM_PROMPT_ANALYZE_BATCH = SYSTEM_PROMPT_ANALYZE + """
+
+## 여러 공모전 동시 분석
+번호가 매겨진 여러 공모전이 주어지면 각 공모전을 위 형식으로 분석하여
+{"results": [공모전1 분석, 공모전2 분석, ...]} 형태로 입력 순서대로 응답하세요."""
+
 SYSTEM_PROMPT_EXTRACT = """공모전 포스터 이미지에서 정보를 추출합니다.
 
+""" + EXTRACT_RULES + "\n\n" + CATEGORY_GUIDE + "\n\n" + DEADLINE_RULES + """
+
 반드시 아래 JSON 형식으로만 응답하세요:
 ```json
 {
@@ -151,79 +394,366 @@ SYSTEM_PROMPT_EXTRACT = """공모전 포스터 이미지에서 정보를 추출
 
 보이는 텍스트만 추출하고, 불명확한 정보는 null로 표시하세요."""
 
+# Messages are laid out static-first so the provider's prompt cache can reuse
+# the longest possible prefix: the system prompt (and response schema), then
+# contest content shared by everyone analyzing that contest, and the
+# per-user profile last. Everything below is built once at import.
+
+PROFILE_TEMPLATE = """## 사용자 프로필
+- 전공: {major}
+- 기술 스택: {skills}
+- 목표: {goal}
+- 주간 가용 시간: {hours}시간
+- 선호 참가 형태: {team_size}"""
+
+CONTEST_TEMPLATE = "## 공모전 정보\n{contest}"
+DIGEST_TEMPLATE = "## 공모전 요약\n{digest}"
+SCORES_TEMPLATE = "\n\n## 계산된 점수\n{scores}"
+BATCH_CONTEST_TEMPLATE = "### 공모전 {index}\n{text}"
+BATCH_TEMPLATE = "## 공모전 목록\n{contests}\n\n위 공모전들을 각각 분석해주세요."
+
+ANALYZE_INSTRUCTION = "\n\n위 정보를 바탕으로 분석해주세요."
+SCORE_INSTRUCTION = "\n\n위 정보를 바탕으로 평가해주세요."
+EXTRACT_INSTRUCTION = "이 공모전 포스터에서 정보를 추출해주세요."
+POSTER_ONLY_TEXT = "(포스터 이미지 참고)"
+
+_SYSTEM_MESSAGES = {
+    kind: {"role": "system", "content": prompt}
+    for kind, prompt in {
+        "analyze": SYSTEM_PROMPT_ANALYZE,
+        "digest": SYSTEM_PROMPT_DIGEST,
+        "score": SYSTEM_PROMPT_SCORE,
+        "narrative": SYSTEM_PROMPT_NARRATIVE,
+        "batch": SYSTEM_PROMPT_ANALYZE_BATCH,
+        "extract": SYSTEM_PROMPT_EXTRACT,
+    }.items()
+}
+
 
 # ============================================
 # HELPER FUNCTIONS
 # ============================================
 
+def build_profile_section(profile: UserProfileInput) -> str:
+    """Build the user profile section shared by analysis prompts"""
+    return PROFILE_TEMPLATE.format(
+        major=profile.major or '미입력',
+        skills=", ".join([s.name for s in profile.skills]) if profile.skills else "없음",
+        goal=profile.goal or '미입력',
+        hours=profile.hoursPerWeek or 10,
+        team_size=profile.preferredTeamSize or '무관',
+    )
+
+
 def build_user_message(profile: UserProfileInput, contest_text: str) -> str:
-    """Build user message for GPT from profile and contest info"""
-    
-    skills_text = ", ".join([s.name for s in profile.skills]) if profile.skills else "없음"
-    
-    return f"""## 사용자 프로필
-- 전공: {profile.major or '미입력'}
-- 기술 스택: {skills_text}
-- 목표: {profile.goal or '미입력'}
-- 주간 가용 시간: {profile.hoursPerWeek or 10}시간
-- 선호 참가 형태: {profile.preferredTeamSize or '무관'}
+    """Full single-stage user content (contest first, profile last)"""
+    return (
+        CONTEST_TEMPLATE.format(contest=contest_text) + "\n\n"
+        + build_profile_section(profile) + ANALYZE_INSTRUCTION
+    )
+
+
+def build_image_part(image_base64: str, image_mime: str = "image/jpeg") -> dict:
+    """Build the image_url message part for a base64 image"""
+    return {
+        "type": "image_url",
+        "image_url": {
+            "url": f"data:{image_mime};base64,{image_base64}",
+            "detail": "high"
+        }
+    }
+
+
+def build_contest_message(
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg"
+) -> dict:
+    """User message holding only the contest text (and poster)"""
+    text = CONTEST_TEMPLATE.format(contest=contest_text)
+    if not image_base64:
+        return {"role": "user", "content": text}
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": text},
+            build_image_part(image_base64, image_mime)
+        ]
+    }
+
+
+def build_analyze_messages(
+    profile: UserProfileInput,
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg"
+) -> List[dict]:
+    """Single-stage prompt: system, contest, then the profile"""
+    return [
+        _SYSTEM_MESSAGES["analyze"],
+        build_contest_message(contest_text, image_base64, image_mime),
+        {"role": "user", "content": build_profile_section(profile) + ANALYZE_INSTRUCTION},
+    ]
+
+
+def build_digest_messages(
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg"
+) -> List[dict]:
+    """Stage-1 prompt; profile-independent"""
+    return [
+        _SYSTEM_MESSAGES["digest"],
+        build_contest_message(contest_text or POSTER_ONLY_TEXT, image_base64, image_mime),
+    ]
+
+
+def build_scoring_messages(
+    kind: str,
+    profile: UserProfileInput,
+    digest: dict,
+    scores: Optional[AnalysisScores] = None
+) -> List[dict]:
+    """
+    Stage-2 prompt: the contest digest comes before the profile so every
+    user scoring the same contest shares the cached prefix.
+    """
+    digest_json = json.dumps(digest, ensure_ascii=False, separators=(",", ":"))
+    scores_section = ""
+    if scores:
+        score_values = {key: detail.score for key, detail in scores if detail}
+        scores_section = SCORES_TEMPLATE.format(scores=json.dumps(score_values, separators=(',', ':')))
+    
+    return [
+        _SYSTEM_MESSAGES[kind],
+        {"role": "user", "content": DIGEST_TEMPLATE.format(digest=digest_json)},
+        {"role": "user", "content": build_profile_section(profile) + scores_section + SCORE_INSTRUCTION},
+    ]
+
+
+def build_batch_messages(profile: UserProfileInput, contest_texts: List[str]) -> List[dict]:
+    """
+    Packed prompt. Every pack of one batch shares the profile, so it goes
+    before the contests.
+    """
+    contests = "\n\n".join(
+        BATCH_CONTEST_TEMPLATE.format(index=i + 1, text=text) for i, text in enumerate(contest_texts)
+    )
+    return [
+        _SYSTEM_MESSAGES["batch"],
+        {"role": "user", "content": build_profile_section(profile)},
+        {"role": "user", "content": BATCH_TEMPLATE.format(contests=contests)},
+    ]
+
+
+def build_extract_messages(image_base64: str, image_mime: str = "image/jpeg") -> List[dict]:
+    """Poster extraction prompt"""
+    return [
+        _SYSTEM_MESSAGES["extract"],
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": EXTRACT_INSTRUCTION},
+                build_image_part(image_base64, image_mime)
+            ]
+        }
+    ]
 
-## 공모전 정보
-{contest_text}
 
-위 정보를 바탕으로 분석해주세요."""
+def prompt_cache_key(kind: str, messages: List[dict]) -> str:
+    """
+    Routing hint for the provider's prompt cache: requests whose messages
+    before the last one match are sent to the same cache.
+    """
+    prefix = [
+        message["content"] if isinstance(message["content"], str)
+        else [part.get("text", "") for part in message["content"]]
+        for message in messages[:-1]
+    ]
+    return f"{kind}-{make_cache_key(prefix)[:24]}"
+
+
+def build_analysis_cache_key(
+    model: str,
+    user_content: str,
+    image_base64: Optional[str],
+    options: Optional[dict]
+) -> str:
+    """Content-addressed key for an analysis request"""
+    if ANALYSIS_TWO_STAGE:
+        prompt = SYSTEM_PROMPT_DIGEST + (SYSTEM_PROMPT_NARRATIVE if SCORING_MODE == "local" else SYSTEM_PROMPT_SCORE)
+    else:
+        prompt = SYSTEM_PROMPT_ANALYZE
+    return make_cache_key(
+        prompt,
+        model,
+        normalize_text(user_content),
+        digest_bytes(image_base64),
+        options or {},
+    )
+
+
+def build_digest_cache_key(model: str, contest_text: str, image_base64: Optional[str]) -> str:
+    """Content-addressed key for a profile-independent contest digest"""
+    return make_cache_key(
+        SYSTEM_PROMPT_DIGEST,
+        model,
+        normalize_text(contest_text),
+        digest_bytes(image_base64),
+    )
 
 
 def parse_gpt_response(response_text: str) -> dict:
-    """Parse GPT response and extract JSON"""
+    """
+    Parse GPT response JSON in a single orjson pass. Fenced or prose-wrapped
+    JSON is sliced out first instead of being retried with json.loads.
+    """
+    text = response_text.strip()
+    if not text.startswith("{"):
+        fence = text.find("```json")
+        if fence >= 0:
+            start = fence + 7
+            end = text.find("```", start)
+            text = text[start:end if end > start else None].strip()
+        else:
+            start = text.find("{")
+            end = text.rfind("}") + 1
+            if start < 0 or end <= start:
+                raise ValueError("Could not parse JSON from GPT response")
+            text = text[start:end]
     
-    # Try to find JSON in response
     try:
-        # First, try direct parse
-        return json.loads(response_text)
-    except json.JSONDecodeError:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
         pass
     
-    # Try to extract JSON from markdown code block
-    if "```json" in response_text:
-        start = response_text.find("```json") + 7
-        end = response_text.find("```", start)
-        if end > start:
-            try:
-                return json.loads(response_text[start:end].strip())
-            except json.JSONDecodeError:
-                pass
-    
-    # Try to find JSON object
-    start = response_text.find("{")
-    end = response_text.rfind("}") + 1
-    if start >= 0 and end > start:
+    # Trailing prose after the object
+    end = text.rfind("}") + 1
+    if 0 < end < len(text):
         try:
-            return json.loads(response_text[start:end])
-        except json.JSONDecodeError:
+            return orjson.loads(text[:end])
+        except orjson.JSONDecodeError:
             pass
     
     raise ValueError("Could not parse JSON from GPT response")
 
 
-def get_label_from_score(score: int, inverted: bool = False) -> str:
-    """Convert score to label"""
-    effective = 100 - score if inverted else score
-    if effective >= 70:
-        return "높음"
-    elif effective >= 40:
-        return "보통"
-    return "낮음"
-
-
 # ============================================
 # REAL GPT API FUNCTIONS
 # ============================================
 
+async def _create_completion(**kwargs):
+    """
+    chat.completions.create that also feeds the response's rate-limit headers
+    to the limiter (when the client exposes raw responses).
+    """
+    completions = _client.chat.completions
+    raw = getattr(completions, "with_raw_response", None)
+    if raw is None:
+        return await completions.create(**kwargs)
+    response = await raw.create(**kwargs)
+    _rate_limiter.update_from_headers(response.headers)
+    return response.parse()
+
+
+async def _attempt_completion(
+    model: str,
+    messages: List[dict],
+    reserved_tokens: int,
+    max_tokens: int,
+    response_format: dict,
+    cache_key: Optional[str] = None
+):
+    """One upstream attempt, bounded by API_TIMEOUT and the request deadline"""
+    left = remaining()
+    with span("rate_limit_wait"):
+        if left is None:
+            await _rate_limiter.acquire(reserved_tokens)
+        else:
+            try:
+                await asyncio.wait_for(_rate_limiter.acquire(reserved_tokens), timeout=bounded(left))
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded("Request deadline exceeded while waiting for rate limit")
+    
+    with span("upstream_queue"):
+        await _gpt_semaphore.acquire()
+    started = time.monotonic()
+    try:
+        timeout = bounded(API_TIMEOUT)
+        # GPT-5.2 and newer models require max_completion_tokens instead of max_tokens
+        request = _create_completion(
+            model=model,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+            temperature=OPENAI_TEMPERATURE,
+            response_format=response_format,
+            timeout=timeout,
+            **_cache_key_args(cache_key)
+        )
+        with span("upstream", model=model):
+            if timeout < API_TIMEOUT:
+                # The deadline, not API_TIMEOUT, is the binding limit for this attempt
+                try:
+                    response = await asyncio.wait_for(request, timeout=timeout)
+                except asyncio.TimeoutError:
+                    raise DeadlineExceeded("Request deadline exceeded during upstream call")
+            else:
+                response = await request
+    except APITimeoutError:
+        # A call that used the whole API_TIMEOUT took at least that long; a shorter
+        # deadline-bound timeout says nothing about the tail, so it is left out
+        if timeout >= API_TIMEOUT:
+            _hedge_policy.record(time.monotonic() - started, model)
+        raise
+    finally:
+        _gpt_semaphore.release()
+    _hedge_policy.record(time.monotonic() - started, model)
+    return response
+
+
+def _cache_key_args(cache_key: Optional[str]) -> dict:
+    # Sent as extra_body so older SDKs without the parameter still pass it through
+    if not cache_key or not PROMPT_CACHE_KEYS:
+        return {}
+    return {"extra_body": {"prompt_cache_key": cache_key}}
+
+
+def _image_tokens(messages: List[dict]) -> int:
+    """Estimated prompt tokens spent on images (the API does not report them separately)"""
+    images = sum(
+        1
+        for message in messages if not isinstance(message["content"], str)
+        for part in message["content"] if part.get("type") == "image_url"
+    )
+    return images * _IMAGE_TOKEN_ESTIMATE
+
+
+def _cached_tokens(usage) -> int:
+    """Prompt tokens served from the provider's prompt cache"""
+    details = getattr(usage, "prompt_tokens_details", None)
+    return (getattr(details, "cached_tokens", None) or 0) if details else 0
+
+
+def get_rate_limit_stats() -> dict:
+    """Queue depth and budget of the OpenAI rate limiter"""
+    return _rate_limiter.stats()
+
+
+def get_hedge_stats() -> dict:
+    """Hedged-call counters and the current hedge delay"""
+    return _hedge_policy.stats()
+
+
 async def call_gpt_api(
     messages: List[dict],
     use_vision: bool = False,
-    max_retries: int = 2
+    max_retries: int = 2,
+    model: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+    on_usage: Optional[Callable[[int, int, int], None]] = None,
+    response_format: Optional[dict] = None,
+    cache_key: Optional[str] = None,
+    kind: Optional[str] = None
 ) -> Optional[str]:
     """
     Call OpenAI API with retry logic
@@ -232,6 +762,12 @@ async def call_gpt_api(
         messages: List of message dicts
         use_vision: Whether to use vision model
         max_retries: Number of retries on failure
+        model: Model override (defaults to OPENAI_MODEL / OPENAI_VISION_MODEL)
+        max_tokens: Completion token cap (defaults to OPENAI_MAX_TOKENS)
+        on_usage: Called with (prompt_tokens, completion_tokens, cached_tokens) on success
+        response_format: Structured-output format (defaults to plain JSON mode)
+        cache_key: prompt_cache_key routing hint for the provider's prompt cache
+        kind: Request kind used to label usage metrics
     
     Returns:
         Response text or None on failure
@@ -239,33 +775,55 @@ async def call_gpt_api(
     if not _client:
         return None
     
-    model = OPENAI_VISION_MODEL if use_vision else OPENAI_MODEL
+    model = model or (OPENAI_VISION_MODEL if use_vision else OPENAI_MODEL)
+    max_tokens = max_tokens or OPENAI_MAX_TOKENS
+    response_format = response_format or JSON_OBJECT_FORMAT
+    prompt_estimate = estimate_prompt_tokens(messages, _IMAGE_TOKEN_ESTIMATE)
+    # The API counts max tokens against TPM up front, so reserve them too
+    reserved_tokens = prompt_estimate + max_tokens
+    started = time.monotonic()
     
     for attempt in range(max_retries + 1):
         try:
-            # GPT-5.2 and newer models require max_completion_tokens instead of max_tokens
-            response = _client.chat.completions.create(
-                model=model,
-                messages=messages,
-                max_completion_tokens=OPENAI_MAX_TOKENS,
-                temperature=OPENAI_TEMPERATURE,
-                response_format={"type": "json_object"}
+            response = await _hedge_policy.run(
+                lambda: _attempt_completion(model, messages, reserved_tokens, max_tokens, response_format, cache_key),
+                # Hedging only helps when there is idle capacity to absorb the extra call
+                can_hedge=lambda: not _gpt_semaphore.locked() and _rate_limiter.queue_depth == 0,
+                budget=remaining(),
+                key=model
+            )
+            content = response.choices[0].message.content
+            usage = getattr(response, "usage", None)
+            if usage:
+                counts = (usage.prompt_tokens, usage.completion_tokens, _cached_tokens(usage))
+            else:
+                counts = (prompt_estimate, estimate_text_tokens(content or ""), 0)
+            record_llm_call(
+                model, kind, *counts,
+                image_tokens=_image_tokens(messages),
+                latency=time.monotonic() - started
             )
-            return response.choices[0].message.content
+            if on_usage:
+                on_usage(*counts)
+            return content
             
         except RateLimitError as e:
-            logger.warning(f"Rate limit hit (attempt {attempt + 1}): {e}")
-            if attempt < max_retries:
-                import asyncio
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
+            # Pause every caller until the server's reset instead of each retrying blindly
+            delay = _rate_limiter.throttle(getattr(e.response, "headers", None), 2 ** attempt)
+            logger.warning(f"Rate limit hit (attempt {attempt + 1}), pausing {delay:.2f}s: {e}")
             continue
             
         except APITimeoutError as e:
             logger.warning(f"API timeout (attempt {attempt + 1}): {e}")
-            if attempt < max_retries:
+            left = remaining()
+            if attempt < max_retries and (left is None or left > 0):
                 continue
             raise
             
+        except DeadlineExceeded:
+            logger.warning(f"Request deadline exceeded (attempt {attempt + 1})")
+            raise
+            
         except APIError as e:
             logger.error(f"API error: {e}")
             raise
@@ -277,112 +835,441 @@ async def call_gpt_api(
     return None
 
 
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+def structured_format(kind: str) -> Optional[dict]:
+    """Strict JSON-schema response_format for a request kind, when enabled"""
+    return response_format_for(kind) if STRUCTURED_OUTPUT else None
+
+
+def _user_text_chars(messages: List[dict]) -> int:
+    """Characters of user-supplied text (system prompts excluded)"""
+    total = 0
+    for message in messages:
+        if message["role"] != "user":
+            continue
+        content = message["content"]
+        if isinstance(content, str):
+            total += len(content)
+        else:
+            total += sum(len(part.get("text", "")) for part in content)
+    return total
+
+
+async def _call_route(kind: str, route: Route, messages: List[dict], use_vision: bool) -> Optional[dict]:
+    """Call one tier; returns parsed JSON or None when it cannot be parsed"""
+    usage = {"prompt": 0, "completion": 0, "cached": 0}
+    
+    def on_usage(prompt_tokens: int, completion_tokens: int, cached_tokens: int) -> None:
+        usage["prompt"], usage["completion"], usage["cached"] = prompt_tokens, completion_tokens, cached_tokens
+    
+    started = time.monotonic()
+    response_text = await call_gpt_api(
+        messages,
+        use_vision,
+        model=route.model,
+        max_tokens=route.max_tokens,
+        on_usage=on_usage,
+        response_format=structured_format(kind),
+        cache_key=prompt_cache_key(kind, messages),
+        kind=kind
+    )
+    if not response_text:
+        raise Exception("Failed to get response from GPT API")
+    
+    with span("response_parse"):
+        try:
+            data = parse_gpt_response(response_text)
+        except ValueError:
+            data = None
+    _router.record(
+        route, time.monotonic() - started, usage["prompt"], usage["completion"], _router.is_valid(kind, data),
+        kind=kind, cached_tokens=usage["cached"]
+    )
+    return data
+
+
+async def call_gpt_json(
+    kind: str,
+    messages: List[dict],
+    use_vision: bool = False,
+    options: Optional[dict] = None,
+    on_model: Optional[Callable[[str], None]] = None
+) -> dict:
+    """
+    Call the model tier routed for this request and parse its JSON.
+    Small-tier output that fails validation is retried once on the large tier.
+    on_model is called with the model whose output is returned.
+    """
+    route = _router.route(kind, _user_text_chars(messages), use_vision, options)
+    with span(kind):
+        data = await _call_route(kind, route, messages, use_vision)
+        
+        if route.tier != TIER_LARGE and not _router.is_valid(kind, data):
+            logger.info(f"Escalating {kind} request from {route.model} to the large model")
+            _router.record_escalation(route, kind)
+            route = _router.large(use_vision)
+            data = await _call_route(kind, route, messages, use_vision)
+    
+    if data is None:
+        raise ValueError("Could not parse JSON from GPT response")
+    if on_model:
+        on_model(route.model)
+    return data
+
+
+def get_routing_stats() -> dict:
+    """Per-tier call, latency, token and cost stats"""
+    return _router.stats()
+
+
+def _static_prefix_tokens(kind: str) -> int:
+    """Estimated tokens every request of a kind shares: system prompt plus response schema"""
+    tokens = estimate_text_tokens(_SYSTEM_MESSAGES[kind]["content"])
+    response_format = structured_format(kind)
+    if response_format:
+        tokens += estimate_text_tokens(orjson.dumps(response_format).decode())
+    return tokens
+
+
+_STATIC_PREFIX_TOKENS = {kind: _static_prefix_tokens(kind) for kind in _SYSTEM_MESSAGES}
+
+
+def get_prompt_cache_stats() -> dict:
+    """
+    Cached-prompt-token ratio per request kind, with the estimated static
+    prefix length (the provider only caches prefixes of PROMPT_CACHE_MIN_TOKENS or more)
+    """
+    kinds = _router.kind_stats()
+    return {
+        "minCacheableTokens": PROMPT_CACHE_MIN_TOKENS,
+        "kinds": {
+            kind: {
+                "staticPrefixTokens": _STATIC_PREFIX_TOKENS[kind],
+                "calls": kinds.get(kind, {}).get("calls", 0),
+                "promptTokens": kinds.get(kind, {}).get("promptTokens", 0),
+                "cachedPromptTokens": kinds.get(kind, {}).get("cachedPromptTokens", 0),
+                "cachedRatio": kinds.get(kind, {}).get("cachedRatio", 0.0),
+            }
+            for kind in _SYSTEM_MESSAGES
+        },
+    }
+
+
+async def call_gpt_api_stream(
+    messages: List[dict],
+    use_vision: bool = False,
+    kind: str = "analyze"
+) -> AsyncIterator[str]:
+    """
+    Call OpenAI API in streaming mode and yield content deltas.
+    Streams are not retried; errors propagate to the caller.
+    """
+    if not _client:
+        return
+    
+    model = OPENAI_VISION_MODEL if use_vision else OPENAI_MODEL
+    prompt_estimate = estimate_prompt_tokens(messages, _IMAGE_TOKEN_ESTIMATE)
+    started = time.monotonic()
+    
+    await _rate_limiter.acquire(prompt_estimate + OPENAI_MAX_TOKENS)
+    async with _gpt_semaphore:
+        stream = await _create_completion(
+            model=model,
+            messages=messages,
+            max_completion_tokens=OPENAI_MAX_TOKENS,
+            temperature=OPENAI_TEMPERATURE,
+            response_format=structured_format(kind) or JSON_OBJECT_FORMAT,
+            stream=True,
+            # The final chunk then carries the usage for the whole stream
+            stream_options={"include_usage": True},
+            **_cache_key_args(prompt_cache_key(kind, messages))
+        )
+        usage = None
+        deltas = []
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None) or usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                deltas.append(chunk.choices[0].delta.content)
+                yield deltas[-1]
+    
+    if usage:
+        counts = (usage.prompt_tokens, usage.completion_tokens, _cached_tokens(usage))
+    else:
+        counts = (prompt_estimate, estimate_text_tokens("".join(deltas)), 0)
+    record_llm_call(
+        model, kind, *counts,
+        image_tokens=_image_tokens(messages),
+        latency=time.monotonic() - started
+    )
+
+
 async def analyze_with_gpt(
     profile: UserProfileInput,
     contest_text: str,
     image_base64: Optional[str] = None,
-    options: dict = None
+    options: dict = None,
+    image_mime: str = "image/jpeg"
 ) -> AnalysisData:
     """
-    Analyze contest using real GPT API
+    Analyze contest using real GPT API.
+    Identical requests are served from the analysis cache.
     """
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT_ANALYZE}
-    ]
-    
     user_content = build_user_message(profile, contest_text)
-    
-    if image_base64:
-        messages.append({
-            "role": "user",
-            "content": [
-                {"type": "text", "text": user_content},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{image_base64}",
-                        "detail": "high"
-                    }
-                }
-            ]
-        })
-        response_text = await call_gpt_api(messages, use_vision=True)
+    model = OPENAI_VISION_MODEL if image_base64 else OPENAI_MODEL
+    
+    with span("cache_lookup"):
+        cache_key = build_analysis_cache_key(model, user_content, image_base64, options)
+        cached = await _analysis_cache.aget(cache_key)
+        if cached:
+            logger.info("Analysis cache hit")
+            return AnalysisData.model_validate_json(cached)
+    
+    return await _analysis_flight.do(
+        cache_key,
+        lambda: _run_analysis(cache_key, profile, contest_text, image_base64, options, image_mime)
+    )
+
+
+async def _run_analysis(
+    cache_key: str,
+    profile: UserProfileInput,
+    contest_text: str,
+    image_base64: Optional[str],
+    options: Optional[dict],
+    image_mime: str
+) -> AnalysisData:
+    """Uncached analysis; runs once per key even under concurrent requests"""
+    if ANALYSIS_TWO_STAGE:
+        data = await _analyze_two_stage(profile, contest_text, image_base64, image_mime, options)
     else:
-        messages.append({"role": "user", "content": user_content})
-        response_text = await call_gpt_api(messages, use_vision=False)
-    
-    if not response_text:
-        raise Exception("Failed to get response from GPT API")
-    
-    # Parse response
-    data = parse_gpt_response(response_text)
-    
-    # Build response objects
-    contest_info = ContestInfo(
-        title=data.get("contestInfo", {}).get("title", "분석된 공모전"),
-        organizer=data.get("contestInfo", {}).get("organizer"),
-        category=data.get("contestInfo", {}).get("category", "일반"),
-        deadline=data.get("contestInfo", {}).get("deadline"),
-        teamSize=data.get("contestInfo", {}).get("teamSize"),
-        requirements=data.get("contestInfo", {}).get("requirements", []),
-        prizes=data.get("contestInfo", {}).get("prizes", []),
-        description=data.get("contestInfo", {}).get("description")
+        data = await _analyze_single_stage(profile, contest_text, image_base64, image_mime, options)
+    
+    with span("build_result"):
+        result = build_analysis_data(data, profile, contest_text, options)
+    await _analysis_cache.aset(cache_key, result.model_dump_json())
+    await asyncio.to_thread(
+        record_contest,
+        result.contestInfo,
+        contest_key(contest_text, image_base64),
+        analysis=result.model_dump(mode="json")
     )
-    
-    scores_data = data.get("scores", {})
-    scores = AnalysisScores(
-        skillMatch=ScoreDetail(**scores_data.get("skillMatch", {"score": 50, "label": "보통", "reason": "분석 중"})),
-        difficulty=ScoreDetail(**scores_data.get("difficulty", {"score": 50, "label": "보통", "reason": "분석 중"})),
-        schedulePressure=ScoreDetail(**scores_data.get("schedulePressure", {"score": 50, "label": "보통", "reason": "분석 중"})),
-        teamFit=ScoreDetail(**scores_data.get("teamFit", {"score": 50, "label": "보통", "reason": "분석 중"})),
-        portfolioValue=ScoreDetail(**scores_data.get("portfolioValue", {"score": 50, "label": "보통", "reason": "분석 중"})),
-        readiness=ScoreDetail(**scores_data.get("readiness", {"score": 50, "label": "보통", "reason": "분석 중"}))
+    return result
+
+
+async def get_contest_digest(
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg"
+) -> dict:
+    """
+    Stage 1: profile-independent contest digest.
+    Computed once per contest (text + image) and cached.
+    """
+    model = OPENAI_VISION_MODEL if image_base64 else OPENAI_MODEL
+    with span("cache_lookup"):
+        cache_key = build_digest_cache_key(model, contest_text, image_base64)
+        cached = await _digest_cache.aget(cache_key)
+        if cached:
+            logger.info("Contest digest cache hit")
+            return json.loads(cached)
+    
+    return await _digest_flight.do(
+        cache_key,
+        lambda: _run_digest(cache_key, contest_text, image_base64, image_mime)
     )
-    
-    verdict_data = data.get("strategicVerdict", {})
-    strategic_verdict = StrategicVerdict(
-        summary=verdict_data.get("summary", "분석 완료"),
-        fitType=verdict_data.get("fitType", "risky"),
-        confidence=verdict_data.get("confidence", 0.7)
+
+
+async def _run_digest(
+    cache_key: str,
+    contest_text: str,
+    image_base64: Optional[str],
+    image_mime: str
+) -> dict:
+    """Catalog lookup, then the stage-1 model call"""
+    use_vision = bool(image_base64)
+    messages = build_digest_messages(contest_text, image_base64, image_mime)
+    # Contests analyzed before (e.g. prior to a restart) are served from the catalog, but only
+    # digests from the current prompt and the model this request would use (or the large one)
+    content_key = contest_key(contest_text, image_base64)
+    catalog = get_catalog()
+    if catalog:
+        routed = _router.route("digest", _user_text_chars(messages), use_vision)
+        versions = {_digest_version(routed.model), _digest_version(_router.large(use_vision).model)}
+        stored = await asyncio.to_thread(catalog.find_digest, content_key, versions)
+        if stored:
+            logger.info("Contest digest served from catalog")
+            await _digest_cache.aset(cache_key, json.dumps(stored, ensure_ascii=False))
+            return stored
+    
+    served = {}
+    digest = await call_gpt_json(
+        "digest", messages, use_vision=use_vision, on_model=lambda model: served.update(model=model)
+    )
+    await _digest_cache.aset(cache_key, json.dumps(digest, ensure_ascii=False))
+    await asyncio.to_thread(
+        record_contest, _contest_info_or_none(digest.get("contestInfo")), content_key,
+        digest=digest, digest_version=_digest_version(served["model"])
     )
+    return digest
+
+
+def _digest_version(model: str) -> str:
+    """Catalog digests are only valid for the prompt and model that produced them"""
+    return make_cache_key(SYSTEM_PROMPT_DIGEST, model)[:16]
+
+
+def _contest_info_or_none(data) -> Optional[ContestInfo]:
+    try:
+        return ContestInfo.model_validate(data) if isinstance(data, dict) else None
+    except ValueError:
+        return None
+
+
+async def _analyze_two_stage(
+    profile: UserProfileInput,
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg",
+    options: Optional[dict] = None
+) -> dict:
+    """Stage 2: score a cached contest digest against the user profile"""
+    digest = await get_contest_digest(contest_text, image_base64, image_mime)
+    
+    data = await call_gpt_json(stage2_kind(), build_stage2_messages(profile, digest), options=options)
+    data.update(digest_sections(digest))
+    return data
+
+
+def digest_sections(digest: dict) -> dict:
+    """Response sections taken from the contest digest rather than stage 2"""
+    return {
+        "contestInfo": digest.get("contestInfo", {}),
+        "hiddenExpectations": digest.get("hiddenExpectations", []),
+        "digest": digest,
+    }
+
+
+def stage2_kind() -> str:
+    """Stage 2 writes only the narrative with local scoring, scores too otherwise"""
+    return "narrative" if SCORING_MODE == "local" else "score"
+
+
+def build_stage2_messages(profile: UserProfileInput, digest: dict) -> List[dict]:
+    """
+    Stage 2 prompt. With local scoring the scores are computed here and the
+    model only writes the narrative; otherwise the model scores as well.
+    """
+    if SCORING_MODE == "local":
+        return build_scoring_messages("narrative", profile, digest, score_from_digest(profile, digest))
+    return build_scoring_messages("score", profile, digest)
+
+
+async def _analyze_single_stage(
+    profile: UserProfileInput,
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    image_mime: str = "image/jpeg",
+    options: Optional[dict] = None
+) -> dict:
+    """Run the combined profile + contest prompt in a single GPT call"""
+    messages = build_analyze_messages(profile, contest_text, image_base64, image_mime)
+    return await call_gpt_json("analyze", messages, use_vision=bool(image_base64), options=options)
+
+
+def _as_int(value) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def score_from_digest(
+    profile: UserProfileInput,
+    digest: dict,
+    contest_info: Optional[ContestInfo] = None
+) -> AnalysisScores:
+    """Local deterministic scores using the digest's contest facts"""
+    if contest_info is None:
+        contest_info = ContestInfo(**(digest.get("contestInfo") or {}))
+    return compute_scores(
+        profile,
+        contest_info,
+        required_skills=digest.get("requiredSkills"),
+        estimated_hours=_as_int(digest.get("estimatedHours")),
+        difficulty=_as_int(digest.get("difficulty")),
+    )
+
+
+_NEUTRAL_SCORE = ScoreDetail(score=50, label="보통", reason="분석 중")
+
+
+def _scores_from_response(scores: Optional[AnalysisScores]) -> AnalysisScores:
+    """Model-provided scores, with neutral defaults for missing entries"""
+    scores = scores or AnalysisScores()
+    return AnalysisScores(**{
+        name: getattr(scores, name) or _NEUTRAL_SCORE
+        for name in AnalysisScores.model_fields
+    })
+
+
+def _scenario_weeks(
+    contest_info: ContestInfo,
+    scores: AnalysisScores,
+    total_hours: int,
+    profile: UserProfileInput
+) -> List[ScenarioWeek]:
+    """Week-by-week plan of this contest alone with the user's weekly hours"""
+    return scenario_weeks(
+        deadline=contest_info.deadline,
+        category=contest_info.category,
+        total_hours=total_hours,
+        hours_per_week=profile.hoursPerWeek or 10,
+        difficulty=scores.difficulty.score if scores.difficulty else None,
+        schedule_pressure=scores.schedulePressure.score if scores.schedulePressure else None
+    )
+
+
+def build_analysis_data(
+    data: dict,
+    profile: UserProfileInput,
+    contest_text: str,
+    options: dict = None
+) -> AnalysisData:
+    """Build AnalysisData from a parsed GPT response dict"""
+    # One validation pass fills defaults for anything the model left out
+    output = AnalyzeOutput.model_validate(data)
+    contest_info = output.contestInfo or ModelContestInfo()
     
-    hidden_expectations = [
-        HiddenExpectation(**exp) 
-        for exp in data.get("hiddenExpectations", [])[:3]
-    ] if data.get("hiddenExpectations") else None
+    if SCORING_MODE == "local":
+        scores = score_from_digest(profile, data.get("digest") or {}, contest_info)
+    else:
+        scores = _scores_from_response(output.scores)
     
-    deal_breakers = [
-        DealBreaker(**db) 
-        for db in data.get("dealBreakers", [])
-    ] if data.get("dealBreakers") else None
+    strategic_verdict = output.strategicVerdict or ModelStrategicVerdict()
     
-    checklist = [
-        ChecklistItem(**item) 
-        for item in data.get("checklist", [])[:10]
-    ] if options and options.get("generateChecklist") and data.get("checklist") else None
+    hidden_expectations = output.hiddenExpectations[:3] if output.hiddenExpectations else None
+    deal_breakers = output.dealBreakers or None
+    checklist = (
+        output.checklist[:10]
+        if options and options.get("generateChecklist") and output.checklist else None
+    )
     
-    scenario_data = data.get("scenario", {})
     scenario = ParticipationScenario(
-        totalHours=scenario_data.get("totalHours", 80),
-        weeksNeeded=scenario_data.get("weeksNeeded", 4),
+        **output.scenario.model_dump(),
         userWeeklyHours=profile.hoursPerWeek or 10,
-        feasible=scenario_data.get("feasible", True),
-        conclusion=scenario_data.get("conclusion", "참가 가능"),
-        weeks=[]  # Simplified for now
-    ) if scenario_data else None
+        weeks=_scenario_weeks(contest_info, scores, output.scenario.totalHours, profile)
+    ) if output.scenario else None
     
     # strengths와 concerns는 최소 1개 이상 필요
-    opportunities_list = data.get("opportunities", [])
-    warnings_list = data.get("warnings", [])
-    if not opportunities_list:
-        opportunities_list = ["공모전 참가 기회"]
-    if not warnings_list:
-        warnings_list = ["준비 과정 점검 필요"]
+    opportunities_list = output.opportunities or ["공모전 참가 기회"]
+    warnings_list = output.warnings or ["준비 과정 점검 필요"]
     
     return AnalysisData(
         contestInfo=contest_info,
         analysis=AnalysisResult(
-            recommendation=data.get("recommendation", "분석 결과를 확인하세요."),
+            recommendation=output.recommendation or "분석 결과를 확인하세요.",
             scores=scores,
             strengths=opportunities_list[:3],
             concerns=warnings_list[:3],
@@ -403,51 +1290,39 @@ async def analyze_with_gpt(
     )
 
 
-async def extract_with_gpt(image_base64: str) -> Tuple[ExtractedInfo, ExtractionConfidence, str]:
+async def analyze_packed_with_gpt(
+    profile: UserProfileInput,
+    contest_texts: List[str],
+    options: dict = None
+) -> List[AnalysisData]:
     """
-    Extract contest info from image using GPT Vision
+    Analyze several short contests for one profile in a single GPT call.
+    Raises if the response does not contain one result per contest.
     """
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT_EXTRACT},
-        {
-            "role": "user",
-            "content": [
-                {"type": "text", "text": "이 공모전 포스터에서 정보를 추출해주세요."},
-                {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{image_base64}",
-                        "detail": "high"
-                    }
-                }
-            ]
-        }
+    messages = build_batch_messages(profile, contest_texts)
+    results = (await call_gpt_json("batch", messages, options=options)).get("results", [])
+    if len(results) != len(contest_texts):
+        raise ValueError(f"Packed response has {len(results)} results for {len(contest_texts)} contests")
+    
+    return [
+        build_analysis_data(data, profile, text, options)
+        for data, text in zip(results, contest_texts)
     ]
+
+
+async def extract_with_gpt(
+    image_base64: str,
+    image_mime: str = "image/jpeg"
+) -> Tuple[ExtractedInfo, ExtractionConfidence, str]:
+    """
+    Extract contest info from image using GPT Vision
+    """
+    data = await call_gpt_json("extract", build_extract_messages(image_base64, image_mime), use_vision=True)
+    output = ExtractOutput.model_validate(data)
     
-    response_text = await call_gpt_api(messages, use_vision=True)
-    
-    if not response_text:
-        raise Exception("Failed to get response from GPT Vision API")
-    
-    data = parse_gpt_response(response_text)
-    
-    extracted = ExtractedInfo(
-        title=data.get("title"),
-        organizer=data.get("organizer"),
-        deadline=data.get("deadline"),
-        category=data.get("category", "일반"),
-        requirements=data.get("requirements"),
-        description=data.get("description")
-    )
-    
-    conf_data = data.get("confidence", {})
-    confidence = ExtractionConfidence(
-        title=conf_data.get("title", "medium"),
-        deadline=conf_data.get("deadline", "low"),
-        requirements=conf_data.get("requirements", "low")
-    )
-    
-    raw_text = data.get("rawText", "")
+    extracted = ExtractedInfo(**output.model_dump(include=set(ExtractedInfo.model_fields)))
+    confidence = output.confidence or ModelExtractionConfidence()
+    raw_text = output.rawText or ""
     
     return extracted, confidence, raw_text
 
@@ -487,43 +1362,8 @@ def generate_mock_contest_info(contest_text: str) -> ContestInfo:
 
 
 def generate_mock_scores(profile: UserProfileInput, contest_info: ContestInfo) -> AnalysisScores:
-    """Generate mock analysis scores"""
-    skill_count = len(profile.skills) if profile.skills else 0
-    base_skill_score = min(60 + skill_count * 10, 95)
-    skill_score = max(0, min(100, base_skill_score + random.randint(-10, 10)))
-    
-    difficulty_base = {"AI/ML": 75, "개발": 65, "디자인": 55, "창업/비즈니스": 60, "데이터": 70, "일반": 50}
-    difficulty_score = max(0, min(100, difficulty_base.get(contest_info.category, 50) + random.randint(-10, 10)))
-    
-    if contest_info.deadline:
-        try:
-            deadline = datetime.strptime(contest_info.deadline, "%Y-%m-%d")
-            days_left = (deadline - datetime.now()).days
-            pressure_score = 90 if days_left < 14 else 60 if days_left < 30 else 30
-            pressure_score = max(0, min(100, pressure_score + random.randint(-10, 10)))
-        except:
-            pressure_score = 50
-    else:
-        pressure_score = 50
-    
-    team_pref = profile.preferredTeamSize or "any"
-    team_score = 90 if team_pref == "solo" else 85
-    team_score = max(0, min(100, team_score + random.randint(-10, 10)))
-    
-    portfolio_base = {"AI/ML": 85, "개발": 80, "디자인": 75, "창업/비즈니스": 70, "데이터": 80, "일반": 60}
-    portfolio_score = max(0, min(100, portfolio_base.get(contest_info.category, 60) + random.randint(-10, 10)))
-    
-    readiness = int((skill_score * 0.3 + (100 - difficulty_score) * 0.2 + 
-                     (100 - pressure_score) * 0.2 + team_score * 0.15 + portfolio_score * 0.15))
-    
-    return AnalysisScores(
-        skillMatch=ScoreDetail(score=skill_score, label=get_label_from_score(skill_score), reason=f"보유 기술 {skill_count}개"),
-        difficulty=ScoreDetail(score=difficulty_score, label=get_label_from_score(difficulty_score, True), reason=f"{contest_info.category or '일반'} 분야"),
-        schedulePressure=ScoreDetail(score=pressure_score, label=get_label_from_score(pressure_score, True), reason="마감 일정 기준"),
-        teamFit=ScoreDetail(score=team_score, label=get_label_from_score(team_score), reason=f"참가 형태: {contest_info.teamSize or '무관'}"),
-        portfolioValue=ScoreDetail(score=portfolio_score, label=get_label_from_score(portfolio_score), reason=f"{contest_info.category or '일반'} 분야 가치"),
-        readiness=ScoreDetail(score=readiness, label=get_label_from_score(readiness), reason="종합 평가")
-    )
+    """Generate mock analysis scores (deterministic local scoring)"""
+    return compute_scores(profile, contest_info)
 
 
 def generate_mock_analysis(profile: UserProfileInput, contest_text: str, options: dict = None) -> AnalysisData:
@@ -576,7 +1416,7 @@ def generate_mock_analysis(profile: UserProfileInput, contest_text: str, options
         userWeeklyHours=user_weekly_hours,
         feasible=True,
         conclusion=f"주 {user_weekly_hours}시간 투자로 {weeks_needed}주 내 완료 가능",
-        weeks=[]
+        weeks=_scenario_weeks(contest_info, scores, total_hours, profile)
     )
     
     checklist = [
@@ -613,7 +1453,8 @@ async def analyze_contest(
     profile: UserProfileInput,
     contest_text: str,
     image_base64: Optional[str] = None,
-    options: dict = None
+    options: dict = None,
+    image_mime: str = "image/jpeg"
 ) -> AnalysisData:
     """
     Analyze a contest and generate recommendations.
@@ -624,7 +1465,7 @@ async def analyze_contest(
     
     if mode == "real":
         try:
-            return await analyze_with_gpt(profile, contest_text, image_base64, options)
+            return await analyze_with_gpt(profile, contest_text, image_base64, options, image_mime)
         except Exception as e:
             logger.error(f"GPT API failed, falling back to mock: {e}")
             import traceback
@@ -641,17 +1482,230 @@ async def analyze_contest(
         raise
 
 
-async def extract_from_image(image_base64: str) -> Tuple[ExtractedInfo, ExtractionConfidence, str]:
+# Top-level sections pushed to /analyze/stream clients, with their location in AnalysisData
+STREAM_SECTIONS = {
+    "contestInfo": lambda result: result.contestInfo,
+    "strategicVerdict": lambda result: result.analysis.strategicVerdict,
+    "scores": lambda result: result.analysis.scores,
+    "checklist": lambda result: result.analysis.checklist,
+    "scenario": lambda result: result.analysis.scenario,
+}
+
+
+def _stream_sections(
+    key: str,
+    data: dict,
+    profile: UserProfileInput,
+    contest_text: str,
+    options: dict = None
+) -> List[Tuple[str, object]]:
+    """
+    Validate the section(s) completed by `key` through the regular response
+    builder. With local scoring, scores follow contestInfo instead of the model.
+    """
+    keys = [key]
+    partial_data = {key: data[key]}
+    if SCORING_MODE == "local":
+        if key == "scores":
+            return []
+        if key == "contestInfo":
+            keys.append("scores")
+        partial_data.update({k: data[k] for k in ("contestInfo", "digest") if k in data})
+    
+    try:
+        partial = build_analysis_data(partial_data, profile, contest_text, options)
+    except Exception as e:
+        logger.warning(f"Skipping invalid streamed section {key}: {e}")
+        return []
+    
+    sections = []
+    for name in keys:
+        section = STREAM_SECTIONS[name](partial) if name in STREAM_SECTIONS else None
+        if section is None:
+            continue
+        payload = [item.model_dump() for item in section] if isinstance(section, list) else section.model_dump()
+        sections.append((name, payload))
+    return sections
+
+
+async def stream_analysis(
+    profile: UserProfileInput,
+    contest_text: str,
+    image_base64: Optional[str] = None,
+    options: dict = None,
+    image_mime: str = "image/jpeg"
+) -> AsyncIterator[Tuple[str, object]]:
+    """
+    Analyze a contest and yield (section, payload) pairs as soon as each
+    top-level section is complete, followed by ("result", AnalysisData).
+    """
+    mode = get_api_mode()
+    logger.info(f"Streaming contest analysis in {mode} mode")
+    
+    if mode == "real":
+        user_content = build_user_message(profile, contest_text)
+        model = OPENAI_VISION_MODEL if image_base64 else OPENAI_MODEL
+        cache_key = build_analysis_cache_key(model, user_content, image_base64, options)
+        cached = await _analysis_cache.aget(cache_key)
+        if cached:
+            result = AnalysisData.model_validate_json(cached)
+        else:
+            data = {}
+            if ANALYSIS_TWO_STAGE:
+                digest = await get_contest_digest(contest_text, image_base64, image_mime)
+                data.update(digest_sections(digest))
+                for section in _stream_sections("contestInfo", data, profile, contest_text, options):
+                    yield section
+                deltas = call_gpt_api_stream(
+                    build_stage2_messages(profile, digest),
+                    use_vision=False,
+                    kind=stage2_kind()
+                )
+            else:
+                deltas = call_gpt_api_stream(
+                    build_analyze_messages(profile, contest_text, image_base64, image_mime),
+                    use_vision=bool(image_base64),
+                    kind="analyze"
+                )
+            
+            parser = JsonSectionParser()
+            sections_found = False
+            async for delta in deltas:
+                for key, value in parser.feed(delta):
+                    sections_found = True
+                    # Sections already taken from the contest digest win
+                    if key in data:
+                        continue
+                    data[key] = value
+                    for section in _stream_sections(key, data, profile, contest_text, options):
+                        yield section
+            
+            if not parser.text:
+                raise Exception("Failed to get response from GPT API")
+            if not sections_found:
+                # Fall back to a full parse if sections could not be detected
+                for key, value in parse_gpt_response(parser.text).items():
+                    data.setdefault(key, value)
+            
+            result = build_analysis_data(data, profile, contest_text, options)
+            await _analysis_cache.aset(cache_key, result.model_dump_json())
+            yield "result", result
+            return
+    else:
+        result = generate_mock_analysis(profile, contest_text, options)
+    
+    # Cached or mock results are already complete; send every section at once
+    for key, locate in STREAM_SECTIONS.items():
+        section = locate(result)
+        if section is None:
+            continue
+        yield key, [item.model_dump() for item in section] if isinstance(section, list) else section.model_dump()
+    yield "result", result
+
+
+def _extraction_version() -> str:
+    """Cached extractions are only valid for the prompt and model that produced them"""
+    return make_cache_key(SYSTEM_PROMPT_EXTRACT, OPENAI_VISION_MODEL)[:16]
+
+
+async def lookup_extraction(image_hash: int) -> Optional[ExtractionData]:
+    """
+    Return a cached extraction for the same or a near-duplicate poster.
+    Counts one cache hit or miss per lookup, however many candidates it tries.
+    """
+    version = _extraction_version()
+    while True:
+        match = _extraction_index.nearest(image_hash)
+        if match is None:
+            _extraction_cache.record_miss()
+            return None
+        
+        match_hash, distance = match
+        cached = await _extraction_cache.aget(f"{match_hash:016x}", count=False)
+        entry = json.loads(cached) if cached is not None else None
+        if entry is not None and entry.get("version") == version:
+            _extraction_cache.record_hit()
+            logger.info(f"Extraction dedup hit (hamming distance {distance})")
+            return ExtractionData(**entry["data"])
+        # Expired, evicted or made by another prompt/model: drop it from the index
+        # so it no longer shadows a valid neighbour, and try the next nearest
+        _extraction_index.remove(match_hash)
+
+
+async def store_extraction(
+    image_hash: int,
+    extracted: ExtractedInfo,
+    confidence: ExtractionConfidence,
+    raw_text: str
+) -> None:
+    """Cache an extraction under the poster's perceptual hash"""
+    data = ExtractionData(extracted=extracted, confidence=confidence, rawText=raw_text)
+    entry = {"version": _extraction_version(), "data": data.model_dump()}
+    await _extraction_cache.aset(f"{image_hash:016x}", json.dumps(entry, ensure_ascii=False))
+    _extraction_index.add(image_hash)
+    
+    # Evicted entries stay in the index until looked up; rebuild when it drifts too far
+    if len(_extraction_index) > 2 * ANALYSIS_CACHE_MAX_ENTRIES:
+        _extraction_index.clear()
+        for key in await asyncio.to_thread(_extraction_cache.keys):
+            _extraction_index.add(int(key, 16))
+
+
+async def _run_extraction(
+    image_base64: str,
+    image_mime: str,
+    image_hash: Optional[int]
+) -> Tuple[ExtractedInfo, ExtractionConfidence, str]:
+    """GPT Vision extraction plus cache and catalog writes"""
+    extracted, confidence, raw_text = await extract_with_gpt(image_base64, image_mime)
+    if image_hash is not None:
+        await store_extraction(image_hash, extracted, confidence, raw_text)
+    await asyncio.to_thread(
+        record_contest,
+        ContestInfo(
+            title=extracted.title,
+            organizer=extracted.organizer,
+            category=extracted.category,
+            deadline=extracted.deadline,
+            requirements=[extracted.requirements] if extracted.requirements else None,
+            description=extracted.description,
+        ),
+        extraction={
+            "extracted": extracted.model_dump(),
+            "confidence": confidence.model_dump(),
+            "rawText": raw_text,
+        }
+    )
+    return extracted, confidence, raw_text
+
+
+async def extract_from_image(
+    image_base64: str,
+    image_mime: str = "image/jpeg",
+    image_hash: Optional[int] = None
+) -> Tuple[ExtractedInfo, ExtractionConfidence, str]:
     """
     Extract contest information from image.
     Uses GPT Vision if available, returns mock data otherwise.
+    Near-duplicate posters (by perceptual hash) are served from cache.
     """
     mode = get_api_mode()
     logger.info(f"Extracting from image in {mode} mode")
     
     if mode == "real":
+        if image_hash is None:
+            image_hash = dhash_from_base64(image_base64)
+        if image_hash is not None:
+            cached = await lookup_extraction(image_hash)
+            if cached:
+                return cached.extracted, cached.confidence, cached.rawText
+        
+        flight_key = f"{image_hash:016x}" if image_hash is not None else digest_bytes(image_base64)
         try:
-            return await extract_with_gpt(image_base64)
+            return await _extraction_flight.do(
+                flight_key,
+                lambda: _run_extraction(image_base64, image_mime, image_hash)
+            )
         except Exception as e:
             logger.error(f"GPT Vision failed, falling back to mock: {e}")
     
@@ -712,43 +1766,7 @@ async def calculate_readiness(
     progress: dict = None
 ) -> ReadinessData:
     """Calculate contest readiness score"""
-    skill_count = len(profile.skills) if profile.skills else 0
-    skill_readiness = min(50 + skill_count * 15, 95)
-    
-    hours = profile.hoursPerWeek or 10
-    time_readiness = min(40 + hours * 3, 90)
-    
-    if progress:
-        done = progress.get("checklistDone", 0)
-        total = progress.get("checklistTotal", 1)
-        progress_readiness = int((done / max(total, 1)) * 100)
-    else:
-        progress_readiness = 30
-    
-    resource_readiness = 80
-    
-    overall = int(
-        skill_readiness * 0.35 +
-        time_readiness * 0.25 +
-        progress_readiness * 0.25 +
-        resource_readiness * 0.15
-    )
-    
-    improvements = []
-    if progress_readiness < 50:
-        improvements.append(ReadinessImprovement(action="체크리스트 항목 완료하기", impact="+15점"))
-    if skill_readiness < 70:
-        improvements.append(ReadinessImprovement(action="관련 기술 학습/복습", impact="+10점"))
-    if time_readiness < 60:
-        improvements.append(ReadinessImprovement(action="주간 투자 시간 늘리기", impact="+10점"))
-    
-    return ReadinessData(
-        readinessScore=overall,
-        breakdown=ReadinessBreakdown(
-            skillReadiness=skill_readiness,
-            timeReadiness=time_readiness,
-            progressReadiness=progress_readiness,
-            resourceReadiness=resource_readiness
-        ),
-        improvements=improvements
-    )
+    skill = skill_readiness(profile)
+    time_score = time_readiness(profile)
+    progress_score = progress_readiness(progress)
+    return readiness_data(skill, time_score, progress_score, overall_readiness(skill, time_score, progress_score))
@@ -0,0 +1,132 @@
+"""
+Hedge Service - Tail-latency hedging for upstream calls
+
+This module provides:
+- Rolling windows of recent upstream latencies, one per model
+- A percentile-based hedge delay
+- Running the same call twice after that delay and keeping the first result
+- Counters for fired/winning hedges
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    Fires a second attempt when the first is slower than `percentile` of
+    recent calls. Until `min_samples` latencies are known, `initial_delay`
+    is used; the delay is never below `min_delay`.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        percentile: float,
+        min_delay: float,
+        initial_delay: float,
+        window: int = 200,
+        min_samples: int = 20
+    ):
+        self.enabled = enabled
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies = {}
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def record(self, seconds: float, key: Optional[str] = None) -> None:
+        if key not in self._latencies:
+            self._latencies[key] = deque(maxlen=self.window)
+        self._latencies[key].append(seconds)
+
+    def _quantile(self, q: float, key: Optional[str] = None) -> Optional[float]:
+        latencies = self._latencies.get(key)
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def delay(self, key: Optional[str] = None) -> float:
+        if len(self._latencies.get(key, ())) < self.min_samples:
+            return self.initial_delay
+        return max(self.min_delay, self._quantile(self.percentile, key))
+
+    async def run(
+        self,
+        attempt: Callable[[], Awaitable[T]],
+        can_hedge: Callable[[], bool] = lambda: True,
+        budget: Optional[float] = None,
+        key: Optional[str] = None
+    ) -> T:
+        """
+        Run attempt(); if it has not finished after delay(key) (and there is
+        budget left and can_hedge() allows), start a second one and return
+        whichever succeeds first. The loser is cancelled.
+
+        attempt() records its own latency when it completes. When the hedge
+        wins, the cancelled primary's elapsed time is recorded as well, as a
+        lower bound on that slow call: leaving it out would drop exactly the
+        tail the percentile is meant to track. A cancelled hedge says nothing
+        about the tail and is never recorded.
+        """
+        self.calls += 1
+        started = time.monotonic()
+        primary = asyncio.ensure_future(attempt())
+        delay = self.delay(key)
+        if not self.enabled or (budget is not None and budget <= delay):
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not can_hedge():
+            return await primary
+
+        self.hedged += 1
+        logger.info(f"Hedging slow upstream call after {delay:.2f}s")
+        hedge = asyncio.ensure_future(attempt())
+        pending = {primary, hedge}
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_wins += 1
+                            if not primary.done():
+                                self.record(time.monotonic() - started, key)
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedgeWins": self.hedge_wins,
+            "models": {
+                key or "default": {
+                    "hedgeDelaySeconds": round(self.delay(key), 3),
+                    "p50Seconds": round(self._quantile(50, key), 3),
+                    "p95Seconds": round(self._quantile(95, key), 3),
+                    "samples": len(latencies),
+                }
+                for key, latencies in self._latencies.items()
+            },
+        }
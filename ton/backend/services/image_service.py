@@ -0,0 +1,147 @@
+"""
+Image Service - Poster preprocessing before GPT Vision calls
+
+This module provides:
+- Decode, orientation fix and downscale to the vision model's effective resolution
+- Re-encoding to a compact JPEG/WebP without metadata
+- Vision token estimates for benchmarking
+"""
+
+import base64
+import io
+import logging
+import math
+from dataclasses import dataclass
+from typing import BinaryIO, Optional, Union
+
+from PIL import Image, ImageOps
+
+from config import (
+    IMAGE_MAX_LONG_SIDE,
+    IMAGE_MAX_SHORT_SIDE,
+    IMAGE_TILE_SNAP_RATIO,
+    IMAGE_OUTPUT_FORMAT,
+    IMAGE_QUALITY,
+)
+from constants import VISION_TILE_SIZE, VISION_BASE_TOKENS, VISION_TOKENS_PER_TILE
+from services.dedup_service import compute_dhash
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_MIME_TYPES = {"JPEG": "image/jpeg", "WEBP": "image/webp", "PNG": "image/png"}
+
+
+@dataclass
+class PreparedImage:
+    """Encoded image ready for a data URL, with size bookkeeping"""
+    base64: str
+    mime_type: str
+    original_bytes: int
+    processed_bytes: int
+    width: int
+    height: int
+    dhash: Optional[int] = None
+
+
+def fit_vision_size(width: int, height: int, max_long: int, max_short: int) -> tuple:
+    """Scale (width, height) down to fit max_long x max_long and a max_short shortest side"""
+    scale = min(1.0, max_long / max(width, height), max_short / min(width, height))
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def snap_to_tiles(width: int, height: int, ratio: float) -> tuple:
+    """
+    Shrink slightly so the long side ends on a tile boundary when that only
+    costs a small fraction of the resolution but saves a whole row of tiles.
+    """
+    long_side = max(width, height)
+    snapped = (math.ceil(long_side / VISION_TILE_SIZE) - 1) * VISION_TILE_SIZE
+    if snapped <= 0 or long_side - snapped > long_side * ratio:
+        return width, height
+    scale = snapped / long_side
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def estimate_vision_tokens(width: int, height: int) -> int:
+    """Estimate high-detail vision tokens using OpenAI's 512px tile rule"""
+    # The API itself fits images into 2048x2048 and then a 768px shortest side
+    width, height = fit_vision_size(width, height, 2048, 768)
+    tiles = math.ceil(width / VISION_TILE_SIZE) * math.ceil(height / VISION_TILE_SIZE)
+    return VISION_BASE_TOKENS + VISION_TOKENS_PER_TILE * tiles
+
+
+def preprocess_image(source: Union[bytes, BinaryIO], content_type: str) -> PreparedImage:
+    """
+    Decode and shrink an uploaded image for GPT Vision.
+    Falls back to the original bytes if the image cannot be decoded.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    source.seek(0, io.SEEK_END)
+    original_bytes = source.tell()
+    source.seek(0)
+
+    try:
+        image = Image.open(source)
+        source_format = image.format
+        # JPEG can decode directly at a reduced scale, which keeps large posters cheap
+        image.draft("RGB", fit_vision_size(image.width, image.height, IMAGE_MAX_LONG_SIDE, IMAGE_MAX_SHORT_SIDE))
+        image = ImageOps.exif_transpose(image)
+        original_width, original_height = image.size
+        target = fit_vision_size(image.width, image.height, IMAGE_MAX_LONG_SIDE, IMAGE_MAX_SHORT_SIDE)
+        target = snap_to_tiles(*target, IMAGE_TILE_SNAP_RATIO)
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+        if image.size != target:
+            image = image.resize(target, Image.LANCZOS)
+        dhash = compute_dhash(image)
+
+        # Re-encoding without exif/icc drops all metadata
+        output_format = IMAGE_OUTPUT_FORMAT
+        encoded = _encode(image, output_format)
+        if source_format == "PNG" and len(encoded) >= original_bytes:
+            # Flat-color graphics (screenshots) compress better losslessly
+            png = _encode(image, "PNG")
+            if len(png) < len(encoded):
+                output_format, encoded = "PNG", png
+        if len(encoded) >= original_bytes and image.size == (original_width, original_height):
+            # Already compact and not resized; keep the original
+            prepared = _passthrough(source, content_type, original_bytes, image.width, image.height)
+            prepared.dhash = dhash
+            return prepared
+        return PreparedImage(
+            base64=base64.b64encode(encoded).decode("utf-8"),
+            mime_type=OUTPUT_MIME_TYPES.get(output_format, "image/jpeg"),
+            original_bytes=original_bytes,
+            processed_bytes=len(encoded),
+            width=image.width,
+            height=image.height,
+            dhash=dhash,
+        )
+    except Exception as e:
+        logger.warning(f"Image preprocessing failed, sending original: {e}")
+        return _passthrough(source, content_type, original_bytes, 0, 0)
+
+
+def _encode(image: Image.Image, output_format: str) -> bytes:
+    output = io.BytesIO()
+    image.save(output, format=output_format, quality=IMAGE_QUALITY, optimize=True)
+    return output.getvalue()
+
+
+def _passthrough(source: BinaryIO, content_type: str, original_bytes: int, width: int, height: int) -> PreparedImage:
+    """Send the uploaded bytes unchanged"""
+    source.seek(0)
+    return PreparedImage(
+        base64=base64.b64encode(source.read()).decode("utf-8"),
+        mime_type=content_type,
+        original_bytes=original_bytes,
+        processed_bytes=original_bytes,
+        width=width,
+        height=height,
+    )
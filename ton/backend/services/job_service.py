@@ -0,0 +1,398 @@
+"""
+Job Service - Background analysis jobs
+
+This module provides:
+- SQLite-backed job store, so queued and interrupted jobs survive restarts
+- A bounded pool of asyncio workers running analyze_contest
+- Long-poll waits for job completion and optional webhook delivery
+  (only to allow-listed or public hosts)
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config import (
+    JOBS_PATH,
+    JOB_WORKERS,
+    JOB_QUEUE_MAX,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETENTION,
+    OPENAI_MODEL,
+    REQUEST_DEADLINE,
+    WEBHOOK_ALLOWED_HOSTS,
+    get_api_mode,
+    is_api_key_valid
+)
+from schemas import AnalysisData, JobInfo, UserProfileInput
+from services.deadline_service import request_deadline
+from services.gpt_service import analyze_contest
+from services.metrics_service import track_request
+
+logger = logging.getLogger(__name__)
+
+FINISHED = ("succeeded", "failed")
+WEBHOOK_TIMEOUT_SECONDS = 10
+PRUNE_INTERVAL_SECONDS = 60
+
+
+class QueueFull(Exception):
+    """More unfinished jobs than JOB_QUEUE_MAX"""
+
+
+def _is_public(address: str) -> bool:
+    ip = ipaddress.ip_address(address.split("%", 1)[0])
+    if ip.version == 6 and ip.ipv4_mapped:
+        ip = ip.ipv4_mapped
+    return ip.is_global and not ip.is_multicast
+
+
+async def check_webhook_url(url: str) -> Optional[str]:
+    """
+    Reason `url` may not receive webhooks, or None if it may. Hosts in
+    WEBHOOK_ALLOWED_HOSTS are trusted as is; with an allow-list set, nothing
+    else is. Without one, every address the host resolves to must be public,
+    so callbacks cannot reach loopback, private or link-local (cloud metadata)
+    addresses.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return "callback_url must be an http(s) URL"
+    host = parts.hostname.lower()
+    if WEBHOOK_ALLOWED_HOSTS:
+        return None if host in WEBHOOK_ALLOWED_HOSTS else "callback_url host is not allowed"
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (ValueError, OSError):
+        return "callback_url host could not be resolved"
+    if not infos or not all(_is_public(info[4][0]) for info in infos):
+        return "callback_url must resolve to a public address"
+    return None
+
+
+class JobStore:
+    """Job rows in SQLite (":memory:" when no path is configured)"""
+
+    def __init__(self, path: str):
+        self.path = path or ":memory:"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                input_json TEXT NOT NULL,
+                callback_url TEXT,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                result_json TEXT,
+                error TEXT,
+                meta_json TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at);
+            CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs(finished_at);
+        """)
+        self._conn.commit()
+
+    def create(self, kind: str, payload: dict, callback_url: Optional[str] = None) -> str:
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, input_json, callback_url, created_at) "
+                "VALUES (?, ?, 'queued', ?, ?, ?)",
+                (job_id, kind, json.dumps(payload, ensure_ascii=False), callback_url, time.time()),
+            )
+            self._conn.commit()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def claim(self, job_id: str) -> Optional[sqlite3.Row]:
+        """Mark a queued job running; None if it is gone or already taken"""
+        with self._lock:
+            claimed = self._conn.execute(
+                "UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1 "
+                "WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id),
+            ).rowcount
+            self._conn.commit()
+            if not claimed:
+                return None
+            return self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def finish(self, job_id: str, result_json: Optional[str], error: Optional[str], meta: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result_json = ?, error = ?, meta_json = ?, finished_at = ? "
+                "WHERE id = ?",
+                ("failed" if error else "succeeded", result_json, error,
+                 json.dumps(meta, ensure_ascii=False), time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def release(self, job_id: str) -> None:
+        """Put a job interrupted by shutdown back in the queue without using an attempt"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, attempts = attempts - 1 "
+                "WHERE id = ? AND status = 'running'",
+                (job_id,),
+            )
+            self._conn.commit()
+
+    def recover(self, max_attempts: int) -> List[str]:
+        """
+        After a restart: requeue jobs that were running (a crash or kill cut
+        them off) unless they used up their attempts, then list queued jobs.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Interrupted too many times', finished_at = ? "
+                "WHERE status = 'running' AND attempts >= ?",
+                (now, max_attempts),
+            )
+            self._conn.execute("UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'")
+            self._conn.commit()
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at"
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def prune(self, older_than: float) -> int:
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (older_than,)
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {"queued": 0, "running": 0, "succeeded": 0, "failed": 0}
+        counts.update({row[0]: row[1] for row in rows})
+        return counts
+
+
+def job_info(row: sqlite3.Row) -> JobInfo:
+    return JobInfo(
+        id=row["id"],
+        status=row["status"],
+        attempts=row["attempts"],
+        createdAt=row["created_at"],
+        startedAt=row["started_at"],
+        finishedAt=row["finished_at"],
+        result=AnalysisData.model_validate_json(row["result_json"]) if row["result_json"] else None,
+        error=row["error"],
+        meta=json.loads(row["meta_json"]) if row["meta_json"] else None,
+    )
+
+
+class JobQueue:
+    """
+    Worker pool over the job store. The in-process queue only wakes workers;
+    the store's queued -> running transition decides who runs a job. Store
+    calls run in a worker thread so SQLite commits never block the event loop.
+    """
+
+    def __init__(self, store: JobStore, workers: int, max_pending: int, max_attempts: int):
+        self.store = store
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        # Per job: event set when it finishes here, and how many wait() calls share it
+        self._done: Dict[str, asyncio.Event] = {}
+        self._waiters: Dict[str, int] = {}
+        self._deliveries: set = set()
+        self._last_prune = 0.0
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        await asyncio.to_thread(self.store.prune, time.time() - JOB_RETENTION)
+        recovered = await asyncio.to_thread(self.store.recover, self.max_attempts)
+        for job_id in recovered:
+            self._queue.put_nowait(job_id)
+        if recovered:
+            logger.info(f"Resuming {len(recovered)} queued job(s)")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit_analysis(
+        self,
+        profile: UserProfileInput,
+        contest_text: str,
+        options: dict,
+        image_base64: Optional[str] = None,
+        image_mime: str = "image/jpeg",
+        callback_url: Optional[str] = None
+    ) -> JobInfo:
+        counts = await asyncio.to_thread(self.store.counts)
+        if counts["queued"] + counts["running"] >= self.max_pending:
+            raise QueueFull(f"Job queue is full ({self.max_pending} pending)")
+
+        now = time.time()
+        if now - self._last_prune > PRUNE_INTERVAL_SECONDS:
+            self._last_prune = now
+            await asyncio.to_thread(self.store.prune, now - JOB_RETENTION)
+
+        payload = {
+            "profile": profile.model_dump(),
+            "contestText": contest_text,
+            "options": options,
+            "image": {"base64": image_base64, "mime": image_mime} if image_base64 else None,
+        }
+        job_id = await asyncio.to_thread(self.store.create, "analyze", payload, callback_url)
+        self._queue.put_nowait(job_id)
+        return await self.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[JobInfo]:
+        row = await asyncio.to_thread(self.store.get, job_id)
+        return job_info(row) if row else None
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[JobInfo]:
+        """
+        Long poll: return once the job finishes or `timeout` passes.
+        Also re-reads the store each second so jobs finished by another
+        process sharing JOBS_PATH are noticed.
+        """
+        deadline = time.monotonic() + timeout
+        # Registered before the first read, so a finish in between still wakes us
+        event = self._done.setdefault(job_id, asyncio.Event())
+        self._waiters[job_id] = self._waiters.get(job_id, 0) + 1
+        try:
+            while True:
+                row = await asyncio.to_thread(self.store.get, job_id)
+                left = deadline - time.monotonic()
+                if row is None or row["status"] in FINISHED or left <= 0:
+                    return job_info(row) if row else None
+                try:
+                    await asyncio.wait_for(event.wait(), min(left, 1.0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # The last waiter to leave drops the event, whether or not the job finished here
+            self._waiters[job_id] -= 1
+            if not self._waiters[job_id]:
+                del self._waiters[job_id]
+                del self._done[job_id]
+
+    def stats(self) -> dict:
+        return {
+            **self.store.counts(),
+            "workers": self.workers,
+            "maxPending": self.max_pending,
+            "persistent": self.store.path != ":memory:",
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            row = await asyncio.to_thread(self.store.claim, job_id)
+            if row is None:
+                continue
+            try:
+                await self._run(row)
+            except asyncio.CancelledError:
+                # Shutting down: release synchronously, the task cannot await any more
+                self.store.release(job_id)
+                raise
+            except Exception as e:
+                logger.exception(f"Job {job_id} crashed")
+                await asyncio.to_thread(self.store.finish, job_id, None, f"Job failed: {str(e)}", {})
+            event = self._done.get(job_id)
+            if event:
+                event.set()
+            if row["callback_url"]:
+                delivery = asyncio.create_task(self._deliver(row["callback_url"], job_id))
+                self._deliveries.add(delivery)
+                delivery.add_done_callback(self._deliveries.discard)
+
+    async def _run(self, row: sqlite3.Row) -> None:
+        payload = json.loads(row["input_json"])
+        image = payload.get("image") or {}
+        started = time.time()
+        with track_request("/jobs/analyze", get_api_mode()) as usage:
+            try:
+                with request_deadline(REQUEST_DEADLINE):
+                    result = await analyze_contest(
+                        profile=UserProfileInput(**payload["profile"]),
+                        contest_text=payload["contestText"],
+                        image_base64=image.get("base64"),
+                        options=payload["options"],
+                        image_mime=image.get("mime", "image/jpeg")
+                    )
+                result_json, error = result.model_dump_json(), None
+            except Exception as e:
+                usage.status = "error"
+                logger.error(f"Job {row['id']} failed: {e}")
+                result_json, error = None, f"Analysis failed: {str(e)}"
+            meta = {
+                "processingTime": int((time.time() - started) * 1000),
+                "modelUsed": OPENAI_MODEL if is_api_key_valid() else "mock",
+                "aiMode": get_api_mode(),
+                "usage": usage.to_dict(),
+            }
+        await asyncio.to_thread(self.store.finish, row["id"], result_json, error, meta)
+
+    async def _deliver(self, url: str, job_id: str) -> None:
+        """POST the finished job to its webhook; best effort, never retried"""
+        info = await self.get(job_id)
+        if info is None:
+            return
+        # Checked again at delivery: the host may resolve differently than at submit
+        rejected = await check_webhook_url(url)
+        if rejected:
+            logger.warning(f"Webhook for job {job_id} skipped: {rejected}")
+            return
+        try:
+            async with httpx.AsyncClient(timeout=WEBHOOK_TIMEOUT_SECONDS) as client:
+                response = await client.post(
+                    url, content=info.model_dump_json(), headers={"Content-Type": "application/json"}
+                )
+                response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Webhook for job {job_id} failed: {e}")
+
+
+_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Shared job queue; falls back to an in-memory store if JOBS_PATH cannot be opened"""
+    global _queue
+    if _queue is None:
+        try:
+            store = JobStore(JOBS_PATH)
+        except sqlite3.Error as e:
+            logger.error(f"Job store unavailable, jobs will not survive restarts: {e}")
+            store = JobStore("")
+        _queue = JobQueue(store, JOB_WORKERS, JOB_QUEUE_MAX, JOB_MAX_ATTEMPTS)
+    return _queue
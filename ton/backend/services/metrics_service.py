@@ -0,0 +1,214 @@
+"""
+Metrics Service - Token, cost and latency accounting
+
+This module provides:
+- Prometheus-style counters and histograms, rendered for /metrics
+- Per-request usage tracking carried in a contextvar (for response meta)
+- LLM usage attribution per endpoint, model and request kind
+"""
+
+import bisect
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from services.routing_service import estimate_cost
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0, 90.0)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+TOKEN_TYPES = ("prompt", "completion", "cached", "image")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(round(value, 9))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...]):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.help = help_text
+        self.labels = labels
+        self.buckets = buckets
+        # key -> (per-bucket counts, sum, count)
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labels)
+        entry = self._values.get(key)
+        if entry is None:
+            entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+        entry[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in sorted(self._values.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = _format_labels(self.labels, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(self.labels, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{le} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+
+REQUESTS = Counter(
+    "contest_guide_requests_total", "Tracked API requests", ("endpoint", "mode", "status")
+)
+REQUEST_DURATION = Histogram(
+    "contest_guide_request_duration_seconds", "End-to-end request latency", ("endpoint", "mode"), LATENCY_BUCKETS
+)
+REQUEST_TOKENS = Histogram(
+    "contest_guide_request_tokens", "LLM tokens (prompt + completion) used per request", ("endpoint", "mode"), TOKEN_BUCKETS
+)
+LLM_CALLS = Counter(
+    "contest_guide_llm_calls_total", "Successful LLM calls", ("endpoint", "model", "kind")
+)
+LLM_TOKENS = Counter(
+    "contest_guide_llm_tokens_total",
+    "LLM tokens by type (cached and image tokens are part of prompt tokens; image tokens are estimated)",
+    ("endpoint", "model", "kind", "type")
+)
+LLM_COST = Counter(
+    "contest_guide_llm_cost_usd_total", "Estimated LLM cost in USD", ("endpoint", "model", "kind")
+)
+LLM_DURATION = Histogram(
+    "contest_guide_llm_call_duration_seconds", "LLM call latency including retries", ("endpoint", "model", "kind"), LATENCY_BUCKETS
+)
+
+_METRICS = (REQUESTS, REQUEST_DURATION, REQUEST_TOKENS, LLM_CALLS, LLM_TOKENS, LLM_COST, LLM_DURATION)
+
+
+class RequestUsage:
+    """LLM usage accumulated while serving one request"""
+
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+        self.status = "ok"
+        self.by_model: Dict[str, Dict[str, float]] = {}
+
+    def add(self, model: str, prompt: int, completion: int, cached: int, image: int, cost: float) -> None:
+        entry = self.by_model.setdefault(model, {
+            "calls": 0, "promptTokens": 0, "completionTokens": 0,
+            "cachedTokens": 0, "imageTokens": 0, "costUsd": 0.0,
+        })
+        entry["calls"] += 1
+        entry["promptTokens"] += prompt
+        entry["completionTokens"] += completion
+        entry["cachedTokens"] += cached
+        entry["imageTokens"] += image
+        entry["costUsd"] += cost
+
+    @property
+    def total_tokens(self) -> int:
+        return int(sum(e["promptTokens"] + e["completionTokens"] for e in self.by_model.values()))
+
+    def to_dict(self) -> dict:
+        totals = {"calls": 0, "promptTokens": 0, "completionTokens": 0, "cachedTokens": 0, "imageTokens": 0, "costUsd": 0.0}
+        for entry in self.by_model.values():
+            for key in totals:
+                totals[key] += entry[key]
+        totals["costUsd"] = round(totals["costUsd"], 6)
+        totals["byModel"] = {
+            model: {**entry, "costUsd": round(entry["costUsd"], 6)}
+            for model, entry in self.by_model.items()
+        }
+        return totals
+
+
+_current: contextvars.ContextVar[Optional[RequestUsage]] = contextvars.ContextVar("request_usage", default=None)
+
+
+@contextmanager
+def track_request(endpoint: str, mode: str):
+    """
+    Attribute LLM usage inside to `endpoint` and record request metrics on
+    exit. Tasks spawned inside (coalesced or batched calls) inherit it.
+    Handlers that turn failures into error responses set usage.status.
+    """
+    usage = RequestUsage(endpoint)
+    token = _current.set(usage)
+    started = time.monotonic()
+    try:
+        yield usage
+    except BaseException:
+        usage.status = "error"
+        raise
+    finally:
+        _current.reset(token)
+        REQUESTS.inc(endpoint=endpoint, mode=mode, status=usage.status)
+        REQUEST_DURATION.observe(time.monotonic() - started, endpoint=endpoint, mode=mode)
+        REQUEST_TOKENS.observe(usage.total_tokens, endpoint=endpoint, mode=mode)
+
+
+def record_llm_call(
+    model: str,
+    kind: Optional[str],
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+    image_tokens: int = 0,
+    latency: float = 0.0
+) -> None:
+    """Count one successful LLM call against the current request's endpoint"""
+    usage = _current.get()
+    endpoint = usage.endpoint if usage else "internal"
+    kind = kind or "other"
+    cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens) or 0.0
+
+    labels = {"endpoint": endpoint, "model": model, "kind": kind}
+    LLM_CALLS.inc(**labels)
+    for token_type, amount in zip(TOKEN_TYPES, (prompt_tokens, completion_tokens, cached_tokens, image_tokens)):
+        LLM_TOKENS.inc(amount, type=token_type, **labels)
+    LLM_COST.inc(cost, **labels)
+    LLM_DURATION.observe(latency, **labels)
+
+    if usage:
+        usage.add(model, prompt_tokens, completion_tokens, cached_tokens, image_tokens, cost)
+
+
+def current_usage() -> Optional[RequestUsage]:
+    return _current.get()
+
+
+def render_metrics() -> str:
+    """Prometheus text exposition of every metric"""
+    lines: List[str] = []
+    for metric in _METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,76 @@
+"""
+Output Schema Service - Structured-output JSON schemas for model responses
+
+This module provides:
+- The response model for each request kind (digest, narrative, score, ...)
+- Strict JSON schemas generated once from those pydantic models
+- The matching OpenAI `response_format` payloads
+"""
+
+import copy
+from typing import Dict, Optional, Type
+
+from pydantic import BaseModel
+
+from schemas import (
+    DigestOutput,
+    NarrativeOutput,
+    ScoreOutput,
+    AnalyzeOutput,
+    BatchOutput,
+    ExtractOutput,
+)
+
+OUTPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    "digest": DigestOutput,
+    "narrative": NarrativeOutput,
+    "score": ScoreOutput,
+    "analyze": AnalyzeOutput,
+    "batch": BatchOutput,
+    "extract": ExtractOutput,
+}
+
+# Keywords strict mode rejects or that only cost prompt tokens
+_DROPPED_KEYWORDS = ("default", "title")
+
+
+def _make_strict(node) -> None:
+    if isinstance(node, dict):
+        for keyword in _DROPPED_KEYWORDS:
+            # "title" is also a property name; only drop the keyword itself
+            if keyword in node and not isinstance(node[keyword], dict):
+                del node[keyword]
+        properties = node.get("properties")
+        if node.get("type") == "object" and isinstance(properties, dict):
+            node["required"] = list(properties)
+            node["additionalProperties"] = False
+        for value in node.values():
+            _make_strict(value)
+    elif isinstance(node, list):
+        for item in node:
+            _make_strict(item)
+
+
+def strict_json_schema(model: Type[BaseModel]) -> dict:
+    """
+    JSON schema for OpenAI strict structured outputs: every property is
+    required (optional ones are nullable) and no extra properties are allowed.
+    """
+    schema = copy.deepcopy(model.model_json_schema())
+    _make_strict(schema)
+    return schema
+
+
+# Built once at import so each call reuses the same payload
+_RESPONSE_FORMATS = {
+    kind: {
+        "type": "json_schema",
+        "json_schema": {"name": f"{kind}_output", "strict": True, "schema": strict_json_schema(model)},
+    }
+    for kind, model in OUTPUT_MODELS.items()
+}
+
+
+def response_format_for(kind: str) -> Optional[dict]:
+    """Structured-output response_format for a request kind, if one is defined"""
+    return _RESPONSE_FORMATS.get(kind)
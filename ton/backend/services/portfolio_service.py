@@ -0,0 +1,188 @@
+"""
+Portfolio Service - Which contests to pursue under a weekly time budget
+
+This module provides:
+- Per-contest value (portfolioValue weighted by readiness), hours and the
+  hours available before its buffered deadline
+- Exact selection: a deadline-ordered knapsack DP, optimal for one shared
+  weekly budget (a set is feasible iff, in deadline order, every prefix of
+  hours fits in the time before that deadline)
+- A greedy value-per-hour heuristic with the same feasibility test
+- A weekly plan of the chosen set from the schedule engine
+"""
+
+import math
+from datetime import date
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants import (
+    CATEGORY_ESTIMATED_HOURS,
+    CATEGORY_PORTFOLIO_BASE,
+    PORTFOLIO_AUTO_EXACT_CELLS,
+    PORTFOLIO_EXACT_MAX_CELLS,
+    SCHEDULE_MAX_WEEKS,
+)
+from schemas import PortfolioContestInput, PortfolioData, PortfolioItem
+from services.schedule_service import SchedulePlanner, available_days
+
+MODES = ("heuristic", "exact", "auto")
+
+
+class PortfolioProblem:
+    """
+    Contests as parallel arrays sorted by deadline: value, hours and capacity
+    (budget hours before the contest's buffered deadline, nondecreasing).
+    """
+
+    def __init__(self, contests: List[PortfolioContestInput], weekly_budget: int, start: date):
+        self.weekly_budget = weekly_budget
+        rows = []
+        for index, contest in enumerate(contests):
+            category = contest.category or "일반"
+            total_hours = contest.totalHours if contest.totalHours is not None else CATEGORY_ESTIMATED_HOURS.get(category, 80)
+            hours = math.ceil(total_hours)
+            portfolio = contest.portfolioValue if contest.portfolioValue is not None else \
+                CATEGORY_PORTFOLIO_BASE.get(category, 60)
+            readiness = contest.readiness if contest.readiness is not None else 50
+            pressure = contest.schedulePressure if contest.schedulePressure is not None else 50
+            days = available_days(contest.deadline, pressure, start)
+            if days is None:
+                days = SCHEDULE_MAX_WEEKS * 7
+            capacity = int(weekly_budget * min(days, SCHEDULE_MAX_WEEKS * 7) / 7)
+            rows.append((capacity, index, hours, portfolio * readiness / 100))
+
+        rows.sort()
+        self.order = np.array([row[1] for row in rows], dtype=np.int64)
+        self.capacity = np.array([row[0] for row in rows], dtype=np.int64)
+        self.hours = np.array([row[2] for row in rows], dtype=np.int64)
+        self.value = np.array([row[3] for row in rows], dtype=np.float64)
+
+    @property
+    def size(self) -> int:
+        return int(self.order.size)
+
+    @property
+    def horizon(self) -> int:
+        return int(self.capacity[-1]) if self.size else 0
+
+    def is_feasible(self, chosen: np.ndarray) -> bool:
+        """chosen: bool mask in deadline order"""
+        prefix = np.cumsum(np.where(chosen, self.hours, 0))
+        return bool(np.all(prefix[chosen] <= self.capacity[chosen]))
+
+
+def solve_exact(problem: PortfolioProblem) -> np.ndarray:
+    """
+    Maximum-value feasible set (bool mask in deadline order).
+    best[h] is the best value of a feasible prefix selection using exactly h
+    hours; contest i may only be added where h + hours[i] <= capacity[i].
+    O(contests x horizon) time, bool table of the same size for backtracking.
+    """
+    n, horizon = problem.size, problem.horizon
+    best = np.full(horizon + 1, -np.inf)
+    best[0] = 0.0
+    taken = np.zeros((n, horizon + 1), dtype=bool)
+
+    for i in range(n):
+        hours, capacity, value = int(problem.hours[i]), int(problem.capacity[i]), problem.value[i]
+        if hours > capacity or value <= 0:
+            continue
+        # Candidates end at h in [hours, capacity] and come from h - hours
+        candidate = best[:capacity - hours + 1] + value
+        current = best[hours:capacity + 1]
+        better = candidate > current
+        taken[i, hours:capacity + 1] = better
+        best[hours:capacity + 1] = np.where(better, candidate, current)
+
+    chosen = np.zeros(n, dtype=bool)
+    h = int(np.argmax(best))
+    for i in range(n - 1, -1, -1):
+        if taken[i, h]:
+            chosen[i] = True
+            h -= int(problem.hours[i])
+    return chosen
+
+
+def solve_heuristic(problem: PortfolioProblem) -> np.ndarray:
+    """
+    Greedy by value per hour (then earlier deadline). A contest is added if
+    every deadline from its position on still has slack for its hours.
+    """
+    n = problem.size
+    chosen = np.zeros(n, dtype=bool)
+    # slack[j]: capacity[j] minus hours of chosen contests at or before j
+    slack = problem.capacity.astype(np.float64)
+    density = problem.value / np.maximum(problem.hours, 1)
+    for i in np.lexsort((np.arange(n), -density)):
+        hours = problem.hours[i]
+        if problem.value[i] <= 0 or slack[i:].min() < hours:
+            continue
+        chosen[i] = True
+        slack[i:] -= hours
+    return chosen
+
+
+def optimize_portfolio(
+    contests: List[PortfolioContestInput],
+    weekly_budget: int,
+    mode: str = "auto",
+    start: Optional[date] = None
+) -> Tuple[PortfolioData, dict]:
+    """Select contests and plan them; returns (data, meta)"""
+    start = start or date.today()
+    problem = PortfolioProblem(contests, weekly_budget, start)
+    cells = problem.size * (problem.horizon + 1)
+
+    solver = mode
+    if mode == "auto":
+        solver = "exact" if cells <= PORTFOLIO_AUTO_EXACT_CELLS else "heuristic"
+    elif mode == "exact" and cells > PORTFOLIO_EXACT_MAX_CELLS:
+        solver = "heuristic"
+    chosen = solve_exact(problem) if solver == "exact" else solve_heuristic(problem)
+
+    selected_ids = set()
+    items: List[Optional[PortfolioItem]] = [None] * problem.size
+    slack = problem.capacity - np.cumsum(np.where(chosen, problem.hours, 0))
+    for position, index in enumerate(problem.order.tolist()):
+        contest = contests[index]
+        hours = int(problem.hours[position])
+        reason = None
+        if chosen[position]:
+            selected_ids.add(contest.id)
+        elif hours > problem.capacity[position]:
+            reason = "마감 전 가용 시간보다 필요한 시간이 많음"
+        elif problem.value[position] <= 0:
+            reason = "포트폴리오 가치 또는 준비도가 0"
+        elif slack[position:].min() < hours:
+            reason = "마감이 겹치는 다른 공모전에 시간을 쓰는 편이 더 가치가 큼"
+        else:
+            reason = "다른 공모전과 함께 하기엔 시간 부족"
+        items[index] = PortfolioItem(
+            id=contest.id,
+            title=contest.title,
+            selected=bool(chosen[position]),
+            value=round(float(problem.value[position]), 2),
+            hours=hours,
+            deadline=contest.deadline,
+            reason=reason,
+        )
+
+    planner = SchedulePlanner(weekly_budget, start)
+    planner.sync([contest for contest in contests if contest.id in selected_ids])
+
+    data = PortfolioData(
+        items=items,
+        totalValue=round(float(problem.value[chosen].sum()), 2),
+        totalHours=int(problem.hours[chosen].sum()),
+        schedule=planner.data(),
+    )
+    meta = {
+        "mode": solver,
+        "requestedMode": mode,
+        "optimal": solver == "exact",
+        "selected": int(chosen.sum()),
+        "candidates": problem.size,
+    }
+    return data, meta
@@ -0,0 +1,191 @@
+"""
+Ranking Service - Vectorized bulk scoring and top-k ranking
+
+This module provides:
+- Feature matrices for contest catalogs and profile sets
+- NumPy scoring of every profile x contest pair, matching scoring_service exactly
+- Top-k selection without any model calls
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from constants import (
+    CATEGORY_DIFFICULTY_BASE,
+    CATEGORY_PORTFOLIO_BASE,
+    CATEGORY_ESTIMATED_HOURS,
+    DEFAULT_SKILL_LEVEL,
+    MAX_SKILL_LEVEL,
+)
+from schemas import UserProfileInput, ContestInfo
+from services.scoring_service import (
+    days_until,
+    parse_team_range,
+    category_keywords,
+    skill_tokens,
+    tokenize,
+    PORTFOLIO_GOAL_WORDS,
+)
+
+SCORE_KEYS = ["skillMatch", "difficulty", "schedulePressure", "teamFit", "portfolioValue", "readiness"]
+CATEGORIES = list(CATEGORY_DIFFICULTY_BASE.keys())
+_CATEGORY_INDEX = {name: i for i, name in enumerate(CATEGORIES)}
+_TEAM_PREFERENCES = {"solo": (1, 1), "small": (2, 3), "large": (4, 99)}
+
+
+def _clamp(values: np.ndarray) -> np.ndarray:
+    return np.clip(np.round(values), 0, 100).astype(np.int32)
+
+
+class ContestMatrix:
+    """Column-wise contest features, built once per catalog"""
+
+    def __init__(self, contests: List[ContestInfo], today: Optional[date] = None):
+        count = len(contests)
+        self.contests = contests
+        # Inverted index: token -> contests whose text contains it
+        postings: Dict[str, List[int]] = {}
+        for i, c in enumerate(contests):
+            text = " ".join(filter(None, [c.title, c.description, " ".join(c.requirements or [])]))
+            for token in tokenize(text):
+                postings.setdefault(token, []).append(i)
+        self.token_index = {token: np.array(rows, dtype=np.int64) for token, rows in postings.items()}
+        self.category = np.array([
+            _CATEGORY_INDEX.get(c.category or "일반", -1) for c in contests
+        ], dtype=np.int32)
+        # Unknown categories fall back to the scalar path's .get() defaults
+        known = self.category >= 0
+        self.difficulty_base = np.where(known, np.array([CATEGORY_DIFFICULTY_BASE[n] for n in CATEGORIES])[self.category], 50)
+        self.portfolio_base = np.where(known, np.array([CATEGORY_PORTFOLIO_BASE[n] for n in CATEGORIES])[self.category], 60)
+        self.hours_needed = np.where(known, np.array([CATEGORY_ESTIMATED_HOURS[n] for n in CATEGORIES])[self.category], 80)
+        self.requirement_count = np.array([len(c.requirements or []) for c in contests], dtype=np.int32)
+        self.prize_count = np.array([len(c.prizes or []) for c in contests], dtype=np.int32)
+
+        days = [days_until(c.deadline, today) for c in contests]
+        self.has_deadline = np.array([d is not None for d in days], dtype=bool)
+        self.days_left = np.array([d if d is not None else 0 for d in days], dtype=np.float64)
+
+        ranges = [parse_team_range(c.teamSize) for c in contests]
+        self.has_team_range = np.array([r is not None for r in ranges], dtype=bool)
+        self.team_low = np.array([r[0] if r else 0 for r in ranges], dtype=np.int32)
+        self.team_high = np.array([r[1] if r else 0 for r in ranges], dtype=np.int32)
+        self.size = count
+
+    def skill_relevance(self, skill_names: List[str]) -> np.ndarray:
+        """(skills x contests) bool: a skill token is a contest text token or a category keyword"""
+        relevance = np.zeros((len(skill_names), self.size), dtype=bool)
+        for row, name in enumerate(skill_names):
+            tokens = skill_tokens(name)
+            if not tokens:
+                continue
+            for token in tokens:
+                rows = self.token_index.get(token)
+                if rows is not None:
+                    relevance[row, rows] = True
+            by_category = np.array([
+                not tokens.isdisjoint(category_keywords(category)) for category in CATEGORIES
+            ] + [False])
+            relevance[row] |= by_category[self.category]
+        return relevance
+
+
+class ProfileMatrix:
+    """Column-wise profile features; skills are flattened into a (profiles x unique skills) weight matrix"""
+
+    def __init__(self, profiles: List[UserProfileInput]):
+        names = {}
+        rows, cols, weights = [], [], []
+        for i, profile in enumerate(profiles):
+            for skill in profile.skills or []:
+                col = names.setdefault(skill.name.lower(), len(names))
+                rows.append(i)
+                cols.append(col)
+                weights.append(min(skill.level or DEFAULT_SKILL_LEVEL, MAX_SKILL_LEVEL) / MAX_SKILL_LEVEL)
+        self.skill_names = list(names.keys())
+        self.skill_weights = np.zeros((len(profiles), len(names)))
+        np.add.at(self.skill_weights, (rows, cols), weights)
+        self.skill_count = np.array([len(p.skills or []) for p in profiles], dtype=np.int32)
+        self.hours_per_week = np.array([p.hoursPerWeek or 10 for p in profiles], dtype=np.float64)
+        self.goal_bonus = np.array([
+            5 if p.goal and any(word in p.goal for word in PORTFOLIO_GOAL_WORDS) else 0 for p in profiles
+        ], dtype=np.int32)
+        preferences = [p.preferredTeamSize for p in profiles]
+        self.pref_any = np.array([not pref or pref == "any" for pref in preferences], dtype=bool)
+        self.pref_known = np.array([pref in _TEAM_PREFERENCES for pref in preferences], dtype=bool)
+        self.pref_low = np.array([_TEAM_PREFERENCES.get(pref, (0, 0))[0] for pref in preferences], dtype=np.int32)
+        self.pref_high = np.array([_TEAM_PREFERENCES.get(pref, (0, 0))[1] for pref in preferences], dtype=np.int32)
+        self.size = len(profiles)
+
+
+def score_matrix(profiles: ProfileMatrix, contests: ContestMatrix) -> Dict[str, np.ndarray]:
+    """Score every profile x contest pair; each value is an int32 array of shape (profiles, contests)"""
+    # Skill match: relevant coverage saturates at 3 full-level skills, plus breadth
+    coverage = profiles.skill_weights @ contests.skill_relevance(profiles.skill_names)
+    breadth = np.minimum(profiles.skill_count, 5)[:, None] * 2
+    skill = _clamp(35 + 55 * np.minimum(coverage / 3, 1.0) + breadth)
+
+    difficulty = _clamp(contests.difficulty_base + np.minimum(contests.requirement_count, 5) * 2)[None, :]
+    difficulty = np.broadcast_to(difficulty, skill.shape)
+
+    # Schedule pressure: needed / (needed + available) hours before the deadline
+    available = profiles.hours_per_week[:, None] * contests.days_left[None, :] / 7
+    needed = contests.hours_needed[None, :]
+    pressure = _clamp(100 * needed / (needed + np.maximum(available, 1e-9)))
+    pressure = np.where(contests.days_left[None, :] <= 0, 100, pressure)
+    pressure = np.where(contests.has_deadline[None, :], pressure, 50)
+
+    overlap = (contests.team_low[None, :] <= profiles.pref_high[:, None]) & \
+              (profiles.pref_low[:, None] <= contests.team_high[None, :])
+    team = np.where(overlap, 90, 40)
+    team = np.where(profiles.pref_known[:, None] & contests.has_team_range[None, :], team, 70)
+    team = np.where(profiles.pref_any[:, None], 80, team).astype(np.int32)
+
+    portfolio = _clamp(
+        (contests.portfolio_base + np.minimum(contests.prize_count, 3) * 2)[None, :] + profiles.goal_bonus[:, None]
+    )
+
+    readiness = _clamp(skill * 0.3 + (100 - difficulty) * 0.2 + (100 - pressure) * 0.2 +
+                       team * 0.15 + portfolio * 0.15)
+
+    return {
+        "skillMatch": skill,
+        "difficulty": difficulty,
+        "schedulePressure": pressure.astype(np.int32),
+        "teamFit": team,
+        "portfolioValue": portfolio,
+        "readiness": readiness,
+    }
+
+
+def top_k(rank_scores: np.ndarray, k: int, tiebreak: Optional[np.ndarray] = None) -> np.ndarray:
+    """Indexes of the k highest scores, best first (ties broken by tiebreak, then index)"""
+    k = min(k, rank_scores.size)
+    if k <= 0:
+        return np.array([], dtype=np.int64)
+    key = rank_scores.astype(np.float64) * 1000
+    if tiebreak is not None:
+        key = key + tiebreak
+    candidates = np.argpartition(-key, k - 1)[:k]
+    return candidates[np.lexsort((candidates, -key[candidates]))]
+
+
+def rank_contests(
+    profile: UserProfileInput,
+    contests: ContestMatrix,
+    k: int
+) -> List[dict]:
+    """Top-k contests for one profile, ranked by readiness then portfolio value"""
+    scores = score_matrix(ProfileMatrix([profile]), contests)
+    row = {key: values[0] for key, values in scores.items()}
+    order = top_k(row["readiness"], k, row["portfolioValue"])
+    return [
+        {
+            "index": int(i),
+            "contest": contests.contests[i],
+            "score": int(row["readiness"][i]),
+            "scores": {key: int(row[key][i]) for key in SCORE_KEYS},
+        }
+        for i in order
+    ]
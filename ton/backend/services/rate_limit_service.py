@@ -0,0 +1,294 @@
+"""
+Rate Limit Service - Client-side request/token budget for OpenAI calls
+
+This module provides:
+- Prompt + completion token estimates made before each call
+- A token-bucket scheduler for RPM/TPM limits with a priority wait queue
+- Adaptation from x-ratelimit-* / retry-after response headers
+- Queue depth and wait-time stats for the health endpoint
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import math
+import re
+import time
+from contextlib import contextmanager
+from typing import List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+# Lower value is served first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_BACKGROUND: "background"}
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("gpt_priority", default=PRIORITY_INTERACTIVE)
+
+TOKENS_PER_MESSAGE = 4
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+@contextmanager
+def request_priority(priority: int):
+    """Run the enclosed GPT calls (and tasks started inside) at the given priority"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> int:
+    return _priority.get()
+
+
+# ============================================
+# TOKEN ESTIMATES
+# ============================================
+
+def estimate_text_tokens(text: str) -> int:
+    """
+    Rough tokenizer-free estimate: ~4 ASCII chars per token, and about one
+    token per Hangul/other non-ASCII character.
+    """
+    if not text:
+        return 0
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return math.ceil((len(text) - non_ascii) / 4) + non_ascii
+
+
+def estimate_prompt_tokens(messages: List[dict], image_tokens: int) -> int:
+    """Estimate prompt tokens for chat messages; each image counts image_tokens"""
+    total = 0
+    for message in messages:
+        total += TOKENS_PER_MESSAGE
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_text_tokens(content)
+            continue
+        for part in content or []:
+            if part.get("type") == "text":
+                total += estimate_text_tokens(part.get("text", ""))
+            elif part.get("type") == "image_url":
+                total += image_tokens
+    return total
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI reset durations ("1s", "6m0s", "120ms") or plain seconds"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+# ============================================
+# SCHEDULER
+# ============================================
+
+class RateLimiter:
+    """
+    Two token buckets (requests/min, tokens/min) in front of the API.
+    Callers that cannot be admitted wait in a priority queue; interactive
+    work is always admitted before queued background work. A limit of 0
+    disables that bucket until the server reports one.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.admitted = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm > 0 or self.tpm > 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, _, future in self._waiters if not future.done())
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+
+    def _try_consume(self, tokens: int) -> bool:
+        self._refill()
+        if time.monotonic() < self._paused_until:
+            return False
+        if self.rpm and self._requests < 1:
+            return False
+        if self.tpm and self._tokens < tokens:
+            return False
+        if self.rpm:
+            self._requests -= 1
+        if self.tpm:
+            self._tokens -= tokens
+        return True
+
+    def _delay_for(self, tokens: int) -> float:
+        delay = self._paused_until - time.monotonic()
+        if self.rpm and self._requests < 1:
+            delay = max(delay, (1 - self._requests) * 60 / self.rpm)
+        if self.tpm and self._tokens < tokens:
+            delay = max(delay, (tokens - self._tokens) * 60 / self.tpm)
+        return max(delay, 0.005)
+
+    async def acquire(self, tokens: int, priority: Optional[int] = None) -> None:
+        """Wait until one request and `tokens` tokens fit in the budget"""
+        if not self.enabled:
+            # No budget configured or learnt, but a 429 pause still applies
+            pause = self._paused_until - time.monotonic()
+            if pause > 0:
+                self.delayed += 1
+                self.total_wait += pause
+                self.max_wait = max(self.max_wait, pause)
+                await asyncio.sleep(pause)
+            return
+        if priority is None:
+            priority = current_priority()
+        if self.tpm:
+            tokens = min(tokens, self.tpm)
+        if not self._waiters and self._try_consume(tokens):
+            self.admitted += 1
+            return
+
+        started = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), tokens, future))
+        self._pump()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.refund(tokens)
+            raise
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.delayed += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _pump(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_consume(tokens):
+                self._timer = future.get_loop().call_later(self._delay_for(tokens), self._pump)
+                return
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+
+    def refund(self, tokens: int) -> None:
+        """Return reserved tokens that were not used (e.g. the call never went out)"""
+        if self.tpm:
+            self._refill()
+            self._tokens = min(float(self.tpm), self._tokens + tokens)
+            if self._waiters:
+                self._pump()
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        """Adopt the server's limits and never assume more headroom than it reports"""
+        if not headers:
+            return
+        self._refill()
+        limit_requests = _header_int(headers, "x-ratelimit-limit-requests")
+        limit_tokens = _header_int(headers, "x-ratelimit-limit-tokens")
+        # An unconfigured (0) limit is learnt from the first response that reports it
+        if limit_requests and limit_requests != self.rpm:
+            logger.info(f"Adopting server request limit {limit_requests}/min")
+            if not self.rpm:
+                self._requests = float(limit_requests)
+            self.rpm = limit_requests
+        if limit_tokens and limit_tokens != self.tpm:
+            logger.info(f"Adopting server token limit {limit_tokens}/min")
+            if not self.tpm:
+                self._tokens = float(limit_tokens)
+            self.tpm = limit_tokens
+        remaining_requests = _header_int(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_int(headers, "x-ratelimit-remaining-tokens")
+        if remaining_requests is not None and self.rpm:
+            self._requests = min(self._requests, float(remaining_requests))
+        if remaining_tokens is not None and self.tpm:
+            self._tokens = min(self._tokens, float(remaining_tokens))
+
+    def throttle(self, headers: Optional[Mapping[str, str]], fallback_seconds: float) -> float:
+        """
+        Pause all admissions after a 429 until the server says capacity is back.
+        Returns the pause length in seconds.
+        """
+        self.throttled += 1
+        headers = headers or {}
+        delay = parse_duration(headers.get("retry-after-ms"))
+        delay = delay / 1000 if delay is not None else parse_duration(headers.get("retry-after"))
+        if delay is None:
+            resets = [
+                parse_duration(headers.get("x-ratelimit-reset-requests")),
+                parse_duration(headers.get("x-ratelimit-reset-tokens")),
+            ]
+            resets = [r for r in resets if r is not None]
+            delay = max(resets) if resets else fallback_seconds
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self.update_from_headers(headers)
+        return delay
+
+    def stats(self) -> dict:
+        self._refill()
+        queued = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[PRIORITY_NAMES.get(priority, str(priority))] += 1
+        return {
+            "enabled": self.enabled,
+            "rpmLimit": self.rpm,
+            "tpmLimit": self.tpm,
+            "availableRequests": int(self._requests) if self.rpm else None,
+            "availableTokens": int(self._tokens) if self.tpm else None,
+            "queueDepth": sum(queued.values()),
+            "queued": queued,
+            "pausedFor": round(max(0.0, self._paused_until - time.monotonic()), 3),
+            "admitted": self.admitted,
+            "delayed": self.delayed,
+            "throttled": self.throttled,
+            "avgWaitSeconds": round(self.total_wait / self.delayed, 3) if self.delayed else 0.0,
+            "maxWaitSeconds": round(self.max_wait, 3),
+        }
@@ -0,0 +1,387 @@
+"""
+Readiness Service - Contest readiness from profile and checklist progress
+
+This module provides:
+- The readiness components and improvement rules shared with
+  calculate_readiness (the single-contest /readiness path)
+- A vectorized batch over many contest/progress pairs of one profile that
+  returns exactly what calculate_readiness would for each pair
+- Readiness state per (user, contest), updated from checklist deltas
+  without recomputing the profile components, with per-user subscriptions
+  that receive each changed state
+"""
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from config import READINESS_MAX_USERS
+from constants import READINESS_DEFAULT_PROGRESS, READINESS_RESOURCE, READINESS_WEIGHTS
+from schemas import (
+    UserProfileInput,
+    ReadinessBatchItem,
+    ReadinessBreakdown,
+    ReadinessData,
+    ReadinessDeltaEvent,
+    ReadinessImprovement,
+    ReadinessState,
+)
+
+# Checklist values outside this range (or not plain numbers) are left to the
+# scalar path, where float64 division may not match Python's int division
+_EXACT_FLOAT_LIMIT = 2 ** 53
+
+
+def skill_readiness(profile: UserProfileInput) -> int:
+    skill_count = len(profile.skills) if profile.skills else 0
+    return min(50 + skill_count * 15, 95)
+
+
+def time_readiness(profile: UserProfileInput) -> int:
+    hours = profile.hoursPerWeek or 10
+    return min(40 + hours * 3, 90)
+
+
+def checklist_readiness(done, total) -> int:
+    return int((done / max(total, 1)) * 100)
+
+
+def progress_readiness(progress: Optional[dict]) -> int:
+    if progress:
+        return checklist_readiness(progress.get("checklistDone", 0), progress.get("checklistTotal", 1))
+    return READINESS_DEFAULT_PROGRESS
+
+
+def overall_readiness(skill: int, time_score: int, progress: int) -> int:
+    skill_weight, time_weight, progress_weight, resource_weight = READINESS_WEIGHTS
+    return int(
+        skill * skill_weight +
+        time_score * time_weight +
+        progress * progress_weight +
+        READINESS_RESOURCE * resource_weight
+    )
+
+
+def readiness_improvements(skill: int, time_score: int, progress: int) -> List[ReadinessImprovement]:
+    improvements = []
+    if progress < 50:
+        improvements.append(ReadinessImprovement(action="체크리스트 항목 완료하기", impact="+15점"))
+    if skill < 70:
+        improvements.append(ReadinessImprovement(action="관련 기술 학습/복습", impact="+10점"))
+    if time_score < 60:
+        improvements.append(ReadinessImprovement(action="주간 투자 시간 늘리기", impact="+10점"))
+    return improvements
+
+
+def readiness_data(skill: int, time_score: int, progress: int, overall: int) -> ReadinessData:
+    return ReadinessData(
+        readinessScore=overall,
+        breakdown=ReadinessBreakdown(
+            skillReadiness=skill,
+            timeReadiness=time_score,
+            progressReadiness=progress,
+            resourceReadiness=READINESS_RESOURCE
+        ),
+        improvements=readiness_improvements(skill, time_score, progress)
+    )
+
+
+def _checklist_pair(progress: Optional[dict]) -> Optional[Tuple[float, float]]:
+    """(done, total) for the vectorized path, or None if it must go scalar"""
+    if not progress:
+        return 0.0, 1.0
+    done = progress.get("checklistDone", 0)
+    total = progress.get("checklistTotal", 1)
+    for value in (done, total):
+        if not isinstance(value, (int, float)) or not math.isfinite(value) or abs(value) > _EXACT_FLOAT_LIMIT:
+            return None
+    return float(done), float(total)
+
+
+def _progress_vector(done: np.ndarray, total: np.ndarray, has_progress: np.ndarray) -> np.ndarray:
+    ratio = np.trunc(done / np.maximum(total, 1.0) * 100).astype(np.int64)
+    return np.where(has_progress, ratio, READINESS_DEFAULT_PROGRESS)
+
+
+def calculate_readiness_batch(
+    profile: UserProfileInput,
+    progresses: List[Optional[dict]]
+) -> List[ReadinessBatchItem]:
+    """
+    Readiness for each progress snapshot, in input order.
+    Skill and time readiness depend only on the profile, so per item only the
+    progress component and the weighted total are computed, as arrays.
+    Items share one ReadinessData per distinct progress value.
+    """
+    skill = skill_readiness(profile)
+    time_score = time_readiness(profile)
+
+    count = len(progresses)
+    done = np.zeros(count)
+    total = np.ones(count)
+    has_progress = np.zeros(count, dtype=bool)
+    scalar: List[int] = []
+    for i, progress in enumerate(progresses):
+        pair = _checklist_pair(progress)
+        if pair is None:
+            scalar.append(i)
+        elif progress:
+            done[i], total[i] = pair
+            has_progress[i] = True
+
+    progress_values = _progress_vector(done, total, has_progress)
+    skill_weight, time_weight, progress_weight, resource_weight = READINESS_WEIGHTS
+    overall_values = (
+        skill * skill_weight +
+        time_score * time_weight +
+        progress_values * progress_weight +
+        READINESS_RESOURCE * resource_weight
+    ).astype(np.int64)
+
+    items: List[Optional[ReadinessBatchItem]] = [None] * count
+    for i in scalar:
+        try:
+            progress = progress_readiness(progresses[i])
+            data = readiness_data(skill, time_score, progress, overall_readiness(skill, time_score, progress))
+            items[i] = ReadinessBatchItem(index=i, success=True, data=data)
+        except Exception as e:
+            items[i] = ReadinessBatchItem(index=i, success=False, error=f"Calculation failed: {str(e)}")
+
+    shared: Dict[int, ReadinessData] = {}
+    for i, (progress, overall) in enumerate(zip(progress_values.tolist(), overall_values.tolist())):
+        if items[i] is not None:
+            continue
+        data = shared.get(progress)
+        if data is None:
+            data = shared[progress] = readiness_data(skill, time_score, progress, overall)
+        items[i] = ReadinessBatchItem(index=i, success=True, data=data)
+    return items
+
+
+# ============================================
+# Tracked readiness state
+# ============================================
+
+class ReadinessSubscription:
+    """Updates waiting for one subscriber; only the latest state per contest is kept"""
+
+    def __init__(self):
+        self._pending: Dict[str, ReadinessState] = {}
+        self._ready = asyncio.Event()
+
+    def push(self, state: ReadinessState):
+        self._pending[state.contestId] = state
+        self._ready.set()
+
+    async def next(self, timeout: float) -> List[ReadinessState]:
+        """Pending states, waiting up to timeout; empty list on timeout"""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        states = list(self._pending.values())
+        self._pending = {}
+        return states
+
+
+class _TrackedContest:
+    __slots__ = ("has_progress", "state")
+
+    def __init__(self, has_progress: bool, state: ReadinessState):
+        # has_progress False: no progress sent yet, scored like /readiness without currentProgress
+        self.has_progress = has_progress
+        self.state = state
+
+
+class _UserReadiness:
+    def __init__(self):
+        self.skill: Optional[int] = None
+        self.time_score: Optional[int] = None
+        self.contests: Dict[str, _TrackedContest] = {}
+        self.subscribers: Set[ReadinessSubscription] = set()
+
+
+def _checklist_count(progress: dict, key: str, default: int) -> int:
+    value = progress.get(key, default)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+        raise ValueError(f"{key} must be a non-negative integer")
+    return value
+
+
+class ReadinessTracker:
+    """
+    Readiness per (userId, contestId). Skill and time readiness are kept per
+    user; a checklist delta only recomputes progressReadiness and the total,
+    and rebuilds the breakdown and improvements only when progressReadiness
+    changes. Every state equals calculate_readiness for the user's profile
+    and {checklistDone, checklistTotal} (or no progress if none was sent).
+    Users are kept LRU, except those with open subscriptions.
+    """
+
+    def __init__(self, max_users: int):
+        self.max_users = max_users
+        self._users: "OrderedDict[str, _UserReadiness]" = OrderedDict()
+
+    def _user(self, user_id: str, create: bool) -> Optional[_UserReadiness]:
+        user = self._users.get(user_id)
+        if user is None:
+            if not create:
+                return None
+            user = self._users[user_id] = _UserReadiness()
+        self._users.move_to_end(user_id)
+        excess = len(self._users) - self.max_users
+        if excess > 0:
+            evict = []
+            for uid, other in self._users.items():
+                if len(evict) == excess:
+                    break
+                if not other.subscribers and uid != user_id:
+                    evict.append(uid)
+            for uid in evict:
+                del self._users[uid]
+        return user
+
+    def _state(
+        self,
+        user: _UserReadiness,
+        contest_id: str,
+        has_progress: bool,
+        done: int,
+        total: int,
+        previous: Optional[ReadinessState]
+    ) -> ReadinessState:
+        progress = checklist_readiness(done, total) if has_progress else READINESS_DEFAULT_PROGRESS
+        data = previous.data if previous else None
+        if (
+            data is None
+            or data.breakdown.progressReadiness != progress
+            or data.breakdown.skillReadiness != user.skill
+            or data.breakdown.timeReadiness != user.time_score
+        ):
+            overall = overall_readiness(user.skill, user.time_score, progress)
+            data = readiness_data(user.skill, user.time_score, progress, overall)
+        return ReadinessState(
+            contestId=contest_id,
+            version=previous.version + 1 if previous else 1,
+            checklistDone=done,
+            checklistTotal=total,
+            data=data,
+            updatedAt=time.time(),
+        )
+
+    def _publish(self, user: _UserReadiness, states: List[ReadinessState]):
+        for subscription in user.subscribers:
+            for state in states:
+                subscription.push(state)
+
+    def track(
+        self,
+        user_id: str,
+        contest_id: str,
+        profile: Optional[UserProfileInput],
+        progress: Optional[dict]
+    ) -> List[ReadinessState]:
+        """
+        Start tracking a contest or reset its progress. A profile updates the
+        user's other contests too. Returns every changed state, this contest first.
+        """
+        has_progress = bool(progress)
+        done = _checklist_count(progress, "checklistDone", 0) if has_progress else 0
+        total = _checklist_count(progress, "checklistTotal", 1) if has_progress else 0
+
+        user = self._users.get(user_id)
+        if profile is None and (user is None or user.skill is None):
+            raise ValueError("userProfile is required for a new user")
+        user = self._user(user_id, create=True)
+
+        changed = []
+        if profile is not None:
+            skill, time_score = skill_readiness(profile), time_readiness(profile)
+            if (skill, time_score) != (user.skill, user.time_score):
+                user.skill, user.time_score = skill, time_score
+                for other_id, tracked in user.contests.items():
+                    if other_id == contest_id:
+                        continue
+                    current = tracked.state
+                    tracked.state = self._state(
+                        user, other_id, tracked.has_progress, current.checklistDone, current.checklistTotal, current
+                    )
+                    changed.append(tracked.state)
+
+        tracked = user.contests.get(contest_id)
+        previous = tracked.state if tracked else None
+        state = self._state(user, contest_id, has_progress, done, total, previous)
+        user.contests[contest_id] = _TrackedContest(has_progress, state)
+        changed.insert(0, state)
+
+        self._publish(user, changed)
+        return changed
+
+    def apply(self, user_id: str, events: List[ReadinessDeltaEvent]) -> List[ReadinessState]:
+        """
+        Apply checklist deltas in order (counts stop at zero).
+        All contest ids are checked before anything changes.
+        Returns the new state of each contest whose counts changed.
+        """
+        user = self._user(user_id, create=False)
+        if user is None:
+            raise ValueError("Unknown userId. Track a contest first")
+        unknown = sorted({event.contestId for event in events} - user.contests.keys())
+        if unknown:
+            raise ValueError(f"Contests not tracked: {', '.join(unknown)}")
+
+        counts: Dict[str, Tuple[int, int]] = {}
+        for event in events:
+            if not event.doneDelta and not event.totalDelta:
+                continue
+            tracked = user.contests[event.contestId]
+            done, total = counts.get(event.contestId, (tracked.state.checklistDone, tracked.state.checklistTotal))
+            counts[event.contestId] = (max(done + event.doneDelta, 0), max(total + event.totalDelta, 0))
+
+        changed = []
+        for contest_id, (done, total) in counts.items():
+            tracked = user.contests[contest_id]
+            current = tracked.state
+            if tracked.has_progress and (done, total) == (current.checklistDone, current.checklistTotal):
+                continue
+            tracked.has_progress = True
+            tracked.state = self._state(user, contest_id, True, done, total, current)
+            changed.append(tracked.state)
+
+        self._publish(user, changed)
+        return changed
+
+    def subscribe(self, user_id: str) -> Tuple[ReadinessSubscription, List[ReadinessState]]:
+        """New subscription and the user's current states"""
+        user = self._user(user_id, create=True)
+        subscription = ReadinessSubscription()
+        user.subscribers.add(subscription)
+        return subscription, [tracked.state for tracked in user.contests.values()]
+
+    def unsubscribe(self, user_id: str, subscription: ReadinessSubscription):
+        user = self._users.get(user_id)
+        if user is not None:
+            user.subscribers.discard(subscription)
+
+    def stats(self) -> dict:
+        return {
+            "users": len(self._users),
+            "contests": sum(len(user.contests) for user in self._users.values()),
+            "subscribers": sum(len(user.subscribers) for user in self._users.values()),
+        }
+
+
+_tracker: Optional[ReadinessTracker] = None
+
+
+def get_readiness_tracker() -> ReadinessTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = ReadinessTracker(READINESS_MAX_USERS)
+    return _tracker
@@ -0,0 +1,147 @@
+"""
+Routing Service - Model tier selection and escalation
+
+This module provides:
+- Picking a model tier and completion-token cap per request
+- Output validation that decides when to escalate to the large model
+- Per-tier and per-kind call, latency, token, prompt-cache and cost stats
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from constants import (
+    ROUTE_TOKEN_CAPS,
+    ROUTE_OPTION_TOKENS,
+    ROUTE_REQUIRED_KEYS,
+    MODEL_PRICING_PER_1M,
+)
+
+logger = logging.getLogger(__name__)
+
+TIER_SMALL = "small"
+TIER_LARGE = "large"
+
+
+@dataclass(frozen=True)
+class Route:
+    tier: str
+    model: str
+    max_tokens: int
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int, cached_tokens: int = 0) -> Optional[float]:
+    """USD cost from the pricing table, or None for unknown models"""
+    pricing = MODEL_PRICING_PER_1M.get(model)
+    if not pricing:
+        return None
+    input_price, output_price, cached_price = pricing
+    uncached = prompt_tokens - cached_tokens
+    return (uncached * input_price + cached_tokens * cached_price + completion_tokens * output_price) / 1_000_000
+
+
+class TierStats:
+    def __init__(self):
+        self.calls = 0
+        self.invalid = 0
+        self.escalations = 0
+        self.total_latency = 0.0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.cost = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "invalidOutputs": self.invalid,
+            "escalations": self.escalations,
+            "avgLatencySeconds": round(self.total_latency / self.calls, 3) if self.calls else 0.0,
+            "promptTokens": self.prompt_tokens,
+            "cachedPromptTokens": self.cached_tokens,
+            "cachedRatio": round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0,
+            "completionTokens": self.completion_tokens,
+            "costUsd": round(self.cost, 6),
+        }
+
+
+class ModelRouter:
+    """
+    Short text-only requests start on the small model with a per-kind token
+    cap; long inputs, images and packed batches go straight to the large
+    model. Images stay on the large tier because small models bill image
+    input at a much higher token rate, so they save nothing there.
+    """
+
+    def __init__(self, small_model: str, large_model: str, large_vision_model: str, small_max_chars: int, large_max_tokens: int):
+        self.small_model = small_model
+        self.large_model = large_model
+        self.large_vision_model = large_vision_model
+        self.small_max_chars = small_max_chars
+        self.large_max_tokens = large_max_tokens
+        self._stats = {TIER_SMALL: TierStats(), TIER_LARGE: TierStats()}
+        self._kinds: Dict[str, TierStats] = {}
+
+    def large(self, use_vision: bool = False) -> Route:
+        model = self.large_vision_model if use_vision else self.large_model
+        return Route(TIER_LARGE, model, self.large_max_tokens)
+
+    def route(self, kind: str, text_chars: int, use_vision: bool, options: Optional[dict] = None) -> Route:
+        if (
+            not self.small_model
+            or use_vision
+            or kind == "batch"
+            or text_chars > self.small_max_chars
+        ):
+            return self.large(use_vision)
+        cap = ROUTE_TOKEN_CAPS.get(kind, self.large_max_tokens)
+        for option, extra in ROUTE_OPTION_TOKENS.items():
+            if options and options.get(option):
+                cap += extra
+        return Route(TIER_SMALL, self.small_model, min(cap, self.large_max_tokens))
+
+    @staticmethod
+    def is_valid(kind: str, data: Optional[dict]) -> bool:
+        if not isinstance(data, dict):
+            return False
+        return all(data.get(key) for key in ROUTE_REQUIRED_KEYS.get(kind, []))
+
+    def record(
+        self,
+        route: Route,
+        latency: float,
+        prompt_tokens: int,
+        completion_tokens: int,
+        valid: bool,
+        kind: Optional[str] = None,
+        cached_tokens: int = 0
+    ) -> None:
+        cost = estimate_cost(route.model, prompt_tokens, completion_tokens, cached_tokens) or 0.0
+        targets = [self._stats[route.tier]]
+        if kind:
+            targets.append(self._kinds.setdefault(kind, TierStats()))
+        for stats in targets:
+            stats.calls += 1
+            stats.total_latency += latency
+            stats.prompt_tokens += prompt_tokens
+            stats.cached_tokens += cached_tokens
+            stats.completion_tokens += completion_tokens
+            stats.cost += cost
+            if not valid:
+                stats.invalid += 1
+
+    def record_escalation(self, route: Route, kind: Optional[str] = None) -> None:
+        self._stats[route.tier].escalations += 1
+        if kind:
+            self._kinds.setdefault(kind, TierStats()).escalations += 1
+
+    def stats(self) -> dict:
+        return {
+            "smallModel": self.small_model or None,
+            "largeModel": self.large_model,
+            "tiers": {name: stats.to_dict() for name, stats in self._stats.items()},
+        }
+
+    def kind_stats(self) -> dict:
+        return {kind: stats.to_dict() for kind, stats in self._kinds.items()}
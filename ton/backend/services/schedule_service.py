@@ -0,0 +1,436 @@
+"""
+Schedule Service - Weekly plans for one or many contests
+
+This module provides:
+- Phase breakdown of a contest (same ratios as the frontend scheduleGenerator)
+- Week-by-week hour allocation of several contests against one weekly budget,
+  earliest deadline first, each contest spread as evenly as capacity allows
+- Incremental replanning: only contests at or after the first changed
+  position in deadline order are recomputed
+- ScenarioWeek entries for analysis results
+"""
+
+import math
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import SCHEDULE_MAX_USERS
+from constants import (
+    CATEGORY_ESTIMATED_HOURS,
+    SCHEDULE_PHASES,
+    SCHEDULE_SHORT_PHASES,
+    SCHEDULE_SHORT_TIMELINE_DAYS,
+    SCHEDULE_HIGH_PRESSURE,
+    SCHEDULE_MEDIUM_PRESSURE,
+    SCHEDULE_SUBMISSION_PRESSURE,
+    SCHEDULE_HIGH_DIFFICULTY,
+    SCHEDULE_BUFFER_DAYS,
+    SCHEDULE_MAX_WEEKS,
+    SCHEDULE_SQUEEZE_RATIO,
+)
+from schemas import (
+    ContestSchedule,
+    ParticipationScenario,
+    ScenarioWeek,
+    ScheduleContestInput,
+    ScheduleData,
+    SchedulePhase,
+    ScheduleWeekLoad,
+)
+from services.scoring_service import days_until
+
+_EPSILON = 1e-6
+
+
+# ============================================
+# PHASES
+# ============================================
+
+def buffer_days(schedule_pressure: int) -> int:
+    """Days kept free before the deadline; less slack under more pressure"""
+    if schedule_pressure >= SCHEDULE_HIGH_PRESSURE:
+        return SCHEDULE_BUFFER_DAYS["high"]
+    if schedule_pressure >= SCHEDULE_MEDIUM_PRESSURE:
+        return SCHEDULE_BUFFER_DAYS["medium"]
+    return SCHEDULE_BUFFER_DAYS["low"]
+
+
+def available_days(deadline: Optional[str], schedule_pressure: int, start: date) -> Optional[int]:
+    """Working days from start to the deadline minus its buffer (None without a deadline)"""
+    days_left = days_until(deadline, start)
+    if days_left is None:
+        return None
+    work_days = days_left - buffer_days(schedule_pressure)
+    # Too close for a buffer: use whatever days remain
+    return work_days if work_days > 0 else max(days_left, 0)
+
+
+def phase_ratio(phase_id: str, ratio: float, difficulty: int, category: str, schedule_pressure: int) -> float:
+    """Category/difficulty/pressure adjustment of a phase's default share"""
+    if phase_id in ("research", "ideation"):
+        if difficulty >= SCHEDULE_HIGH_DIFFICULTY:
+            ratio *= 1.2
+        if category == "디자인":
+            ratio *= 1.1
+    elif phase_id == "production":
+        if category in ("개발", "AI/ML"):
+            ratio *= 1.1
+        if schedule_pressure >= SCHEDULE_HIGH_PRESSURE:
+            ratio *= 0.95
+    elif phase_id == "polish":
+        if category == "디자인":
+            ratio *= 1.3
+    elif phase_id == "submission":
+        if schedule_pressure >= SCHEDULE_SUBMISSION_PRESSURE:
+            ratio *= 1.2
+    return ratio
+
+
+def plan_phases(
+    total_hours: float,
+    work_days: Optional[int],
+    difficulty: int,
+    category: str,
+    schedule_pressure: int
+) -> List[Tuple[str, str, float, str]]:
+    """(id, label, hours, priority) per phase; short timelines use merged phases"""
+    short = work_days is not None and work_days < SCHEDULE_SHORT_TIMELINE_DAYS
+    phases = SCHEDULE_SHORT_PHASES if short else SCHEDULE_PHASES
+    ratios = [phase_ratio(pid, ratio, difficulty, category, schedule_pressure) for pid, _, ratio, _ in phases]
+    total_ratio = sum(ratios)
+    return [
+        (pid, label, total_hours * ratio / total_ratio, priority)
+        for (pid, label, _, priority), ratio in zip(phases, ratios)
+    ]
+
+
+def water_fill(capacity: np.ndarray, demand: float) -> np.ndarray:
+    """
+    Flattest allocation of `demand` hours under per-week `capacity`:
+    every week gets min(capacity, level) for the level that adds up to demand.
+    Returns the capacity itself when demand does not fit.
+    """
+    capacity = np.maximum(capacity, 0.0)
+    if demand <= 0 or capacity.size == 0:
+        return np.zeros_like(capacity)
+    if demand >= capacity.sum() - _EPSILON:
+        return capacity.copy()
+    levels = np.sort(capacity)
+    n = levels.size
+    below = np.concatenate(([0.0], np.cumsum(levels)))
+    # Hours placed when the level reaches levels[k]
+    filled = below[:-1] + levels * (n - np.arange(n))
+    k = int(np.searchsorted(filled, demand))
+    level = (demand - below[k]) / (n - k)
+    return np.minimum(capacity, level)
+
+
+# ============================================
+# PLANNER
+# ============================================
+
+class _ContestPlan:
+    """One contest's fixed inputs plus its latest allocation"""
+
+    __slots__ = (
+        "contest", "key", "demand", "undated", "due_weeks", "capacity_scale", "phases", "difficulty",
+        "pressure", "residual_before", "alloc", "schedule"
+    )
+
+    def __init__(self, contest: ScheduleContestInput, start: date, weekly_budget: int):
+        self.contest = contest
+        category = contest.category or "일반"
+        total_hours = contest.totalHours if contest.totalHours is not None else CATEGORY_ESTIMATED_HOURS.get(category, 80)
+        self.demand = float(total_hours)
+        self.difficulty = contest.difficulty if contest.difficulty is not None else 50
+        self.pressure = contest.schedulePressure if contest.schedulePressure is not None else 50
+
+        work_days = available_days(contest.deadline, self.pressure, start)
+        self.undated = work_days is None
+        if self.undated:
+            # No deadline: planned after dated contests, finishing as early as their load allows
+            work_days = None
+            self.due_weeks = min(SCHEDULE_MAX_WEEKS, max(1, math.ceil(self.demand / max(weekly_budget, 1))))
+            self.capacity_scale = np.ones(self.due_weeks)
+        else:
+            self.due_weeks = min(SCHEDULE_MAX_WEEKS, math.ceil(work_days / 7))
+            self.capacity_scale = np.ones(self.due_weeks)
+            if self.due_weeks and work_days < self.due_weeks * 7:
+                # Only part of the last week is before the (buffered) deadline
+                self.capacity_scale[-1] = (work_days - (self.due_weeks - 1) * 7) / 7
+
+        self.key = (self.undated, self.due_weeks, -contest.priority, contest.id)
+        self.phases = plan_phases(self.demand, work_days, self.difficulty, category, self.pressure)
+        self.residual_before: Optional[np.ndarray] = None
+        self.alloc = np.zeros(0)
+        self.schedule: Optional[ContestSchedule] = None
+
+    @property
+    def shortfall(self) -> float:
+        return max(0.0, self.demand - float(self.alloc.sum()))
+
+    def alloc_full(self) -> np.ndarray:
+        """Allocation padded to the planning horizon"""
+        full = np.zeros(SCHEDULE_MAX_WEEKS)
+        full[:self.alloc.size] = self.alloc
+        return full
+
+
+class SchedulePlanner:
+    """
+    Plans a user's contests against `weekly_budget` hours per week, starting
+    the week of `start`. Contests are taken in deadline order; each gets the
+    flattest allocation that fits in what earlier contests left, so a
+    contest's plan depends only on the contests before it. sync() therefore
+    replans from the first position where the order or a contest changed.
+    """
+
+    def __init__(self, weekly_budget: int, start: Optional[date] = None):
+        self.weekly_budget = weekly_budget
+        self.start = start or date.today()
+        self._plans: Dict[str, _ContestPlan] = {}
+        self._order: List[_ContestPlan] = []
+        self._load = np.zeros(SCHEDULE_MAX_WEEKS)
+        self._labels = week_labels(self.start)
+
+    def sync(self, contests: List[ScheduleContestInput]) -> dict:
+        """
+        Replace the planned contests with `contests`, replanning only what
+        the change can affect. Returns how many contests were recomputed.
+        """
+        plans: Dict[str, _ContestPlan] = {}
+        for contest in contests:
+            current = self._plans.get(contest.id)
+            plans[contest.id] = current if current is not None and current.contest == contest else \
+                _ContestPlan(contest, self.start, self.weekly_budget)
+
+        order = sorted(plans.values(), key=lambda plan: plan.key)
+        first_change = next(
+            (i for i, (old, new) in enumerate(zip(self._order, order)) if old is not new),
+            min(len(self._order), len(order))
+        )
+        self._plans = plans
+        self._order = order
+        return {"contests": len(order), "recomputed": self._replan(first_change)}
+
+    def _replan(self, position: int) -> int:
+        """
+        Reallocate from `position` on. A contest already planned against the
+        same remaining capacity (within its window) keeps its allocation, so a
+        change that later contests never see costs nothing past that point.
+        """
+        recomputed = 0
+        if position > 0:
+            previous = self._order[position - 1]
+            residual = previous.residual_before - previous.alloc_full()
+        else:
+            residual = np.full(SCHEDULE_MAX_WEEKS, float(self.weekly_budget))
+
+        for plan in self._order[position:]:
+            window = SCHEDULE_MAX_WEEKS if plan.undated else plan.due_weeks
+            unaffected = plan.residual_before is not None and \
+                np.array_equal(plan.residual_before[:window], residual[:window])
+            plan.residual_before = residual
+            if unaffected:
+                residual = residual - plan.alloc_full()
+                continue
+
+            recomputed += 1
+            if plan.undated:
+                # Fewest weeks whose remaining capacity covers the demand
+                reachable = np.cumsum(np.maximum(residual, 0.0))
+                plan.due_weeks = min(SCHEDULE_MAX_WEEKS, int(np.searchsorted(reachable, plan.demand - _EPSILON)) + 1)
+                plan.capacity_scale = np.ones(plan.due_weeks)
+            due = plan.due_weeks
+            capacity = np.minimum(residual[:due], self.weekly_budget * plan.capacity_scale)
+            plan.alloc = water_fill(capacity, plan.demand)
+            plan.schedule = None
+            residual = residual - plan.alloc_full()
+        self._load = self.weekly_budget - residual
+        return recomputed
+
+    def contest_schedule(self, contest_id: str) -> Optional[ContestSchedule]:
+        plan = self._plans.get(contest_id)
+        if plan is None:
+            return None
+        if plan.schedule is None:
+            plan.schedule = build_contest_schedule(plan, self.weekly_budget, self._labels)
+        return plan.schedule
+
+    def weekly_load(self) -> List[ScheduleWeekLoad]:
+        """Total planned hours per week, up to the last week with any work"""
+        used = np.nonzero(self._load > _EPSILON)[0]
+        weeks = int(used[-1]) + 1 if used.size else 0
+        return [
+            ScheduleWeekLoad(
+                week=w + 1,
+                startDate=(self.start + timedelta(weeks=w)).isoformat(),
+                hours=round(float(self._load[w]), 1),
+                utilization=round(float(self._load[w]) / self.weekly_budget, 3) if self.weekly_budget else 0.0,
+            )
+            for w in range(weeks)
+        ]
+
+    def data(self) -> ScheduleData:
+        """Full plan, contests in the order they were given to sync()"""
+        return ScheduleData(
+            weeklyBudget=self.weekly_budget,
+            weeks=self.weekly_load(),
+            contests=[self.contest_schedule(contest_id) for contest_id in self._plans],
+        )
+
+
+# ============================================
+# SCENARIO OUTPUT
+# ============================================
+
+def week_labels(start: date) -> List[str]:
+    return [
+        f"{w + 1}주차 ({(start + timedelta(weeks=w)).strftime('%m/%d')}~)"
+        for w in range(SCHEDULE_MAX_WEEKS)
+    ]
+
+
+def round_preserving_sum(values: np.ndarray, total: int) -> List[int]:
+    """
+    Whole numbers that add up to `total`: floor every value, then give the
+    leftover units to the largest fractional parts (largest remainder method).
+    """
+    floors = np.floor(values)
+    leftover = int(np.clip(total - floors.sum(), 0, values.size))
+    # Stable sort so ties go to the earlier week
+    order = np.argsort(-(values - floors), kind="stable")
+    floors[order[:leftover]] += 1
+    return floors.astype(int).tolist()
+
+
+def build_contest_schedule(plan: _ContestPlan, weekly_budget: int, labels: List[str]) -> ContestSchedule:
+    """ScenarioWeek entries and phase windows from a contest's allocation"""
+    alloc = plan.alloc
+    used = np.nonzero(alloc > 0.05)[0]
+    first_week = int(used[0]) if used.size else 0
+    last_week = int(used[-1]) + 1 if used.size else 0
+    active_weeks = last_week - first_week
+    cumulative = np.concatenate(([0.0], np.cumsum(alloc[:last_week])))
+    bounds = np.concatenate(([0.0], np.cumsum([hours for _, _, hours, _ in plan.phases])))
+    # Undated contests start as soon as capacity frees up, so they are never "squeezed"
+    even = math.inf if plan.undated else plan.demand / max(plan.due_weeks, 1)
+    shortfall = plan.shortfall
+    capacity = np.minimum(plan.residual_before[:plan.due_weeks], weekly_budget * plan.capacity_scale)
+
+    # overlap[w][i]: phase i's hour range intersects the hours worked in week w
+    overlap = (
+        (bounds[None, :-1] < cumulative[first_week + 1:, None] - _EPSILON) &
+        (bounds[None, 1:] > cumulative[first_week:-1, None] + _EPSILON)
+    ).tolist()
+    week_hours = alloc[first_week:last_week].tolist()
+    # Shown hours add up to totalHours minus shortfallHours
+    shown_hours = round_preserving_sum(alloc[first_week:last_week], round(plan.demand) - round(shortfall))
+    saturated = (alloc[first_week:last_week] >= capacity[first_week:last_week] - _EPSILON).tolist()
+    short_note = f"가용 시간을 모두 써도 {round(shortfall)}시간 부족"
+
+    phase_weeks: Dict[str, List[int]] = {pid: [] for pid, _, _, _ in plan.phases}
+    weeks: List[ScenarioWeek] = []
+    for offset, hours in enumerate(week_hours):
+        w = first_week + offset
+        tasks = []
+        for (pid, label, _, _), active in zip(plan.phases, overlap[offset]):
+            if active:
+                tasks.append(label)
+                phase_weeks[pid].append(w + 1)
+
+        risk, note = "low", None
+        if hours <= 0.05:
+            risk, note = "medium", "다른 공모전 일정으로 이번 주 작업 시간 없음"
+        elif shortfall > 0.5 and saturated[offset]:
+            risk, note = "high", short_note
+        elif hours > even * SCHEDULE_SQUEEZE_RATIO:
+            risk, note = "medium", "다른 공모전 일정과 겹쳐 이번 주 부담 증가"
+        elif w == last_week - 1 and plan.pressure >= SCHEDULE_SUBMISSION_PRESSURE:
+            risk, note = "medium", "제출 마감 주간"
+
+        weeks.append(ScenarioWeek(
+            week=labels[w],
+            tasks=tasks,
+            hours=shown_hours[offset],
+            riskLevel=risk,
+            riskNote=note,
+        ))
+
+    feasible = shortfall <= 0.5
+    if plan.due_weeks == 0:
+        conclusion = "마감이 지나 일정을 잡을 수 없습니다"
+    elif feasible:
+        conclusion = f"주 평균 {plan.demand / max(active_weeks, 1):.0f}시간씩 {active_weeks}주 진행하면 마감 전 완료 가능"
+    else:
+        conclusion = f"마감까지 {round(shortfall)}시간 부족, 필수 단계 위주로 범위를 줄여야 합니다"
+
+    return ContestSchedule(
+        id=plan.contest.id,
+        title=plan.contest.title,
+        scenario=ParticipationScenario(
+            totalHours=round(plan.demand),
+            weeksNeeded=active_weeks,
+            userWeeklyHours=weekly_budget,
+            feasible=feasible,
+            conclusion=conclusion,
+            weeks=weeks,
+        ),
+        phases=[
+            SchedulePhase(
+                id=pid,
+                label=label,
+                hours=round(hours),
+                priority=priority,
+                startWeek=phase_weeks[pid][0] if phase_weeks[pid] else None,
+                endWeek=phase_weeks[pid][-1] if phase_weeks[pid] else None,
+            )
+            for pid, label, hours, priority in plan.phases
+        ],
+        shortfallHours=round(shortfall),
+    )
+
+
+def scenario_weeks(
+    deadline: Optional[str],
+    category: Optional[str],
+    total_hours: Optional[int],
+    hours_per_week: int,
+    difficulty: Optional[int] = None,
+    schedule_pressure: Optional[int] = None
+) -> List[ScenarioWeek]:
+    """Weekly plan of a single contest with the user's whole budget (analysis results)"""
+    planner = SchedulePlanner(hours_per_week)
+    contest = ScheduleContestInput(
+        id="contest", deadline=deadline, category=category, totalHours=total_hours,
+        difficulty=difficulty, schedulePressure=schedule_pressure
+    )
+    planner.sync([contest])
+    return planner.contest_schedule("contest").scenario.weeks
+
+
+# ============================================
+# PER-USER STATE
+# ============================================
+
+_planners: "OrderedDict[str, SchedulePlanner]" = OrderedDict()
+
+
+def get_planner(user_id: Optional[str], weekly_budget: int, start: date) -> SchedulePlanner:
+    """
+    Planner kept per user so unchanged contests are not replanned.
+    A new budget or start date invalidates every allocation, so it starts over.
+    """
+    if not user_id:
+        return SchedulePlanner(weekly_budget, start)
+    planner = _planners.get(user_id)
+    if planner is None or planner.weekly_budget != weekly_budget or planner.start != start:
+        planner = SchedulePlanner(weekly_budget, start)
+    _planners[user_id] = planner
+    _planners.move_to_end(user_id)
+    while len(_planners) > SCHEDULE_MAX_USERS:
+        _planners.popitem(last=False)
+    return planner
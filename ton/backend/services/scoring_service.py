@@ -0,0 +1,206 @@
+"""
+Scoring Service - Deterministic local fit scoring
+
+This module provides:
+- The six AnalysisScores computed from profile, contest facts and category tables
+- A plain-int fast path for ranking many profile x contest pairs
+"""
+
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from constants import (
+    CATEGORY_DIFFICULTY_BASE,
+    CATEGORY_PORTFOLIO_BASE,
+    CATEGORY_ESTIMATED_HOURS,
+    CATEGORY_SKILL_KEYWORDS,
+    DEFAULT_SKILL_LEVEL,
+    MAX_SKILL_LEVEL,
+)
+from schemas import UserProfileInput, ContestInfo, AnalysisScores, ScoreDetail
+
+_TEAM_NUMBER_PATTERN = re.compile(r"\d+")
+# Words of letters/digits, keeping trailing + and # (c++, c#); "node.js" -> node, js
+_TOKEN_PATTERN = re.compile(r"[^\W_][\w+#]*")
+PORTFOLIO_GOAL_WORDS = ("포트폴리오", "취업", "경력", "이력")
+
+
+def get_label_from_score(score: int, inverted: bool = False) -> str:
+    """Convert score to label"""
+    effective = 100 - score if inverted else score
+    if effective >= 70:
+        return "높음"
+    elif effective >= 40:
+        return "보통"
+    return "낮음"
+
+
+def _clamp(value: float) -> int:
+    return max(0, min(100, int(round(value))))
+
+
+@lru_cache(maxsize=1024)
+def parse_team_range(team_size: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Parse free-text team size ("1-3명", "개인", "최대 4명") into (min, max)"""
+    if not team_size:
+        return None
+    numbers = [int(n) for n in _TEAM_NUMBER_PATTERN.findall(team_size)]
+    if numbers:
+        if len(numbers) == 1:
+            return (1, numbers[0]) if "최대" in team_size or "이하" in team_size else (numbers[0], numbers[0])
+        return min(numbers), max(numbers)
+    if "개인" in team_size:
+        return 1, 1
+    if "팀" in team_size:
+        return 2, 5
+    return None
+
+
+def days_until(deadline: Optional[str], today: Optional[date] = None) -> Optional[int]:
+    """Days from today to a YYYY-MM-DD deadline, or None if missing/invalid"""
+    if not deadline:
+        return None
+    try:
+        target = date.fromisoformat(deadline)
+    except ValueError:
+        try:
+            target = datetime.strptime(deadline, "%Y-%m-%d").date()
+        except ValueError:
+            return None
+    return (target - (today or date.today())).days
+
+
+def tokenize(text: Optional[str]) -> FrozenSet[str]:
+    """Lowercased word tokens, compared by equality (so "go" does not match "google")"""
+    return frozenset(_TOKEN_PATTERN.findall(text.lower())) if text else frozenset()
+
+
+@lru_cache(maxsize=64)
+def category_keywords(category: str) -> FrozenSet[str]:
+    return frozenset(CATEGORY_SKILL_KEYWORDS.get(category, []))
+
+
+@lru_cache(maxsize=4096)
+def skill_tokens(name: str) -> FrozenSet[str]:
+    return tokenize(name)
+
+
+def skill_match_score(skills: List[Tuple[str, int]], contest_text: str, category: str) -> Tuple[int, int]:
+    """
+    Skill match from (name, level) pairs.
+    A skill is relevant if one of its tokens is a token of the contest text or
+    a keyword of the category. Returns (score, relevant skill count).
+    """
+    keywords = category_keywords(category)
+    text_tokens = tokenize(contest_text)
+    coverage = 0.0
+    relevant = 0
+    for name, level in skills:
+        tokens = skill_tokens(name)
+        if not tokens.isdisjoint(text_tokens) or not tokens.isdisjoint(keywords):
+            coverage += min(level, MAX_SKILL_LEVEL) / MAX_SKILL_LEVEL
+            relevant += 1
+    # Three strong relevant skills saturate the match; breadth adds a little on top
+    return _clamp(35 + 55 * min(coverage / 3, 1.0) + min(len(skills), 5) * 2), relevant
+
+
+def schedule_pressure_score(days_left: Optional[int], hours_per_week: int, estimated_hours: int) -> int:
+    """Pressure from needed hours vs hours available before the deadline (50 when equal)"""
+    if days_left is None:
+        return 50
+    if days_left <= 0:
+        return 100
+    available = hours_per_week * days_left / 7
+    return _clamp(100 * estimated_hours / (estimated_hours + available))
+
+
+def team_fit_score(preference: Optional[str], team_range: Optional[Tuple[int, int]]) -> int:
+    """Fit between preferred team size (solo/small/large/any) and the contest's allowed range"""
+    if not preference or preference == "any":
+        return 80
+    if team_range is None:
+        return 70
+    low, high = team_range
+    wanted = {"solo": (1, 1), "small": (2, 3), "large": (4, 99)}.get(preference)
+    if wanted is None:
+        return 70
+    return 90 if low <= wanted[1] and wanted[0] <= high else 40
+
+
+def compute_score_values(
+    profile: UserProfileInput,
+    contest_info: ContestInfo,
+    required_skills: Optional[List[str]] = None,
+    estimated_hours: Optional[int] = None,
+    difficulty: Optional[int] = None,
+    today: Optional[date] = None
+) -> Dict[str, int]:
+    """Compute the six scores as plain ints (fast path for bulk ranking)"""
+    category = contest_info.category or "일반"
+    contest_text = " ".join(filter(None, [
+        contest_info.title,
+        contest_info.description,
+        " ".join(contest_info.requirements or []),
+        " ".join(required_skills or []),
+    ])).lower()
+    skills = [(s.name, s.level or DEFAULT_SKILL_LEVEL) for s in profile.skills or []]
+
+    skill_score, _ = skill_match_score(skills, contest_text, category)
+
+    if difficulty is None:
+        difficulty = CATEGORY_DIFFICULTY_BASE.get(category, 50) + min(len(contest_info.requirements or []), 5) * 2
+    difficulty_score = _clamp(difficulty)
+
+    hours_needed = estimated_hours or CATEGORY_ESTIMATED_HOURS.get(category, 80)
+    pressure_score = schedule_pressure_score(
+        days_until(contest_info.deadline, today), profile.hoursPerWeek or 10, hours_needed
+    )
+
+    team_score = team_fit_score(profile.preferredTeamSize, parse_team_range(contest_info.teamSize))
+
+    portfolio_score = CATEGORY_PORTFOLIO_BASE.get(category, 60) + min(len(contest_info.prizes or []), 3) * 2
+    if profile.goal and any(word in profile.goal for word in PORTFOLIO_GOAL_WORDS):
+        portfolio_score += 5
+    portfolio_score = _clamp(portfolio_score)
+
+    readiness = _clamp(skill_score * 0.3 + (100 - difficulty_score) * 0.2 +
+                       (100 - pressure_score) * 0.2 + team_score * 0.15 + portfolio_score * 0.15)
+
+    return {
+        "skillMatch": skill_score,
+        "difficulty": difficulty_score,
+        "schedulePressure": pressure_score,
+        "teamFit": team_score,
+        "portfolioValue": portfolio_score,
+        "readiness": readiness,
+    }
+
+
+def compute_scores(
+    profile: UserProfileInput,
+    contest_info: ContestInfo,
+    required_skills: Optional[List[str]] = None,
+    estimated_hours: Optional[int] = None,
+    difficulty: Optional[int] = None,
+    today: Optional[date] = None
+) -> AnalysisScores:
+    """Deterministic AnalysisScores with labels and short reasons"""
+    values = compute_score_values(profile, contest_info, required_skills, estimated_hours, difficulty, today)
+    category = contest_info.category or "일반"
+    skill_count = len(profile.skills) if profile.skills else 0
+    days_left = days_until(contest_info.deadline, today)
+    deadline_reason = f"마감까지 {days_left}일" if days_left is not None else "마감 일정 미확인"
+
+    def detail(key: str, reason: str, inverted: bool = False) -> ScoreDetail:
+        return ScoreDetail(score=values[key], label=get_label_from_score(values[key], inverted), reason=reason)
+
+    return AnalysisScores(
+        skillMatch=detail("skillMatch", f"보유 기술 {skill_count}개"),
+        difficulty=detail("difficulty", f"{category} 분야", inverted=True),
+        schedulePressure=detail("schedulePressure", deadline_reason, inverted=True),
+        teamFit=detail("teamFit", f"참가 형태: {contest_info.teamSize or '무관'}"),
+        portfolioValue=detail("portfolioValue", f"{category} 분야 가치"),
+        readiness=detail("readiness", "종합 평가"),
+    )
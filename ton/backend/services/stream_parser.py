@@ -0,0 +1,83 @@
+"""
+Stream Parser - Incremental JSON parsing for streamed GPT output
+
+This module provides:
+- Detection of completed top-level members in a growing JSON object
+- Server-sent event formatting
+"""
+
+import json
+from typing import List, Tuple
+
+
+class JsonSectionParser:
+    """
+    Incrementally scan a streamed JSON object and return each top-level
+    member as soon as its value is complete. Each character is scanned once.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, object]]:
+        """Append a chunk and return newly completed (key, value) pairs"""
+        self._buffer += chunk
+        completed = []
+        buffer = self._buffer
+
+        for i in range(self._pos, len(buffer)):
+            char = buffer[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                # Text before the opening brace (e.g. a code fence) is ignored
+                if self._depth > 0:
+                    self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = i + 1
+            elif char in "}]":
+                if self._depth == 1:
+                    self._emit(buffer, i, completed)
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                self._emit(buffer, i, completed)
+                self._member_start = i + 1
+
+        self._pos = len(buffer)
+        return completed
+
+    def _emit(self, buffer: str, end: int, completed: list) -> None:
+        member = buffer[self._member_start:end].strip()
+        if not member:
+            return
+        try:
+            parsed = json.loads("{" + member + "}")
+        except json.JSONDecodeError:
+            return
+        completed.extend(parsed.items())
+
+    @property
+    def text(self) -> str:
+        """Full text received so far"""
+        return self._buffer
+
+
+def format_sse(event: str, data) -> str:
+    """Format one server-sent event with a JSON payload"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
@@ -0,0 +1,198 @@
+"""
+Tracing Service - Span-based latency breakdown of the request hot path
+
+This module provides:
+- Lightweight spans following the OpenTelemetry data model (trace/span ids,
+  parent, attributes, status), mirrored to OpenTelemetry when it is installed
+- An in-memory exporter holding recently finished spans (tests, benchmarks)
+- ASGI middleware that traces each request, honours W3C traceparent and adds
+  a Server-Timing header summarizing the stages
+"""
+
+import contextvars
+import random
+import re
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # optional; spans are still recorded in memory
+    otel_trace = None
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "status")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Optional[dict] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = attributes or {}
+        self.status = "OK"
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+        }
+
+
+class InMemorySpanExporter:
+    """Keeps the most recent finished spans"""
+
+    def __init__(self, max_spans: int = 2048):
+        self._spans: deque = deque(maxlen=max_spans)
+
+    def export(self, spans: List[Span]) -> None:
+        self._spans.extend(spans)
+
+    def get_finished_spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        return [span for span in self._spans if trace_id is None or span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class Trace:
+    """Spans of one request; exported together when the root span ends"""
+
+    def __init__(self, name: str, trace_id: Optional[str] = None, parent_id: Optional[str] = None):
+        self.trace_id = trace_id or f"{random.getrandbits(128):032x}"
+        self.root = Span(name, self.trace_id, parent_id)
+        self.spans: List[Span] = []
+
+    def server_timing(self) -> str:
+        """Server-Timing value: total duration per stage name, in first-seen order"""
+        totals: Dict[str, Tuple[float, int]] = {}
+        for span in self.spans:
+            if span.end_ns is None:
+                continue
+            duration, count = totals.get(span.name, (0.0, 0))
+            totals[span.name] = (duration + span.duration_ms, count + 1)
+        entries = [
+            f'{name};dur={duration:.1f}' + (f';desc="x{count}"' if count > 1 else "")
+            for name, (duration, count) in totals.items()
+        ]
+        entries.append(f"total;dur={self.root.duration_ms:.1f}")
+        return ", ".join(entries)
+
+
+_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("trace", default=None)
+_parent: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("parent_span", default=None)
+
+_exporter = InMemorySpanExporter()
+_otel_tracer = otel_trace.get_tracer(__name__) if otel_trace else None
+
+
+def get_exporter() -> InMemorySpanExporter:
+    return _exporter
+
+
+def current_trace() -> Optional[Trace]:
+    return _trace.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Time a stage of the current request. A no-op outside a traced request,
+    so library code can be instrumented unconditionally.
+    """
+    trace = _trace.get()
+    if trace is None:
+        yield None
+        return
+    parent = _parent.get() or trace.root
+    current = Span(name, trace.trace_id, parent.span_id, attributes)
+    token = _parent.set(current)
+    otel_span = _otel_tracer.start_as_current_span(name, attributes=attributes) if _otel_tracer else nullcontext()
+    try:
+        with otel_span:
+            yield current
+    except BaseException:
+        current.status = "ERROR"
+        raise
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        _parent.reset(token)
+        trace.spans.append(current)
+
+
+def span_since_request_start(name: str) -> None:
+    """
+    Record a span from the start of the request until now, e.g. the body and
+    form parsing FastAPI finishes before the handler runs.
+    """
+    trace = _trace.get()
+    if trace is None:
+        return
+    current = Span(name, trace.trace_id, trace.root.span_id)
+    current.start_ns = trace.root.start_ns
+    current.end_ns = time.perf_counter_ns()
+    trace.spans.append(current)
+
+
+@contextmanager
+def start_trace(name: str, traceparent: Optional[str] = None):
+    """Root span for one request; child spans join it via the contextvar"""
+    match = _TRACEPARENT.match(traceparent or "")
+    trace = Trace(name, *(match.groups() if match else ()))
+    trace_token = _trace.set(trace)
+    parent_token = _parent.set(None)
+    try:
+        yield trace
+    finally:
+        trace.root.end_ns = time.perf_counter_ns()
+        _parent.reset(parent_token)
+        _trace.reset(trace_token)
+        _exporter.export(trace.spans + [trace.root])
+
+
+class ServerTimingMiddleware:
+    """
+    Pure ASGI middleware (no extra task per request, streaming untouched):
+    traces each HTTP request and adds Server-Timing when the response starts.
+    Spans of a streamed body end after the headers are sent and are only exported.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for key, value in scope.get("headers", []):
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+
+        with start_trace(f"{scope['method']} {scope['path']}", traceparent) as trace:
+            async def send_with_timing(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,14 @@
+"""
+Shared test setup: run against backend/ modules with mock AI mode and no
+on-disk catalog or job store.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["OPENAI_API_KEY"] = ""
+os.environ["CATALOG_PATH"] = ""
+os.environ["JOBS_PATH"] = ""
+os.environ["CACHE_BACKEND"] = "memory"
@@ -0,0 +1,58 @@
+import asyncio
+
+from services import cache_service
+from services.cache_service import SQLiteCache
+
+
+def rows(cache: SQLiteCache) -> dict:
+    return dict(cache._conn.execute(f"SELECT key, last_access FROM cache_{cache.name}").fetchall())
+
+
+def test_sqlite_cache_evicts_least_recent_and_tracks_size(tmp_path, monkeypatch):
+    clock = iter(range(1000, 2000, 100))
+    monkeypatch.setattr(cache_service.time, "time", lambda: next(clock))
+    cache = SQLiteCache("t", 3, 10 ** 6, str(tmp_path / "cache.sqlite3"))
+
+    async def run():
+        for key in ("a", "b", "c"):
+            await cache.aset(key, key)
+        await cache.aset("b", "b2")  # replace: no new row
+        assert cache.size() == 3
+        assert await cache.aget("a") == "a"  # refreshes a's last_access
+        await cache.aset("d", "d")
+        return await cache.aget("c")
+
+    assert asyncio.run(run()) is None
+    assert set(rows(cache)) == {"a", "b", "d"}
+    assert cache.size() == 3 and cache.evictions == 1
+
+
+def test_sqlite_cache_hit_skips_recent_access_update(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_service.time, "time", lambda: now[0])
+    cache = SQLiteCache("t", 10, 10 ** 6, str(tmp_path / "cache.sqlite3"))
+    cache.set("k", "v")
+
+    now[0] += cache_service.ACCESS_GRANULARITY_SECONDS / 2
+    assert cache.get("k") == "v"
+    assert rows(cache)["k"] == 1000.0
+
+    now[0] += cache_service.ACCESS_GRANULARITY_SECONDS
+    assert cache.get("k") == "v"
+    assert rows(cache)["k"] == now[0]
+    assert cache.hits == 2
+
+
+def test_sqlite_cache_size_survives_reopen_and_expiry(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_service.time, "time", lambda: now[0])
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCache("t", 10, 60, path)
+    cache.set("a", "1")
+    cache.set("b", "2")
+
+    reopened = SQLiteCache("t", 10, 60, path)
+    assert reopened.size() == 2
+    now[0] += 61
+    assert reopened.get("a") is None
+    assert reopened.size() == 1 and reopened.misses == 1
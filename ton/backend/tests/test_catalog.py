@@ -0,0 +1,35 @@
+from schemas import ContestInfo
+from services.catalog_service import ContestCatalog
+
+
+def test_same_title_different_content_stays_separate(tmp_path):
+    catalog = ContestCatalog(str(tmp_path / "catalog.sqlite3"))
+    first = catalog.upsert(ContestInfo(title="아이디어 공모전"), "key-1", analysis={"n": 1})
+    second = catalog.upsert(ContestInfo(title="아이디어 공모전"), "key-2", analysis={"n": 2})
+    again = catalog.upsert(ContestInfo(title="아이디어  공모전!"), "key-1", digest={"d": 1}, digest_version="v1")
+
+    assert first != second and again == first
+    assert catalog.find_digest("key-1", {"v1"}) == {"d": 1}
+    assert catalog.get(first)["analysis_json"] == '{"n": 1}'
+    assert catalog.get(second)["analysis_json"] == '{"n": 2}'
+
+
+def test_extraction_row_is_linked_by_title(tmp_path):
+    catalog = ContestCatalog(str(tmp_path / "catalog.sqlite3"))
+    extracted = catalog.upsert(ContestInfo(title="포스터 공모전"), extraction={"x": 1})
+    analyzed = catalog.upsert(ContestInfo(title="포스터 공모전"), "key-1", analysis={"n": 1})
+    assert extracted == analyzed
+
+
+def test_digest_is_reused_only_for_its_version(tmp_path):
+    catalog = ContestCatalog(str(tmp_path / "catalog.sqlite3"))
+    catalog.upsert(ContestInfo(title="공모전"), "key-1", digest={"d": "small"}, digest_version="small")
+    assert catalog.find_digest("key-1", {"large"}) is None
+    assert catalog.find_digest("key-1", {"small", "large"}) == {"d": "small"}
+
+    # Writing other results keeps the stored digest and its version
+    catalog.upsert(ContestInfo(title="공모전"), "key-1", analysis={"n": 1})
+    assert catalog.find_digest("key-1", {"small"}) == {"d": "small"}
+    catalog.upsert(ContestInfo(title="공모전"), "key-1", digest={"d": "large"}, digest_version="large")
+    assert catalog.find_digest("key-1", {"small"}) is None
+    assert catalog.find_digest("key-1", {"large"}) == {"d": "large"}
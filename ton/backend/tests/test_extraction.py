@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+import pytest
+
+from schemas import ExtractedInfo, ExtractionConfidence
+from services import cache_service, gpt_service
+from services.cache_service import MemoryCache
+from services.dedup_service import PerceptualIndex
+
+POSTER = 0x0F0F_F0F0_1234_5678
+
+
+@pytest.fixture
+def extraction_cache(monkeypatch):
+    cache = MemoryCache("extraction", 100, 60)
+    monkeypatch.setattr(gpt_service, "_extraction_cache", cache)
+    monkeypatch.setattr(gpt_service, "_extraction_index", PerceptualIndex(4))
+    return cache
+
+
+def store(image_hash: int, title: str):
+    asyncio.run(gpt_service.store_extraction(image_hash, ExtractedInfo(title=title), ExtractionConfidence(), "raw"))
+
+
+def store_stale(image_hash: int, title: str):
+    entry = {"version": "old-prompt", "data": {"extracted": {"title": title}, "confidence": {}, "rawText": "raw"}}
+    gpt_service._extraction_cache.set(f"{image_hash:016x}", json.dumps(entry))
+    gpt_service._extraction_index.add(image_hash)
+
+
+def lookup(image_hash: int):
+    return asyncio.run(gpt_service.lookup_extraction(image_hash))
+
+
+def test_stale_version_is_a_miss_and_leaves_the_index(extraction_cache):
+    store_stale(POSTER, "old")
+    assert lookup(POSTER) is None
+    assert (extraction_cache.hits, extraction_cache.misses) == (0, 1)
+    assert len(gpt_service._extraction_index) == 0
+
+
+def test_stale_match_does_not_shadow_a_valid_neighbour(extraction_cache):
+    store_stale(POSTER, "old")
+    store(POSTER ^ 0b11, "new")  # two bits away
+    found = lookup(POSTER ^ 0b1)
+    assert found.extracted.title == "new"
+    assert (extraction_cache.hits, extraction_cache.misses) == (1, 0)
+
+
+def test_expired_entry_is_a_miss_and_leaves_the_index(extraction_cache, monkeypatch):
+    store(POSTER, "expired")
+    now = cache_service.time.time()
+    monkeypatch.setattr(cache_service.time, "time", lambda: now + 61)
+    assert lookup(POSTER) is None
+    assert (extraction_cache.hits, extraction_cache.misses) == (0, 1)
+    assert len(gpt_service._extraction_index) == 0
@@ -0,0 +1,72 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import APITimeoutError
+
+from services import gpt_service
+from services.hedge_service import HedgePolicy
+from services.rate_limit_service import RateLimiter
+
+
+class TimedCompletions:
+    """The n-th call takes durations[n] seconds (the last one repeats)"""
+
+    def __init__(self, *durations: float):
+        self.durations = durations
+        self.calls = 0
+
+    async def create(self, **kwargs):
+        duration = self.durations[min(self.calls, len(self.durations) - 1)]
+        self.calls += 1
+        await asyncio.sleep(duration)
+        message = SimpleNamespace(content="{}")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+class TimeoutCompletions:
+    async def create(self, **kwargs):
+        raise APITimeoutError(request=httpx.Request("POST", "http://upstream/v1"))
+
+
+def use_client(monkeypatch, completions) -> HedgePolicy:
+    policy = HedgePolicy(True, 95, 0.1, 0.1)
+    monkeypatch.setattr(gpt_service, "_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(gpt_service, "_rate_limiter", RateLimiter(0, 0))
+    monkeypatch.setattr(gpt_service, "_hedge_policy", policy)
+    return policy
+
+
+def call():
+    return asyncio.run(gpt_service.call_gpt_api([{"role": "user", "content": "hi"}], model="m", max_retries=0))
+
+
+def test_cancelled_primary_is_recorded_when_hedge_wins(monkeypatch):
+    policy = use_client(monkeypatch, TimedCompletions(0.5, 0.05))
+    call()
+
+    assert policy.hedged == 1 and policy.hedge_wins == 1
+    samples = sorted(policy._latencies["m"])
+    # The winner's latency and, as a lower bound, the cancelled primary's
+    assert len(samples) == 2
+    assert samples[0] < 0.1 <= samples[1] < 0.5
+
+
+def test_cancelled_hedge_is_not_recorded_when_primary_wins(monkeypatch):
+    policy = use_client(monkeypatch, TimedCompletions(0.15, 0.5))
+    call()
+
+    assert policy.hedged == 1 and policy.hedge_wins == 0
+    # Only the primary's own latency: the hedge ran ~0.05s and was cut off
+    samples = list(policy._latencies["m"])
+    assert len(samples) == 1
+    assert samples[0] >= 0.15
+
+
+def test_full_api_timeout_is_recorded(monkeypatch):
+    policy = use_client(monkeypatch, TimeoutCompletions())
+    policy.enabled = False
+    with pytest.raises(APITimeoutError):
+        call()
+    assert len(policy._latencies["m"]) == 1
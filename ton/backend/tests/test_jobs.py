@@ -0,0 +1,81 @@
+import asyncio
+import time
+
+import pytest
+
+from schemas import UserProfileInput
+from services import job_service
+from services.job_service import JobQueue, JobStore, QueueFull, check_webhook_url
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1/hook",
+    "http://localhost:8000/hook",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://10.0.0.5/hook",
+    "http://192.168.1.10/hook",
+    "http://[::1]/hook",
+    "http://[::ffff:127.0.0.1]/hook",
+    "http://0.0.0.0/hook",
+])
+def test_private_webhook_hosts_are_rejected(url):
+    assert asyncio.run(check_webhook_url(url)) == "callback_url must resolve to a public address"
+
+
+@pytest.mark.parametrize("url", ["ftp://example.com/hook", "http:///hook", "not a url"])
+def test_non_http_webhooks_are_rejected(url):
+    assert asyncio.run(check_webhook_url(url)) == "callback_url must be an http(s) URL"
+
+
+def test_public_webhook_host_is_accepted():
+    assert asyncio.run(check_webhook_url("https://93.184.216.34/hook")) is None
+
+
+def test_allow_list_replaces_address_check(monkeypatch):
+    monkeypatch.setattr(job_service, "WEBHOOK_ALLOWED_HOSTS", {"hooks.internal"})
+    assert asyncio.run(check_webhook_url("http://HOOKS.internal:9000/done")) is None
+    assert asyncio.run(check_webhook_url("https://93.184.216.34/hook")) == "callback_url host is not allowed"
+
+
+def test_wait_drops_its_event():
+    queue = JobQueue(JobStore(""), workers=1, max_pending=10, max_attempts=1)
+    job_id = queue.store.create("analyze", {})
+    assert asyncio.run(queue.wait(job_id, 0.05)).status == "queued"
+    assert queue._done == {} and queue._waiters == {}
+
+
+def test_waiter_timing_out_does_not_strand_other_waiters(monkeypatch):
+    async def run_job(self, row):
+        await asyncio.sleep(0.3)
+        await asyncio.to_thread(self.store.finish, row["id"], None, "done", {})
+
+    monkeypatch.setattr(JobQueue, "_run", run_job)
+    queue = JobQueue(JobStore(""), workers=1, max_pending=10, max_attempts=1)
+
+    async def run():
+        await queue.start()
+        job = await queue.submit_analysis(UserProfileInput(), "공모전", {})
+        started = time.monotonic()
+        short, long = await asyncio.gather(queue.wait(job.id, 0.05), queue.wait(job.id, 5))
+        elapsed = time.monotonic() - started
+        await queue.stop()
+        return short, long, elapsed
+
+    short, long, elapsed = asyncio.run(run())
+    assert short.status in ("queued", "running")
+    assert long.status == "failed" and long.error == "done"
+    # Woken by the worker, not by the 1s store poll
+    assert elapsed < 0.8
+    assert queue._done == {} and queue._waiters == {}
+
+
+def test_full_queue_is_rejected():
+    queue = JobQueue(JobStore(""), workers=1, max_pending=1, max_attempts=1)
+
+    async def run():
+        queue._queue = asyncio.Queue()
+        await queue.submit_analysis(UserProfileInput(), "a", {})
+        with pytest.raises(QueueFull):
+            await queue.submit_analysis(UserProfileInput(), "b", {})
+
+    asyncio.run(run())
@@ -0,0 +1,22 @@
+import pytest
+
+from constants import PROMPT_CACHE_MIN_TOKENS
+from schemas import UserProfileInput
+from services import gpt_service
+
+
+@pytest.mark.parametrize("kind", ["analyze", "digest", "score", "narrative", "batch", "extract"])
+def test_static_prefix_is_cacheable(kind):
+    assert gpt_service._STATIC_PREFIX_TOKENS[kind] >= PROMPT_CACHE_MIN_TOKENS
+
+
+def test_static_prefix_is_shared_across_requests():
+    digest = {"contestInfo": {"title": "공모전"}}
+    first = gpt_service.build_scoring_messages("narrative", UserProfileInput(major="A"), digest)
+    second = gpt_service.build_scoring_messages("narrative", UserProfileInput(major="B"), {"other": 1})
+    assert first[0] is second[0]
+    assert first[0]["content"] == gpt_service.SYSTEM_PROMPT_NARRATIVE
+
+    posters = [gpt_service.build_extract_messages(image, "image/png") for image in ("aaaa", "bbbb")]
+    assert posters[0][0] is posters[1][0]
+    assert posters[0][1]["content"][0] == posters[1][1]["content"][0]
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+from openai import RateLimitError
+
+from services import gpt_service
+from services.hedge_service import HedgePolicy
+from services.rate_limit_service import RateLimiter
+
+
+def rate_limit_error(headers=None) -> RateLimitError:
+    response = httpx.Response(429, headers=headers, request=httpx.Request("POST", "http://upstream/v1"))
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+class FlakyCompletions:
+    """Fails with 429 (no rate-limit headers) `failures` times, then answers"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.started = []
+
+    async def create(self, **kwargs):
+        self.started.append(time.monotonic())
+        if len(self.started) <= self.failures:
+            raise rate_limit_error()
+        message = SimpleNamespace(content='{"ok": true}')
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+def test_disabled_limiter_still_honours_429_pause():
+    limiter = RateLimiter(0, 0)
+    assert not limiter.enabled
+
+    async def run():
+        assert limiter.throttle(None, 0.2) == 0.2
+        started = time.monotonic()
+        await limiter.acquire(100)
+        return time.monotonic() - started
+
+    assert asyncio.run(run()) >= 0.19
+
+
+def test_retry_after_header_sets_pause():
+    limiter = RateLimiter(0, 0)
+    assert limiter.throttle({"retry-after-ms": "150"}, 5.0) == 0.15
+
+
+def test_429_without_headers_backs_off_before_retry(monkeypatch):
+    completions = FlakyCompletions(failures=1)
+    monkeypatch.setattr(gpt_service, "_client", SimpleNamespace(chat=SimpleNamespace(completions=completions)))
+    monkeypatch.setattr(gpt_service, "_rate_limiter", RateLimiter(0, 0))
+    monkeypatch.setattr(gpt_service, "_hedge_policy", HedgePolicy(False, 0.95, 1.0, 1.0))
+
+    content = asyncio.run(gpt_service.call_gpt_api([{"role": "user", "content": "hi"}], max_retries=2))
+
+    assert content == '{"ok": true}'
+    assert len(completions.started) == 2
+    # First retry falls back to 2 ** 0 seconds when the 429 carries no reset headers
+    assert completions.started[1] - completions.started[0] >= 0.95
@@ -0,0 +1,84 @@
+import asyncio
+import random
+
+import pytest
+
+from schemas import ReadinessDeltaEvent, SkillInput, UserProfileInput
+from services.gpt_service import calculate_readiness
+from services.readiness_service import ReadinessTracker
+
+PROFILES = [
+    UserProfileInput(),
+    UserProfileInput(skills=[SkillInput(name="python", level=3), SkillInput(name="react", level=2)], hoursPerWeek=20),
+    UserProfileInput(skills=[SkillInput(name="figma", level=5)], hoursPerWeek=5),
+]
+
+
+def expected(profile, has_progress, done, total):
+    progress = {"checklistDone": done, "checklistTotal": total} if has_progress else None
+    return asyncio.run(calculate_readiness(profile, {}, progress))
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_delta_states_match_full_recomputation(seed):
+    rng = random.Random(seed)
+    tracker = ReadinessTracker(10)
+    # Reference model: user -> profile, (user, contest) -> (has_progress, done, total)
+    profiles, contests = {}, {}
+
+    for _ in range(250):
+        user_id = f"u{rng.randrange(4)}"
+        tracked = [key[1] for key in contests if key[0] == user_id]
+        if not tracked or rng.random() < 0.2:
+            contest_id = f"c{rng.randrange(5)}"
+            profile = rng.choice(PROFILES) if user_id not in profiles or rng.random() < 0.3 else None
+            progress = rng.choice([None, {}, {"checklistDone": rng.randint(0, 6), "checklistTotal": rng.randint(0, 8)}])
+            tracker.track(user_id, contest_id, profile, progress)
+            if profile is not None:
+                profiles[user_id] = profile
+            contests[user_id, contest_id] = (
+                (True, progress.get("checklistDone", 0), progress.get("checklistTotal", 1)) if progress else (False, 0, 0)
+            )
+        else:
+            events = [
+                ReadinessDeltaEvent(
+                    contestId=rng.choice(tracked), doneDelta=rng.randint(-2, 3), totalDelta=rng.randint(-1, 2)
+                )
+                for _ in range(rng.randint(1, 3))
+            ]
+            tracker.apply(user_id, events)
+            for event in events:
+                if event.doneDelta or event.totalDelta:
+                    _, done, total = contests[user_id, event.contestId]
+                    contests[user_id, event.contestId] = (
+                        True, max(done + event.doneDelta, 0), max(total + event.totalDelta, 0)
+                    )
+
+        for (uid, cid), (has_progress, done, total) in contests.items():
+            state = tracker._users[uid].contests[cid].state
+            assert (state.checklistDone, state.checklistTotal) == (done, total)
+            assert state.data == expected(profiles[uid], has_progress, done, total)
+
+
+def test_counts_stop_at_zero():
+    tracker = ReadinessTracker(10)
+    tracker.track("u", "c", PROFILES[1], {"checklistDone": 1, "checklistTotal": 2})
+    state = tracker.apply("u", [ReadinessDeltaEvent(contestId="c", doneDelta=-5, totalDelta=-5)])[0]
+    assert (state.checklistDone, state.checklistTotal) == (0, 0)
+    assert state.data == expected(PROFILES[1], True, 0, 0)
+
+
+def test_invalid_input_changes_nothing():
+    tracker = ReadinessTracker(10)
+    with pytest.raises(ValueError):
+        tracker.track("u", "c", None, None)
+    with pytest.raises(ValueError):
+        tracker.apply("u", [])
+
+    tracker.track("u", "c", PROFILES[0], {"checklistDone": 2, "checklistTotal": 4})
+    with pytest.raises(ValueError):
+        tracker.apply("u", [ReadinessDeltaEvent(contestId="c", doneDelta=1), ReadinessDeltaEvent(contestId="x")])
+    with pytest.raises(ValueError):
+        tracker.track("u", "c", None, {"checklistDone": "3"})
+    state = tracker._users["u"].contests["c"].state
+    assert (state.checklistDone, state.checklistTotal, state.version) == (2, 4, 1)
@@ -0,0 +1,65 @@
+import random
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from benchmarks.schedule import START, random_contests
+from schemas import ScheduleContestInput
+from services.schedule_service import SchedulePlanner, round_preserving_sum
+
+
+def plan(contests, budget=20):
+    planner = SchedulePlanner(budget, START)
+    planner.sync(contests)
+    return planner.data()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_sync_matches_fresh_plan(seed):
+    rng = random.Random(seed)
+    contests = random_contests(rng, 60)
+    planner = SchedulePlanner(20, START)
+    planner.sync(contests)
+
+    for _ in range(10):
+        index = rng.randrange(len(contests))
+        change = rng.random()
+        if change < 0.4:
+            contests[index] = contests[index].model_copy(update={"totalHours": rng.randint(10, 120)})
+        elif change < 0.7:
+            deadline = (START + timedelta(days=rng.randint(3, 330))).isoformat()
+            contests[index] = contests[index].model_copy(update={"deadline": deadline})
+        elif change < 0.85:
+            contests.pop(index)
+        else:
+            contests.append(random_contests(rng, 1)[0].model_copy(update={"id": f"new{len(contests)}"}))
+
+        planner.sync(contests)
+        assert planner.data() == plan(contests)
+
+
+def test_week_hours_add_up_to_planned_hours():
+    for contest in plan(random_contests(random.Random(7), 80)).contests:
+        scenario = contest.scenario
+        assert sum(week.hours for week in scenario.weeks) == scenario.totalHours - contest.shortfallHours
+
+
+def test_odd_hours_are_not_lost_to_rounding():
+    deadline = (START + timedelta(days=30)).isoformat()
+    data = plan([ScheduleContestInput(id="c", deadline=deadline, totalHours=10, schedulePressure=20)], budget=40)
+    weeks = data.contests[0].scenario.weeks
+    assert len(weeks) > 1
+    assert sum(week.hours for week in weeks) == 10
+
+
+def test_zero_total_hours_is_kept():
+    data = plan([ScheduleContestInput(id="c", deadline=(START + timedelta(days=30)).isoformat(), totalHours=0)])
+    assert data.contests[0].scenario.totalHours == 0
+    assert data.contests[0].scenario.weeks == []
+
+
+def test_round_preserving_sum():
+    assert round_preserving_sum(np.array([2.5, 2.5, 2.5, 2.5]), 10) == [3, 3, 2, 2]
+    assert round_preserving_sum(np.array([1 / 3] * 3), 1) == [1, 0, 0]
+    assert round_preserving_sum(np.array([]), 0) == []
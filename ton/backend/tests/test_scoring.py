@@ -0,0 +1,67 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from schemas import ContestInfo, SkillInput, UserProfileInput
+from services.ranking_service import CATEGORIES, SCORE_KEYS, ContestMatrix, ProfileMatrix, score_matrix
+from services.scoring_service import compute_score_values, skill_match_score
+
+TODAY = date(2026, 3, 2)
+SKILLS = ["Python", "React", "Figma", "SQL", "PyTorch", "마케팅", "Java", "pandas", "C++", "Node.js",
+          "Go", "C", "Docker", "Tailwind", "R", "데이터 분석"]
+
+
+def profile(*skills, **fields) -> UserProfileInput:
+    return UserProfileInput(skills=[SkillInput(name=name, level=3) for name in skills], **fields)
+
+
+@pytest.mark.parametrize("skills, text, category", [
+    (["React", "Docker"], "데이터 분석 공모전", "데이터"),
+    (["Go"], "google 후원 공모전", "일반"),
+    (["C"], "google cloud 활용", "일반"),
+    (["Tailwind"], "", "AI/ML"),
+    (["R"], "", "데이터"),
+])
+def test_substrings_are_not_relevant(skills, text, category):
+    _, relevant = skill_match_score([(name, 3) for name in skills], text.lower(), category)
+    assert relevant == 0
+
+
+@pytest.mark.parametrize("skill, text, category", [
+    ("Python", "", "데이터"),
+    ("Go", "go 언어로 구현", "일반"),
+    ("C++", "c++ 사용 가능자", "일반"),
+    ("Node.js", "node 서버", "일반"),
+    ("데이터 분석", "", "데이터"),
+])
+def test_tokens_and_keywords_are_relevant(skill, text, category):
+    _, relevant = skill_match_score([(skill, 3)], text.lower(), category)
+    assert relevant == 1
+
+
+def random_contest(rng: random.Random, i: int) -> ContestInfo:
+    return ContestInfo(
+        title=f"{rng.choice(['AI', '웹', '데이터', 'Google', 'Docker 활용'])} 공모전 {i}",
+        category=rng.choice(CATEGORIES + ["기타"]),
+        deadline=(TODAY + timedelta(days=rng.randint(-5, 120))).isoformat() if rng.random() < 0.9 else None,
+        teamSize=rng.choice(["1-3명", "개인", "최대 4명", "팀", None]),
+        requirements=[f"{rng.choice(SKILLS)} 활용" for _ in range(rng.randint(0, 4))],
+        prizes=["상금"] * rng.randint(0, 4),
+    )
+
+
+def test_matrix_matches_scalar_scores():
+    rng = random.Random(7)
+    contests = [random_contest(rng, i) for i in range(200)]
+    profiles = [profile(*rng.sample(SKILLS, rng.randint(0, 5)), hoursPerWeek=rng.choice([None, 5, 20]),
+                        preferredTeamSize=rng.choice([None, "solo", "small", "large"]))
+                for _ in range(30)]
+    profiles.append(profile("React", "Docker"))
+    profiles.append(profile("Go", "C", "Tailwind"))
+
+    scores = score_matrix(ProfileMatrix(profiles), ContestMatrix(contests, TODAY))
+    for p, user in enumerate(profiles):
+        for c, contest in enumerate(contests):
+            expected = compute_score_values(user, contest, today=TODAY)
+            assert {key: int(scores[key][p, c]) for key in SCORE_KEYS} == expected
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from benchmarks.structured_output import legacy_build, legacy_parse, sample_response
+from schemas import SkillInput, UserProfileInput
+from services import gpt_service
+
+PROFILE = UserProfileInput(major="컴퓨터공학", skills=[SkillInput(name="python", level=3)], hoursPerWeek=15)
+BASE = sample_response()
+BODY = json.dumps(BASE, ensure_ascii=False, indent=2)
+
+
+@pytest.mark.parametrize("text", [
+    BODY,
+    f"분석 결과입니다.\n```json\n{BODY}\n```",
+    f"다음은 분석 결과입니다: {BODY} 참고하세요.",
+    '```json\n{"a": 1}\n``` 그리고 {"b": 2}',
+    '{"nested": {"list": [1, 2, {"k": "}"}]}}',
+])
+def test_parse_matches_legacy(text):
+    assert gpt_service.parse_gpt_response(text) == legacy_parse(text)
+
+
+@pytest.mark.parametrize("text", ["", "no json here", "{broken"])
+def test_unparseable_responses_raise(text):
+    with pytest.raises(ValueError):
+        legacy_parse(text)
+    with pytest.raises(ValueError):
+        gpt_service.parse_gpt_response(text)
+
+
+@pytest.mark.parametrize("data", [
+    BASE,
+    {},
+    {"contestInfo": {"title": "제목만 있는 공모전"}},
+    {key: value for key, value in BASE.items() if key != "scenario"},
+    {key: value for key, value in BASE.items() if key != "digest"},
+    {**BASE, "hiddenExpectations": [], "dealBreakers": [], "checklist": []},
+], ids=["full", "empty", "title-only", "no-scenario", "no-digest", "empty-lists"])
+@pytest.mark.parametrize("options", [{"generateChecklist": True}, {}, None])
+@pytest.mark.parametrize("contest_text", ["공모전 본문", ""])
+def test_build_matches_legacy(data, options, contest_text):
+    expected = legacy_build(data, PROFILE, contest_text, options).model_dump()
+    assert gpt_service.build_analysis_data(data, PROFILE, contest_text, options).model_dump() == expected
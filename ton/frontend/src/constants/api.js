@@ -27,6 +27,7 @@ export const API_CONFIG = {
 export const API_ENDPOINTS = {
   HEALTH: '/health',
   ANALYZE: '/analyze',
+  ANALYZE_STREAM: '/analyze/stream',
   EXTRACT: '/extract',
   ASSISTANT_SUGGEST: '/assistant/suggest',
   READINESS: '/readiness'
@@ -111,6 +111,83 @@ export async function analyzeContest({ userProfile, contest, options = {} }) {
   }
 }
 
+/**
+ * Analyze a contest with streamed sections (server-sent events)
+ * @param {Object} params - Same as analyzeContest
+ * @param {Function} params.onSection - Called with (name, data) for each completed section
+ *   (contestInfo, strategicVerdict, scores, checklist, scenario)
+ * @returns {Promise<Object>} Final response, same shape as analyzeContest
+ */
+export async function analyzeContestStream({ userProfile, contest, options = {}, onSection }) {
+  const formData = new FormData()
+  const { controller, timeoutId } = createTimeoutController(API_CONFIG.ANALYSIS_TIMEOUT_MS)
+  
+  formData.append('user_profile', JSON.stringify(userProfile || {}))
+  formData.append('contest_text', contest.text || '')
+  
+  if (contest.image) {
+    formData.append('contest_image', contest.image)
+  }
+  
+  formData.append('options', JSON.stringify(options))
+  
+  try {
+    const response = await fetch(`${API_CONFIG.BASE_URL}${API_ENDPOINTS.ANALYZE_STREAM}`, {
+      method: 'POST',
+      body: formData,
+      signal: controller.signal
+    })
+    
+    // Input errors come back as a plain JSON response
+    if (!response.headers.get('content-type')?.includes('text/event-stream')) {
+      clearTimeout(timeoutId)
+      const data = await response.json()
+      throw new Error(data.error || ERROR_MESSAGES.ANALYSIS_FAILED)
+    }
+    
+    const reader = response.body.getReader()
+    const decoder = new TextDecoder()
+    let buffer = ''
+    let result = null
+    
+    while (true) {
+      const { done, value } = await reader.read()
+      if (done) break
+      
+      buffer += decoder.decode(value, { stream: true })
+      const events = buffer.split('\n\n')
+      buffer = events.pop()
+      
+      for (const raw of events) {
+        const event = raw.match(/^event: (.*)$/m)?.[1]
+        const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || 'null')
+        
+        if (event === 'result' || event === 'error') {
+          result = data
+        } else if (onSection) {
+          onSection(event, data)
+        }
+      }
+    }
+    
+    clearTimeout(timeoutId)
+    
+    if (!result || !result.success) {
+      throw new Error(result?.error || ERROR_MESSAGES.ANALYSIS_FAILED)
+    }
+    
+    return result
+  } catch (error) {
+    clearTimeout(timeoutId)
+    
+    if (error.name === 'AbortError') {
+      throw new Error(ERROR_MESSAGES.ANALYSIS_TIMEOUT)
+    }
+    
+    throw error
+  }
+}
+
 /**
  * Extract info from image only
  */